@@ -0,0 +1,22 @@
+"""키셋 페이지네이션 커서 모듈: GET /jobs의 (created_at, id) 커서 인코딩/디코딩"""
+from fastapi import HTTPException
+from typing import Tuple
+from uuid import UUID
+from datetime import datetime
+import base64
+
+
+def encode_cursor(created_at: datetime, job_id: UUID) -> str:
+    """키셋 커서 인코딩 (created_at|id, URL-safe base64)"""
+    raw = f"{created_at.isoformat()}|{job_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """키셋 커서 디코딩 (잘못된 커서는 400)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, job_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(job_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
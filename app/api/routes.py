@@ -1,34 +1,78 @@
 """API 라우트"""
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Request, status, BackgroundTasks
-from fastapi.responses import JSONResponse
-from typing import Optional, List, Union
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Header, HTTPException, Request, status, BackgroundTasks
+from fastapi.responses import StreamingResponse, Response
+from typing import Optional, List, Union, Dict, AsyncIterator
 from uuid import UUID
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
+import json
+import re
+import time
 
 from app.api.auth import verify_api_key
+from app.api.cursor import encode_cursor, decode_cursor
 from app.api.schemas import (
-    OCRResponse, JobResponse, ErrorResponse, JobInfo, StatsResponse, Page, Item, BBox
+    OCRResponse, JobResponse, JobInfo, JobListResponse, StatsResponse,
+    SearchResponse, SearchHit, BBox,
 )
-# run_ocr_task_in_process 임포트
-from app.core.ocr_worker import OCRWorker, run_ocr_task_in_process
+from app.core.ocr_worker import OCRWorker, get_pipeline_version
+from app.core.ocr_pool import run_ocr, iter_ocr_pages, get_image_cache_stats
 from app.core.pii import PIIDetector
-from app.core.dao import get_db_session, JobDAO, PageDAO, ItemDAO, SessionLocal
+from app.core.dao import STATS_PERCENTILES
+from app.core.async_dao import (
+    get_async_db_session, AsyncSessionLocal, AsyncJobDAO, AsyncJobPayloadDAO, AsyncPageDAO, AsyncItemDAO,
+)
 from app.core.models import Job
+from app.core.spool import SpooledUpload, UploadTooLargeError, spool_upload
+from app.core.columnar import page_to_dict, pages_to_dicts
+from app.core.serialize import dumps, rows_to_pages
+from app.core.result_cache import ResultBodyCache, make_etag, etag_matches
+from app.core.jobs import resolve_content_type, execute_job, mark_job_failed, store_results
+from app.core.leases import LeaseLostError, get_worker_id, hold_lease
+from app.core.redactor import REDACT_FORMATS, document_filetype, iter_redacted, parse_render_mode
 from app.config.settings import settings
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# 1. 전역 실행기 생성 (max_workers=1로 설정하여 순차 처리 강제)
-# 순차 처리하지만 별도 프로세스이므로 메인 스레드 블로킹 방지 -> health check 가능
-_ocr_executor = ProcessPoolExecutor(max_workers=1)
+# OCR은 상주 프로세스 풀(settings.ocr_workers)에서 실행
+# 별도 프로세스이므로 메인 스레드 블로킹 방지 -> health check 가능
 _pii_detector = PIIDetector()
 
+# 업로드 허용 확장자 (pdf, png, jpeg만 허용)
+ALLOWED_EXTENSIONS = ['.pdf', '.png', '.jpeg', '.jpg']
+
+# 완료된 작업 결과 본문 캐시 (ETag와 함께 보관)
+_result_cache = ResultBodyCache(
+    max_bytes=settings.result_body_cache_mb * 1024 * 1024,
+    ttl=settings.result_body_cache_ttl,
+)
+
+# 결과 응답 캐시 헤더: 결과는 바뀌지 않지만 삭제될 수 있으므로 매번 ETag로 재검증
+RESULT_CACHE_CONTROL = "private, no-cache"
+
+# /stats 집계 캐시: window -> (만료 시각(monotonic), 집계 결과)
+_stats_cache: Dict[Optional[str], tuple] = {}
+
+# /jobs 페이지 크기 상한
+MAX_JOBS_PAGE_SIZE = 1000
+
+# /search 검색 방식 및 결과 수 상한
+SEARCH_MODES = ("text", "substring")
+MAX_SEARCH_RESULTS = 500
+
+# 통계 구간 단위 -> timedelta 인자
+WINDOW_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+# 스트리밍 응답 형식 -> media type
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
 
 # def get_ocr_worker(lang: str = "en") -> OCRWorker:
 #     """OCR 워커 가져오기 (언어별로 워커 풀 관리)"""
@@ -44,7 +88,7 @@ async def process_file(
     lang: Optional[str] = Form("en"),
     async_mode: Optional[str] = Form(None),
     api_key: str = Depends(verify_api_key),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
     """
     파일 OCR 처리
@@ -53,128 +97,92 @@ async def process_file(
     - **lang**: 언어 코드 (en, ko만 지원, 기본값: en)
     - **async_mode**: 비동기 모드 (true인 경우 job_id만 반환)
     """
+    upload: Optional[SpooledUpload] = None
+    handed_off = False  # 임시 파일 정리 책임이 백그라운드 작업으로 넘어갔는지 여부
     try:
-        # 파일 검증
-        if not file.filename:
-            raise HTTPException(status_code=400, detail="파일이 필요합니다")
+        # 파일/언어 검증
+        lang = validate_upload(file, lang)
         
-        # 파일 확장자 검증 (pdf, png, jpeg만 허용)
-        filename_lower = file.filename.lower()
-        allowed_extensions = ['.pdf', '.png', '.jpeg', '.jpg']
-        if not any(filename_lower.endswith(ext) for ext in allowed_extensions):
-            raise HTTPException(
-                status_code=400,
-                detail="지원하지 않는 파일 형식입니다. PDF, PNG, JPEG만 업로드 가능합니다"
-            )
+        # 비동기 모드 (async_mode가 "true" 문자열이면 활성화)
+        is_async = async_mode and async_mode.lower() == "true"
         
-        # 언어 검증 (en, ko만 허용, 기본값 en)
-        if not lang:
-            lang = "en"
-        lang = lang.lower()
-        if lang not in ["en", "ko"]:
-            raise HTTPException(
-                status_code=400,
-                detail="지원하지 않는 언어입니다. 'en' 또는 'ko'만 사용 가능합니다"
-            )
+        # 입장 제어: 큐가 가득 차면 업로드를 읽기 전에 거절
+        if is_async:
+            await check_queue_capacity(db)
         
-        # 파일 크기 확인
-        file_bytes = await file.read()
-        file_size_mb = len(file_bytes) / (1024 * 1024)
-        if file_size_mb > settings.max_file_size_mb:
-            raise HTTPException(
-                status_code=400,
-                detail=f"파일 크기는 {settings.max_file_size_mb}MB 이하여야 합니다"
-            )
+        # 임시 파일로 스풀 (파일 크기 확인, 워커에는 경로만 전달)
+        upload = await read_upload(file)
+        
+        # 결과 캐시 키 (파일 내용 + 언어 + 파이프라인 버전)
+        content_hash = upload.sha256
+        pipeline_version = get_pipeline_version()
         
         # 작업 생성
-        job = JobDAO.create(
+        job = await AsyncJobDAO.create(
             db=db,
             api_key=api_key,
             filename=file.filename,
             content_type=file.content_type,
             lang=lang,
+            content_hash=content_hash,
+            pipeline_version=pipeline_version,
         )
         job_id = job.id
         
-        # 비동기 모드 (async_mode가 "true" 문자열이면 활성화)
-        is_async = async_mode and async_mode.lower() == "true"
+        # 결과 캐시: 동일 키로 완료된 작업이 있으면 워커 호출 없이 결과 복사
+        if settings.result_cache_enabled:
+            cached_job = await AsyncJobDAO.find_cached(db, content_hash, lang, pipeline_version)
+            if cached_job:
+                logger.info(f"결과 캐시 적중: {job_id} <- {cached_job.id}")
+                await AsyncPageDAO.copy_from_job(db, cached_job, job)
+                await AsyncJobDAO.update_status(db, job_id, "done", page_count=cached_job.page_count)
+                await db.commit()
+                
+                if is_async:
+                    return JobResponse(job_id=str(job_id), status="done", cache_hit=True)
+                return json_response({"pages": await load_result_pages(db, job), "cache_hit": True})
+        
         if is_async:
-            # 작업 생성 커밋만 수행 (최소한의 DB 작업)
-            db.commit()
-            
-            # 백그라운드 작업: OCR 처리
-            background_tasks.add_task(process_job_async, job_id, file_bytes, lang)
+            if settings.ocr_queue_backend == "db":
+                # DB 큐: 입력 파일을 작업과 함께 청크 단위로 저장하고 워커(ocr-cli worker)가 가져감
+                await AsyncJobPayloadDAO.create_from_file(db, job, upload.path)
+                await db.commit()
+            else:
+                # 작업 생성 커밋만 수행 (최소한의 DB 작업)
+                await db.commit()
+                
+                # 백그라운드 작업: OCR 처리
+                background_tasks.add_task(process_job_async, job_id, upload, lang)
+                handed_off = True
             
             # 즉시 반환 (작업 생성 후 바로 응답)
             return JobResponse(job_id=str(job_id), status="queued")
         
         # 동기 모드: 즉시 처리
         try:
-            JobDAO.update_status(db, job_id, "processing")
-            db.commit()
-            
-            # 파일 확장자로 타입 확인 (pdf, png, jpeg만 허용)
-            filename = file.filename.lower() if file.filename else ""
-            content_type = file.content_type
+            await AsyncJobDAO.acquire_lease(db, job_id, get_worker_id(), settings.ocr_lease_seconds)
+            await db.commit()
             
-            # content_type 보정
-            if filename.endswith('.pdf'):
-                content_type = "application/pdf"
-            elif filename.endswith(('.png', '.jpg', '.jpeg')):
-                content_type = "image/png"
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail="지원하지 않는 파일 형식입니다. PDF, PNG, JPEG만 업로드 가능합니다"
-                )
-
-            # OCR 처리 (순차적이지만 별도 프로세스에서 실행)
-            loop = asyncio.get_running_loop()
-            results = await loop.run_in_executor(
-                _ocr_executor,
-                run_ocr_task_in_process,
-                file_bytes,
-                lang,
-                content_type
-            )
+            # 파일 확장자로 타입 확인 (content_type 보정)
+            content_type = resolve_content_type(file.filename)
+
+            # OCR 처리 (상주 워커 프로세스에서 실행, PDF는 페이지 병렬)
+            async with hold_lease(job_id):
+                results = await run_ocr(upload.path, lang, content_type)
             
             # PII 탐지 및 마스킹은 worker 내부에서 수행됨
             
-            # DB 저장
-            save_results_to_db(db, job_id, results)
-            
-            # 작업 완료
-            JobDAO.update_status(db, job_id, "done", page_count=len(results))
-            db.commit()
+            # DB 저장 및 작업 완료 (COPY는 동기 세션이므로 스레드에서 실행)
+            await asyncio.to_thread(store_results, job_id, job.created_at, results, len(results))
             
-            # 응답 생성
-            response_pages = []
-            for page_result in results:
-                items = [
-                    Item(
-                        text=item['text'],
-                        bbox=BBox(**item['bbox']),
-                        confidence=item['confidence'],
-                        is_sensitive=item['is_sensitive'],
-                        masked_text=item.get('masked_text'),
-                    )
-                    for item in page_result['items']
-                ]
-                response_pages.append(
-                    Page(
-                        page_index=page_result['page_index'],
-                        width=page_result['width'],
-                        height=page_result['height'],
-                        items=items,
-                    )
-                )
-            
-            return OCRResponse(pages=response_pages)
+            # 응답 생성 (컬럼형 결과에서 바로 직렬화, OCRResponse 스키마와 동일 구조)
+            return json_response({"pages": pages_to_dicts(results), "cache_hit": False})
         
         except Exception as e:
             logger.error(f"OCR 처리 중 오류: {e}", exc_info=True)
-            JobDAO.update_status(db, job_id, "failed", error_message=str(e))
-            db.commit()
+            await db.rollback()
+            await AsyncJobDAO.update_status(db, job_id, "failed", error_message=str(e))
+            await db.commit()
             raise HTTPException(status_code=500, detail=f"OCR 처리 중 오류가 발생했습니다: {str(e)}")
     
     except HTTPException:
@@ -182,90 +190,222 @@ async def process_file(
     except Exception as e:
         logger.error(f"요청 처리 중 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="내부 서버 오류")
+    finally:
+        if upload is not None and not handed_off:
+            upload.cleanup()
 
 
-async def process_job_async(job_id: UUID, file_bytes: bytes, lang: str = "en"):
-    """비동기 작업 처리"""
-    db = SessionLocal()
+@router.post("/get/stream")
+async def process_file_stream(
+    file: UploadFile = File(...),
+    lang: Optional[str] = Form("en"),
+    stream_format: Optional[str] = Form("ndjson", alias="format"),
+    api_key: str = Depends(verify_api_key),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    파일 OCR 처리 (페이지 단위 스트리밍)
+    
+    - **file**: 업로드할 파일 (PDF 또는 이미지)
+    - **lang**: 언어 코드 (en, ko만 지원, 기본값: en)
+    - **format**: 스트리밍 형식 (ndjson: 한 줄당 JSON 1개, sse: Server-Sent Events)
+    
+    이벤트 순서: job -> page (페이지마다, page_index 순) -> done 또는 error
+    """
+    stream_format = (stream_format or "ndjson").lower()
+    if stream_format not in STREAM_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format은 'ndjson' 또는 'sse'만 사용 가능합니다")
+    
+    lang = validate_upload(file, lang)
+    upload = await read_upload(file)
+    content_type = resolve_content_type(file.filename)
+    
     try:
-        # job에서 lang 정보 가져오기 (혹시 모를 경우를 대비해 기본값 사용)
-        job = JobDAO.get_by_id(db, job_id)
-        if job and job.lang:
-            lang = job.lang
+        content_hash = upload.sha256
+        pipeline_version = get_pipeline_version()
+        job = await AsyncJobDAO.create(
+            db=db,
+            api_key=api_key,
+            filename=file.filename,
+            content_type=file.content_type,
+            lang=lang,
+            content_hash=content_hash,
+            pipeline_version=pipeline_version,
+        )
+        job_id = job.id
         
-        JobDAO.update_status(db, job_id, "processing")
-        db.commit()
+        cached_job = None
+        if settings.result_cache_enabled:
+            cached_job = await AsyncJobDAO.find_cached(db, content_hash, lang, pipeline_version)
         
-        # 파일 확장자로 타입 확인 (pdf, png, jpeg만 허용)
-        filename = job.filename.lower() if job.filename else ""
-        content_type = job.content_type
+        await AsyncJobDAO.acquire_lease(db, job_id, get_worker_id(), settings.ocr_lease_seconds)
+        await db.commit()
+    except Exception:
+        upload.cleanup()
+        raise
+    
+    # 임시 파일은 스트림 종료 시 stream_ocr_job에서 정리
+    return StreamingResponse(
+        stream_ocr_job(job, upload, lang, content_type, stream_format, cached_job),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def stream_ocr_job(
+    job: Job,
+    upload: SpooledUpload,
+    lang: str,
+    content_type: str,
+    stream_format: str,
+    cached_job: Optional[Job] = None,
+) -> AsyncIterator[str]:
+    """
+    스트리밍 작업 처리: 워커가 끝낸 페이지를 즉시 DB에 저장하고 이벤트로 전송
+    
+    응답 스트림이 요청 세션보다 오래 살아 있으므로 별도 세션을 사용함.
+    (job/cached_job은 요청 세션에서 읽은 분리된 객체로, id/created_at만 사용)
+    페이지 결과 저장(COPY)은 동기 세션이므로 스레드에서 실행함.
+    """
+    job_id = job.id
+    db = AsyncSessionLocal()
+    page_count = 0
+    try:
+        yield format_stream_event(stream_format, "job", {"job_id": str(job_id)})
         
-        if filename.endswith('.pdf'):
-             content_type = "application/pdf"
-        elif filename.endswith(('.png', '.jpg', '.jpeg')):
-             content_type = "image/png"
+        if cached_job:
+            # 결과 캐시 적중: 워커 호출 없이 이전 결과 전송
+            logger.info(f"결과 캐시 적중: {job_id} <- {cached_job.id}")
+            await AsyncPageDAO.copy_from_job(db, cached_job, job)
+            await db.commit()
+            for page in await load_result_pages(db, job):
+                page_count += 1
+                yield format_stream_event(stream_format, "page", page)
         else:
-             # 지원하지 않는 파일 형식
-             raise ValueError(f"지원하지 않는 파일 형식입니다: {filename}")
-
-        # OCR 처리 (순차적 실행)
-        loop = asyncio.get_running_loop()
-        results = await loop.run_in_executor(
-            _ocr_executor,
-            run_ocr_task_in_process,
-            file_bytes,
-            lang,
-            content_type
-        )
-        
-        # DB 저장
-        save_results_to_db(db, job_id, results)
+            async with hold_lease(job_id):
+                async for page_result in iter_ocr_pages(upload.path, lang, content_type):
+                    await asyncio.to_thread(store_results, job_id, job.created_at, [page_result])
+                    page_count += 1
+                    yield format_stream_event(stream_format, "page", page_to_dict(page_result))
         
-        # 작업 완료
-        JobDAO.update_status(db, job_id, "done", page_count=len(results))
-        db.commit()
+        await AsyncJobDAO.update_status(db, job_id, "done", page_count=page_count)
+        await db.commit()
+        yield format_stream_event(stream_format, "done", {
+            "job_id": str(job_id),
+            "page_count": page_count,
+            "cache_hit": cached_job is not None,
+        })
     
+    except (asyncio.CancelledError, GeneratorExit):
+        # 클라이언트 연결 종료: 작업이 processing으로 남지 않도록 실패 처리
+        logger.warning(f"스트리밍 중단: {job_id} ({page_count} 페이지 전송)")
+        await asyncio.shield(mark_stream_failed(job_id, "클라이언트 연결 종료"))
+        raise
     except Exception as e:
-        logger.error(f"비동기 작업 처리 중 오류: {e}", exc_info=True)
-        db.rollback()
+        logger.error(f"스트리밍 작업 처리 중 오류: {e}", exc_info=True)
+        await db.rollback()
         try:
-            JobDAO.update_status(db, job_id, "failed", error_message=str(e))
-            db.commit()
+            await AsyncJobDAO.update_status(db, job_id, "failed", error_message=str(e))
+            await db.commit()
         except Exception:
-            db.rollback()
+            await db.rollback()
+        yield format_stream_event(stream_format, "error", {
+            "job_id": str(job_id),
+            "detail": f"OCR 처리 중 오류가 발생했습니다: {str(e)}",
+        })
     finally:
-        db.close()
+        await db.close()
+        upload.cleanup()
 
 
-def save_results_to_db(db: Session, job_id: UUID, results: List[dict]):
-    """결과를 DB에 저장"""
-    for page_result in results:
-        # 페이지 생성
-        page = PageDAO.create(
-            db=db,
-            job_id=job_id,
-            page_index=page_result['page_index'],
-            width=page_result['width'],
-            height=page_result['height'],
+async def mark_stream_failed(job_id: UUID, error_message: str) -> None:
+    """스트리밍 작업 실패 기록 (취소된 요청 태스크와 무관하게 끝까지 실행되도록 새 세션 사용)"""
+    async with AsyncSessionLocal() as db:
+        await AsyncJobDAO.update_status(db, job_id, "failed", error_message=error_message)
+        await db.commit()
+
+
+def format_stream_event(stream_format: str, event: str, data: Dict) -> str:
+    """스트리밍 이벤트 직렬화 (ndjson: 이벤트당 JSON 한 줄, sse: event/data 블록)"""
+    if stream_format == "sse":
+        return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    return json.dumps({"event": event, **data}, ensure_ascii=False) + "\n"
+
+
+def validate_upload(file: UploadFile, lang: Optional[str]) -> str:
+    """
+    업로드 파일명/언어 검증
+    
+    Returns:
+        정규화된 언어 코드 (en, ko)
+    """
+    # 파일 검증
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="파일이 필요합니다")
+    
+    # 파일 확장자 검증 (pdf, png, jpeg만 허용)
+    filename_lower = file.filename.lower()
+    if not any(filename_lower.endswith(ext) for ext in ALLOWED_EXTENSIONS):
+        raise HTTPException(
+            status_code=400,
+            detail="지원하지 않는 파일 형식입니다. PDF, PNG, JPEG만 업로드 가능합니다"
         )
+    
+    # 언어 검증 (en, ko만 허용, 기본값 en)
+    if not lang:
+        lang = "en"
+    lang = lang.lower()
+    if lang not in ["en", "ko"]:
+        raise HTTPException(
+            status_code=400,
+            detail="지원하지 않는 언어입니다. 'en' 또는 'ko'만 사용 가능합니다"
+        )
+    return lang
+
+
+async def read_upload(file: UploadFile) -> SpooledUpload:
+    """업로드 파일을 임시 파일로 스풀 (최대 크기 검증, 초과 시 즉시 중단)"""
+    try:
+        return await spool_upload(file, max_bytes=settings.max_file_size_mb * 1024 * 1024)
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"파일 크기는 {settings.max_file_size_mb}MB 이하여야 합니다"
+        )
+
+
+async def process_job_async(job_id: UUID, upload: SpooledUpload, lang: str = "en"):
+    """비동기 작업 처리 (local 큐 백엔드, 완료 후 스풀 파일 정리)"""
+    owner = get_worker_id()
+    try:
+        async with AsyncSessionLocal() as db:
+            job = await AsyncJobDAO.acquire_lease(db, job_id, owner, settings.ocr_lease_seconds)
+            await db.commit()
         
-        # 아이템 생성
-        items = []
-        for item in page_result['items']:
-            items.append({
-                'page_id': page.id,
-                'text': item['text'],
-                'x': item['bbox']['x'],
-                'y': item['bbox']['y'],
-                'w': item['bbox']['w'],
-                'h': item['bbox']['h'],
-                'confidence': item['confidence'],
-                'is_sensitive': item['is_sensitive'],
-                'masked_text': item.get('masked_text'),
-            })
-        
-        if items:
-            ItemDAO.create_bulk(db, items)
+        # 결과 저장/commit은 execute_job이 스레드의 짧은 동기 세션으로 수행
+        async with hold_lease(job_id, owner):
+            await execute_job(job, upload.path, lang, owner=owner)
+    
+    except LeaseLostError as e:
+        # 리스가 만료되어 회수된 작업 (이미 실패 처리됨)
+        logger.warning(str(e))
+    except Exception as e:
+        logger.error(f"비동기 작업 처리 중 오류: {e}", exc_info=True)
+        await asyncio.to_thread(mark_job_failed, job_id, e)
+    finally:
+        upload.cleanup()
+
+
+async def check_queue_capacity(db: AsyncSession) -> None:
+    """대기 작업 수가 settings.ocr_max_queue 이상이면 429 (Retry-After 포함)"""
+    queued = await AsyncJobDAO.count_by_status(db, "queued")
+    if queued >= settings.ocr_max_queue:
+        logger.warning(f"작업 큐 포화로 요청 거절: queued={queued}, max={settings.ocr_max_queue}")
+        raise HTTPException(
+            status_code=429,
+            detail="처리 대기 중인 작업이 많습니다. 잠시 후 다시 시도하세요",
+            headers={"Retry-After": str(settings.ocr_queue_retry_after)},
+        )
 
 
 @router.get("/healthz")
@@ -285,58 +425,192 @@ async def get_version():
 
 @router.get("/stats", response_model=StatsResponse)
 async def get_stats(
+    window: Optional[str] = None,
     api_key: str = Depends(verify_api_key),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
-    """통계 정보"""
-    all_jobs = JobDAO.list_jobs(db, limit=10000)
-    
-    total_jobs = len(all_jobs)
-    completed_jobs = len([j for j in all_jobs if j.status == "done"])
-    failed_jobs = len([j for j in all_jobs if j.status == "failed"])
-    processing_jobs = len([j for j in all_jobs if j.status == "processing"])
-    
-    # 평균 처리 시간 계산
-    completed_with_time = [j for j in all_jobs if j.status == "done" and j.completed_at]
-    avg_time = None
-    if completed_with_time:
-        times = [
-            (j.completed_at - j.created_at).total_seconds()
-            for j in completed_with_time
-        ]
-        avg_time = sum(times) / len(times) if times else None
+    """
+    통계 정보
+    
+    - **window**: 최근 집계 구간 (예: 30m, 1h, 24h, 7d, 미지정 시 전체)
+    """
+    since_delta = parse_window(window)
     
+    # 집계 결과는 구간별로 settings.stats_cache_ttl초 동안 재사용
+    now = time.monotonic()
+    cached = _stats_cache.get(window)
+    if cached is not None and cached[0] > now:
+        stats = cached[1]
+    else:
+        since = datetime.utcnow() - since_delta if since_delta else None
+        stats = await AsyncJobDAO.get_stats(db, since=since)
+        if len(_stats_cache) >= 64:
+            _stats_cache.clear()
+        _stats_cache[window] = (now + settings.stats_cache_ttl, stats)
+    
+    counts = stats['counts']
     return StatsResponse(
-        total_jobs=total_jobs,
-        completed_jobs=completed_jobs,
-        failed_jobs=failed_jobs,
-        processing_jobs=processing_jobs,
-        avg_processing_time=avg_time,
+        window=window,
+        total_jobs=sum(counts.values()),
+        completed_jobs=counts.get("done", 0),
+        failed_jobs=counts.get("failed", 0),
+        processing_jobs=counts.get("processing", 0),
+        queued_jobs=counts.get("queued", 0),
+        avg_processing_time=stats['avg_processing_time'],
+        processing_time=percentile_dict(stats['processing_time']),
+        queue_wait=percentile_dict(stats['queue_wait']),
+        image_cache=get_image_cache_stats(),
+        result_cache=_result_cache.stats(),
     )
 
 
-@router.get("/jobs", response_model=List[JobInfo])
+def parse_window(window: Optional[str]) -> Optional[timedelta]:
+    """통계 구간 문자열(숫자 + m/h/d) 파싱"""
+    if not window:
+        return None
+    match = re.fullmatch(r"(\d+)([mhd])", window)
+    if not match or int(match.group(1)) == 0:
+        raise HTTPException(status_code=400, detail="window는 30m, 1h, 24h, 7d 형식이어야 합니다")
+    value = int(match.group(1))
+    return timedelta(**{WINDOW_UNITS[match.group(2)]: value})
+
+
+def percentile_dict(values: Optional[List[Optional[float]]]) -> Optional[Dict[str, float]]:
+    """percentile_cont 배열 결과를 {p50, p95, p99}로 변환 (대상 작업이 없으면 None)"""
+    if not values or values[0] is None:
+        return None
+    return {
+        f"p{int(p * 100)}": float(value)
+        for p, value in zip(STATS_PERCENTILES, values)
+    }
+
+
+@router.get("/jobs", response_model=JobListResponse)
 async def list_jobs(
     limit: int = 100,
     status: Optional[str] = None,
     from_ts: Optional[datetime] = None,
     to_ts: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    api_key: str = Depends(verify_api_key),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    작업 목록 조회 (최신순)
+    
+    - **limit**: 페이지 크기 (1~1000)
+    - **cursor**: 이전 응답의 next_cursor (다음 페이지 조회)
+    """
+    limit = max(1, min(limit, MAX_JOBS_PAGE_SIZE))
+    after = decode_cursor(cursor) if cursor else None
+    
+    # 한 건 더 읽어 다음 페이지 존재 여부 확인
+    jobs = await AsyncJobDAO.list_jobs(
+        db, limit=limit + 1, status=status, from_ts=from_ts, to_ts=to_ts, after=after
+    )
+    next_cursor = None
+    if len(jobs) > limit:
+        jobs = jobs[:limit]
+        next_cursor = encode_cursor(jobs[-1].created_at, jobs[-1].id)
+    
+    return JobListResponse(
+        jobs=[JobInfo(**job.__dict__) for job in jobs],
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search_items(
+    q: str,
+    mode: str = "text",
+    limit: int = 50,
+    from_ts: Optional[datetime] = None,
+    to_ts: Optional[datetime] = None,
     api_key: str = Depends(verify_api_key),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
-    """작업 목록 조회"""
-    jobs = JobDAO.list_jobs(db, limit=limit, status=status, from_ts=from_ts, to_ts=to_ts)
-    return [JobInfo(**job.__dict__) for job in jobs]
+    """
+    추출 텍스트 검색
+    
+    - **q**: 검색어
+    - **mode**: text(단어 단위 전문 검색) 또는 substring(부분 문자열, 차트 번호 등)
+    - **limit**: 최대 결과 수 (1~500)
+    - **from_ts**, **to_ts**: 작업 생성 시각 범위
+    
+    민감정보 아이템은 마스킹 텍스트로만 검색/반환됨.
+    """
+    q = q.strip()
+    if mode not in SEARCH_MODES:
+        raise HTTPException(status_code=400, detail=f"mode는 {', '.join(SEARCH_MODES)} 중 하나여야 합니다")
+    if len(q) < 2:
+        raise HTTPException(status_code=400, detail="검색어는 2자 이상이어야 합니다")
+    limit = max(1, min(limit, MAX_SEARCH_RESULTS))
+    
+    rows = await AsyncItemDAO.search(db, q, mode=mode, limit=limit, from_ts=from_ts, to_ts=to_ts)
+    hits = [
+        SearchHit(
+            job_id=job_id,
+            filename=filename,
+            job_created_at=job_created_at,
+            page_index=page_index,
+            text=text,
+            bbox=BBox(x=x, y=y, w=w, h=h),
+            confidence=confidence,
+            is_sensitive=is_sensitive,
+            rank=rank,
+        )
+        for job_id, filename, job_created_at, page_index, text, x, y, w, h, confidence, is_sensitive, rank in rows
+    ]
+    return SearchResponse(query=q, mode=mode, hits=hits)
+
+
+@router.delete("/jobs/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_job(
+    job_id: UUID,
+    api_key: str = Depends(verify_api_key),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """작업 및 결과 삭제 (처리 중인 작업은 409)"""
+    job = await AsyncJobDAO.get_by_id(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    
+    if job.status == "queued" or job.status == "processing":
+        raise HTTPException(status_code=409, detail="진행 중인 작업은 삭제할 수 없습니다")
+    
+    await AsyncJobDAO.delete(db, job_id, job.created_at)
+    await db.commit()
+    _result_cache.invalidate(job_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get("/result/{job_id}", response_model=OCRResponse)
 async def get_result(
     job_id: UUID,
+    if_none_match: Optional[str] = Header(None),
     api_key: str = Depends(verify_api_key),
-    db: Session = Depends(get_db_session),
+    db: AsyncSession = Depends(get_async_db_session),
 ):
-    """작업 결과 조회 (비동기 모드)"""
-    job = JobDAO.get_by_id(db, job_id)
+    """
+    작업 결과 조회 (비동기 모드)
+    
+    완료된 작업은 강한 ETag를 붙여 반환하고, If-None-Match가 일치하면 304를 반환함.
+    직렬화된 본문은 프로세스 메모리 LRU에 보관하며, 캐시 적중 시 DB를 조회하지 않음.
+    이 프로세스의 삭제(DELETE /jobs)는 즉시 캐시에서 제거하고, 다른 프로세스에서의 삭제나
+    보존 기간 정리는 최대 result_body_cache_ttl초 동안 캐시된 결과가 반환될 수 있음.
+    """
+    cached = _result_cache.get(job_id)
+    if cached is not None:
+        etag, body = cached
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": RESULT_CACHE_CONTROL})
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"ETag": etag, "Cache-Control": RESULT_CACHE_CONTROL},
+        )
+    
+    job = await AsyncJobDAO.get_by_id(db, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
     
@@ -346,29 +620,95 @@ async def get_result(
     if job.status == "failed":
         raise HTTPException(status_code=500, detail=f"작업 실패: {job.error_message}")
     
-    # DB에서 결과 조회
-    pages = PageDAO.get_by_job_id(db, job_id)
-    
-    response_pages = []
-    for page in pages:
-        items = ItemDAO.get_by_page_id(db, page.id)
-        item_schemas = [
-            Item(
-                text=item.text,
-                bbox=BBox(x=item.x, y=item.y, w=item.w, h=item.h),
-                confidence=item.confidence,
-                is_sensitive=item.is_sensitive,
-                masked_text=item.masked_text,
-            )
-            for item in items
-        ]
-        response_pages.append(
-            Page(
-                page_index=page.page_index,
-                width=page.width,
-                height=page.height,
-                items=item_schemas,
-            )
-        )
+    etag = make_etag(job_id, job.completed_at)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": RESULT_CACHE_CONTROL})
+    
+    body = dumps({"pages": await load_result_pages(db, job), "cache_hit": False})
+    _result_cache.put(job_id, etag, body)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": RESULT_CACHE_CONTROL},
+    )
+
+
+@router.post("/result/{job_id}/redact")
+async def redact_result(
+    job_id: UUID,
+    file: UploadFile = File(...),
+    output_format: Optional[str] = Form("pdf", alias="format"),
+    api_key: str = Depends(verify_api_key),
+    db: AsyncSession = Depends(get_async_db_session),
+):
+    """
+    민감정보 가림 문서 다운로드 (완료된 작업)
     
-    return OCRResponse(pages=response_pages)
+    - **file**: 작업에 업로드했던 원본 파일 (서버는 원본을 보관하지 않음, SHA-256으로 확인)
+    - **format**: 출력 형식 (pdf: 가림 처리된 PDF, png: 페이지별 PNG zip)
+    
+    is_sensitive 아이템 bbox에 검은 상자를 그리고 그 아래 텍스트/이미지 픽셀을 삭제함.
+    png는 페이지 단위로 생성과 동시에 전송되며, pdf는 가림 처리 후 임시 파일에서 전송됨.
+    """
+    output_format = (output_format or "pdf").lower()
+    if output_format not in REDACT_FORMATS:
+        raise HTTPException(status_code=400, detail="format은 'pdf' 또는 'png'만 사용 가능합니다")
+    
+    job = await AsyncJobDAO.get_by_id(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    if job.status != "done":
+        raise HTTPException(status_code=409, detail="완료된 작업만 가림 처리할 수 있습니다")
+    if not job.content_hash:
+        # 원본 해시가 없으면 업로드 파일이 작업의 원본인지 확인할 수 없음 (해시 도입 전 작업)
+        raise HTTPException(status_code=409, detail="원본 파일 해시가 없는 작업은 가림 처리할 수 없습니다")
+    
+    validate_upload(file, job.lang)
+    upload = await read_upload(file)
+    try:
+        if upload.sha256 != job.content_hash:
+            raise HTTPException(status_code=400, detail="작업의 원본 파일과 일치하지 않습니다")
+        pages = await load_result_pages(db, job)
+    except Exception:
+        upload.cleanup()
+        raise
+    
+    media_type, extension = REDACT_FORMATS[output_format]
+    # 동기 생성기이므로 StreamingResponse가 스레드 풀에서 페이지 단위로 실행
+    return StreamingResponse(
+        iter_redacted_upload(
+            upload,
+            resolve_content_type(file.filename),
+            pages,
+            output_format,
+            parse_render_mode(job.pipeline_version),
+            document_filetype(file.filename),
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{job_id}_redacted.{extension}"'},
+    )
+
+
+def iter_redacted_upload(
+    upload: SpooledUpload,
+    content_type: Optional[str],
+    pages: List[Dict],
+    output_format: str,
+    render_mode: str,
+    filetype: Optional[str],
+):
+    """가림 처리 결과 전송 후 스풀 파일 정리"""
+    try:
+        yield from iter_redacted(upload.path, content_type, pages, output_format, render_mode, filetype)
+    finally:
+        upload.cleanup()
+
+
+async def load_result_pages(db: AsyncSession, job: Job) -> List[Dict]:
+    """DB에서 작업 결과 페이지 조회 (조인 쿼리 1회, 작업 생성 월 파티션만, Page 스키마 구조의 dict)"""
+    return rows_to_pages(await AsyncPageDAO.fetch_result_rows(db, job.id, job.created_at))
+
+
+def json_response(data: Dict) -> Response:
+    """Pydantic 검증/변환 없이 orjson으로 바로 직렬화한 JSON 응답"""
+    return Response(content=dumps(data), media_type="application/json")
@@ -1,6 +1,6 @@
 """Pydantic 스키마"""
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Dict
 from datetime import datetime
 from uuid import UUID
 
@@ -33,12 +33,14 @@ class Page(BaseModel):
 class OCRResponse(BaseModel):
     """OCR 응답"""
     pages: List[Page] = Field(..., description="페이지별 결과")
+    cache_hit: bool = Field(False, description="이전 작업 결과 재사용 여부")
 
 
 class JobResponse(BaseModel):
     """작업 응답 (비동기 모드)"""
     job_id: str = Field(..., description="작업 ID")
     status: str = Field(..., description="작업 상태")
+    cache_hit: bool = Field(False, description="이전 작업 결과 재사용 여부")
 
 
 class ErrorResponse(BaseModel):
@@ -60,11 +62,43 @@ class JobInfo(BaseModel):
     completed_at: Optional[datetime]
 
 
+class JobListResponse(BaseModel):
+    """작업 목록 응답"""
+    jobs: List[JobInfo] = Field(..., description="작업 목록 (최신순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class SearchHit(BaseModel):
+    """검색 결과 (아이템 단위)"""
+    job_id: UUID
+    filename: str
+    job_created_at: datetime
+    page_index: int
+    text: str = Field(..., description="일치한 텍스트 (민감 아이템은 마스킹 텍스트)")
+    bbox: BBox
+    confidence: float
+    is_sensitive: bool
+    rank: float = Field(..., description="관련도 (text: ts_rank, substring: 트라이그램 유사도)")
+
+
+class SearchResponse(BaseModel):
+    """검색 응답"""
+    query: str
+    mode: str
+    hits: List[SearchHit]
+
+
 class StatsResponse(BaseModel):
     """통계 응답"""
+    window: Optional[str] = None  # 집계 구간 (예: 1h, 24h, None이면 전체)
     total_jobs: int
     completed_jobs: int
     failed_jobs: int
     processing_jobs: int
+    queued_jobs: int = 0
     avg_processing_time: Optional[float] = None
+    processing_time: Optional[Dict[str, float]] = None  # 처리 시간 백분위 (p50, p95, p99, 초)
+    queue_wait: Optional[Dict[str, float]] = None  # 대기 시간 백분위 (p50, p95, p99, 초)
+    image_cache: Optional[Dict[str, int]] = None  # 이미지 OCR 캐시 적중/실패 카운터
+    result_cache: Optional[Dict[str, int]] = None  # 결과 응답 본문 캐시 적중/실패/사용량
 
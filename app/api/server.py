@@ -3,6 +3,7 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
+import asyncio
 import logging
 import time
 import sys  # sys 모듈 추가 필요
@@ -10,6 +11,9 @@ import sys  # sys 모듈 추가 필요
 from app.api.routes import router
 from app.config.settings import settings
 from app.core.dao import init_db
+from app.core.async_dao import async_engine
+from app.core.ocr_pool import warm_up_ocr_pool, shutdown_ocr_pool
+from app.core.leases import run_reaper
 
 # 로깅 설정 (기존 basicConfig 대신 아래 내용으로 교체)
 # Uvicorn이 로거 설정을 가로채는 것을 방지하기 위해 루트 로거를 직접 설정
@@ -128,12 +132,26 @@ async def startup_event():
         logger.info("데이터베이스 초기화 완료")
     except Exception as e:
         logger.error(f"데이터베이스 초기화 실패: {e}", exc_info=True)
+    
+    # OCR 워커 풀 기동 (모델 사전 로드)
+    try:
+        await warm_up_ocr_pool()
+    except Exception as e:
+        logger.error(f"OCR 워커 풀 기동 실패: {e}", exc_info=True)
+    
+    # 만료 리스 회수 (죽은 워커/프로세스가 남긴 processing 작업 정리)
+    app.state.reaper_task = asyncio.create_task(run_reaper())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """종료 시 실행"""
     logger.info(f"{settings.app_name} 종료")
+    reaper_task = getattr(app.state, "reaper_task", None)
+    if reaper_task is not None:
+        reaper_task.cancel()
+    await async_engine.dispose()
+    shutdown_ocr_pool()
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ import time
 import json
 import logging
 import mimetypes
+import asyncio
 
 from app.core.ocr_worker import OCRWorker
 from app.core.pii import PIIDetector
@@ -46,33 +47,34 @@ def run(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="출력 파일 경로 (JSON)"),
     lang: str = typer.Option("ko", "--lang", help="OCR 언어 (기본값: ko)"),
     pii: bool = typer.Option(True, "--pii", "--no-pii", help="PII(개인정보) 마스킹 수행 여부"),
+    redact: Optional[Path] = typer.Option(None, "--redact", help="민감정보 가림 문서 출력 경로 (.pdf, .zip: 페이지별 PNG)"),
 ):
     """로컬에서 파일 OCR 및 PII 처리"""
     if not file.exists():
         typer.echo(f"파일을 찾을 수 없습니다: {file}", err=True)
         raise typer.Exit(1)
     
+    if redact and not pii:
+        typer.echo("--redact는 PII 탐지가 필요합니다 (--no-pii와 함께 사용할 수 없음)", err=True)
+        raise typer.Exit(1)
+    
     content_type = get_content_type(file)
     typer.echo(f"파일 처리 중: {file} (Type: {content_type}, Lang: {lang})")
     
     try:
-        # 1. 파일 읽기
-        with open(file, "rb") as f:
-            file_bytes = f.read()
-        
-        # 2. OCR 처리
+        # 1. OCR 처리 (파일 경로를 그대로 전달, PDF는 파일에서 직접 읽음)
         ocr_worker = OCRWorker(lang=lang)
         # process_file은 페이지별 결과 리스트를 반환함
-        results = ocr_worker.process_file(file_bytes, content_type=content_type)
+        results = ocr_worker.process_file(str(file), content_type=content_type)
         
-        # 3. PII 탐지 및 마스킹 (옵션)
+        # 2. PII 탐지 및 마스킹 (옵션)
         if pii:
             typer.echo("PII 탐지 및 마스킹 수행 중...")
             pii_detector = PIIDetector()
             for page_result in results:
                 page_result['items'] = pii_detector.detect_and_mask(page_result['items'])
         
-        # 4. 결과 정리 (JSON 직렬화를 위해 필요한 필드만 추출)
+        # 3. 결과 정리 (JSON 직렬화를 위해 필요한 필드만 추출)
         output_data = {
             "meta": {
                 "filename": file.name,
@@ -101,7 +103,7 @@ def run(
             ]
         }
         
-        # 5. 출력
+        # 4. 출력
         if output:
             with open(output, "w", encoding="utf-8") as f:
                 json.dump(output_data, f, ensure_ascii=False, indent=2)
@@ -109,6 +111,19 @@ def run(
         else:
             print(json.dumps(output_data, ensure_ascii=False, indent=2))
         
+        # 5. 가림 처리 문서 (페이지 단위로 파일에 기록)
+        if redact:
+            from app.core.redactor import document_filetype, iter_redacted
+            
+            output_format = "png" if redact.suffix.lower() == ".zip" else "pdf"
+            with open(redact, "wb") as f:
+                for chunk in iter_redacted(
+                    str(file), content_type, results, output_format, settings.ocr_render_mode,
+                    document_filetype(file.name),
+                ):
+                    f.write(chunk)
+            typer.echo(f"가림 처리 문서 저장 완료: {redact}")
+        
     except Exception as e:
         typer.echo(f"오류 발생: {e}", err=True)
         logger.exception("처리 중 상세 오류")
@@ -133,6 +148,48 @@ def server(
     )
 
 
+@app.command()
+def worker(
+    concurrency: Optional[int] = typer.Option(None, "--concurrency", "-c", help="동시 처리 작업 수 (기본값: OCR_WORKERS)"),
+    poll_interval: Optional[float] = typer.Option(None, "--poll-interval", help="빈 큐 폴링 간격(초)"),
+):
+    """DB 큐 워커 실행 (OCR_QUEUE_BACKEND=db)"""
+    from app.core.queue_worker import run_queue_worker
+    
+    if settings.ocr_queue_backend != "db":
+        typer.echo("경고: OCR_QUEUE_BACKEND가 db가 아니므로 API 서버가 작업을 큐에 넣지 않습니다.", err=True)
+    
+    typer.echo("DB 큐 워커 시작...")
+    try:
+        asyncio.run(run_queue_worker(concurrency=concurrency, poll_interval=poll_interval))
+    except KeyboardInterrupt:
+        typer.echo("워커 종료.")
+
+
+@app.command()
+def retention(
+    months: int = typer.Option(settings.retention_months, "--months", "-m", help="보존 개월 수 (이번 달 포함)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="삭제하지 않고 대상 파티션만 출력"),
+):
+    """보존 기간이 지난 월 파티션 삭제 및 다음 달 파티션 미리 생성 (cron 등으로 주기 실행)"""
+    from app.core.dao import engine
+    from app.core.partitions import ensure_partitions, drop_expired_partitions
+    
+    try:
+        with engine.begin() as conn:
+            if not dry_run:
+                created = ensure_partitions(conn, settings.partition_months_ahead)
+                if created:
+                    typer.echo(f"파티션 생성: {', '.join(created)}")
+            dropped = drop_expired_partitions(conn, months, dry_run=dry_run)
+        
+        label = "삭제 대상" if dry_run else "삭제 완료"
+        typer.echo(f"{label}: {', '.join(dropped) if dropped else '없음'}")
+    except Exception as e:
+        typer.echo(f"오류 발생: {e}", err=True)
+        raise typer.Exit(1)
+
+
 @app.command()
 def migrate():
     """데이터베이스 초기화 및 마이그레이션"""
@@ -12,23 +12,57 @@ class Settings(BaseSettings):
     
     # 데이터베이스
     database_url: str
+    async_database_url: Optional[str] = None  # 요청 핸들러용 비동기 연결 URL (미지정 시 database_url을 postgresql+asyncpg로 변환)
     db_pool_size: int = 10
     db_max_overflow: int = 20
     
     # OCR 설정
     ocr_workers: int = 2  # 4 vCore 환경 최적화 (기본값 4 -> 2)
-    ocr_max_queue: int = 30  # 30페이지 처리 목표에 맞춤
+    ocr_max_queue: int = 30  # 30페이지 처리 목표에 맞춤 (대기 작업 수가 이 값 이상이면 비동기 요청 429)
+    ocr_queue_backend: str = "local"  # local: API 프로세스 백그라운드 작업, db: DB 큐 + 별도 워커(ocr-cli worker)
+    ocr_queue_poll_interval: float = 1.0  # DB 큐 워커의 빈 큐 폴링 간격 (초)
+    ocr_queue_retry_after: int = 10  # 큐 포화 시 Retry-After 헤더 값 (초)
+    ocr_lease_seconds: int = 120  # 처리 중 작업 리스 길이 (하트비트가 끊기고 이 시간이 지나면 회수)
+    ocr_heartbeat_interval: float = 30.0  # 리스 연장 주기 (초, ocr_lease_seconds보다 충분히 짧게)
+    ocr_reaper_interval: float = 30.0  # 만료 리스 회수 주기 (초)
+    ocr_max_attempts: int = 3  # 작업 최대 시도 횟수 (초과 시 재대기 대신 실패 처리)
     ocr_dpi: int = 300
     ocr_model_dir: str = "/app/models"
     paddleocr_home: str = "/root/.paddleocr"
     
     # 성능 최적화 설정
     ocr_parallel_pages: int = 2  # 페이지 병렬 처리 수 (CPU 코어 절반)
-    ocr_max_image_size: int = 4096  # 이미지 최대 크기 제한
+    ocr_max_image_size: int = 4096  # 이미지 최대 크기 제한 (긴 변 기준, 초과 시 축소 디코딩)
+    ocr_jpeg_draft: bool = True  # JPEG 축소 시 draft 모드(DCT 스케일링) 디코딩 사용
     ocr_enable_ppstructure: bool = False  # 표 인식 비활성화 (필요 시 true)
+    ocr_render_mode: str = "embedded"  # embedded: 임베딩 이미지 OCR, scanned: 이미지 페이지 전체 렌더링 OCR
+    ocr_stream_chunk_pages: int = 1  # 스트리밍 응답 시 워커 작업 1건당 페이지 수
+    ocr_image_cache_size: int = 1024  # 이미지 OCR 결과 메모리 LRU 항목 수 (0이면 비활성화)
+    ocr_image_cache_dir: Optional[str] = None  # 이미지 OCR 결과 디스크 캐시 경로 (None이면 비활성화)
+    ocr_image_cache_disk_mb: int = 512  # 디스크 캐시 최대 크기
+    ocr_det_batch_size: int = 8  # predict 1회 호출당 이미지 수 (문서 내 이미지 배치)
+    ocr_rec_batch_size: int = 16  # 인식기 텍스트 라인 배치 크기
+    
+    # 결과 캐시 (동일 파일/언어/파이프라인 버전 재업로드 시 OCR 생략)
+    result_cache_enabled: bool = True
+    result_body_cache_mb: int = 64  # /result 응답 본문 메모리 LRU 크기 (프로세스별, 0이면 비활성화)
+    result_body_cache_ttl: int = 300  # 응답 본문 캐시 유효 시간 (초, 다른 프로세스에서 삭제된 작업도 이 시간 동안은 캐시에서 반환될 수 있음)
+    
+    # 데이터 보존 (jobs/pages/items 월별 파티션)
+    partition_months_ahead: int = 3  # 미리 만들어 둘 미래 월 파티션 수
+    partition_check_interval: float = 3600.0  # 미래 월 파티션 확인 주기 (초, 만료 리스 회수 루프에서 실행)
+    retention_months: int = 12  # 보존 개월 수 (이번 달 포함, ocr-cli retention으로 이전 파티션 삭제)
+    
+    # 통계
+    stats_cache_ttl: int = 10  # /stats 집계 결과 캐시 시간 (초)
+    
+    # PII 탐지
+    pii_rules: str = "rrn"  # 활성 규칙 (쉼표 구분, 기본 제공: rrn, phone, health_insurance, chart_id, address; 기본값은 기존과 같은 주민번호만)
+    pii_rules_file: Optional[str] = None  # 추가/교체 규칙 JSON 파일 (app.core.pii_rules.rule_from_config 형식)
     
     # 파일 설정
     max_file_size_mb: int = 10
+    temp_dir: str = "/tmp/mediview"  # 업로드 스풀 디렉토리 (워커에는 경로만 전달)
     
     # 서버 설정
     host: str = "0.0.0.0"
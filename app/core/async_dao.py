@@ -0,0 +1,246 @@
+"""비동기 데이터베이스 접근 레이어 (API 요청 핸들러용, asyncpg)
+
+요청 핸들러는 이벤트 루프에서 실행되므로 동기 세션으로 DB를 왕복하면 그동안 루프 전체가
+멈춤 (헬스 체크/업로드 지연). 요청 경로의 조회/상태 변경은 이 모듈의 비동기 DAO를 사용하고,
+SQL은 app.core.dao의 쿼리 빌더를 그대로 공유함.
+COPY 기반 결과 저장(PageDAO.copy_results)은 psycopg2 원시 커서가 필요하므로
+동기 세션으로 스레드에서 실행함 (app.core.jobs.store_results).
+"""
+from sqlalchemy import select, func, delete, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from typing import AsyncGenerator, Optional, List, Tuple, Dict
+from uuid import UUID
+from datetime import datetime, timedelta
+
+from app.core.models import Job, JobPayload
+from app.core.dao import (
+    db_utcnow,
+    PAYLOAD_CHUNK_SIZE,
+    COPY_JOB_RESULTS_SQL,
+    copy_job_results_params,
+    payload_row,
+    find_cached_statement,
+    stats_count_statement,
+    stats_timing_statement,
+    stats_result,
+    list_jobs_statement,
+    result_rows_statement,
+    search_statement,
+)
+from app.config.settings import settings
+
+
+def get_async_database_url() -> str:
+    """비동기 연결 URL (미지정 시 database_url의 드라이버를 asyncpg로 교체)"""
+    if settings.async_database_url:
+        return settings.async_database_url
+    return make_url(settings.database_url).set(drivername="postgresql+asyncpg").render_as_string(
+        hide_password=False
+    )
+
+
+# 비동기 엔진 생성 (동기 엔진과 별도 풀)
+async_engine = create_async_engine(
+    get_async_database_url(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    echo=False,
+)
+
+# 세션 팩토리 (commit 후에도 로드된 속성을 지연 로드 없이 읽을 수 있도록 만료하지 않음)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency용 비동기 데이터베이스 세션"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+class AsyncJobDAO:
+    """작업 DAO (비동기)"""
+
+    @staticmethod
+    async def create(
+        db: AsyncSession,
+        api_key: str,
+        filename: str,
+        content_type: Optional[str] = None,
+        lang: str = "ko",
+        content_hash: Optional[str] = None,
+        pipeline_version: Optional[str] = None,
+    ) -> Job:
+        """작업 생성"""
+        job = Job(
+            api_key=api_key,
+            filename=filename,
+            content_type=content_type,
+            lang=lang,
+            content_hash=content_hash,
+            pipeline_version=pipeline_version,
+            status="queued",
+        )
+        db.add(job)
+        await db.flush()
+        return job
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, job_id: UUID) -> Optional[Job]:
+        """작업 ID로 조회"""
+        return (await db.execute(select(Job).where(Job.id == job_id))).scalars().first()
+
+    @staticmethod
+    async def find_cached(
+        db: AsyncSession,
+        content_hash: str,
+        lang: str,
+        pipeline_version: str,
+    ) -> Optional[Job]:
+        """동일 파일/언어/파이프라인 버전으로 완료된 최신 작업 조회 (결과 캐시)"""
+        result = await db.execute(find_cached_statement(content_hash, lang, pipeline_version))
+        return result.scalars().first()
+
+    @staticmethod
+    async def update_status(
+        db: AsyncSession,
+        job_id: UUID,
+        status: str,
+        error_message: Optional[str] = None,
+        page_count: Optional[int] = None,
+    ) -> Optional[Job]:
+        """
+        작업 상태 업데이트
+
+        completed_at은 DB 시각으로 기록되어 flush 후 만료 상태이므로 반환된 작업에서 읽지 않음.
+        """
+        job = await AsyncJobDAO.get_by_id(db, job_id)
+        if job:
+            job.status = status
+            if error_message:
+                job.error_message = error_message
+            if page_count is not None:
+                job.page_count = page_count
+            if status in ("done", "failed"):
+                job.completed_at = db_utcnow  # started_at/리스와 같은 DB 시계 (처리 시간 백분위)
+                job.lease_owner = None
+                job.lease_expires_at = None
+            await db.flush()
+        return job
+
+    @staticmethod
+    async def delete(db: AsyncSession, job_id: UUID, created_at: datetime) -> bool:
+        """작업 삭제 (JobDAO.delete 참고, created_at으로 해당 월 파티션만 조회)"""
+        result = await db.execute(delete(Job).where(Job.id == job_id, Job.created_at == created_at))
+        return result.rowcount > 0
+
+    @staticmethod
+    async def acquire_lease(db: AsyncSession, job_id: UUID, owner: str, lease_seconds: int) -> Optional[Job]:
+        """
+        작업을 processing으로 전환하고 리스 부여 (시도 횟수 증가)
+
+        started_at/lease_expires_at은 DB 시각으로 기록되어 flush 후 만료 상태이므로
+        (비동기 세션은 지연 로드 불가) 반환된 작업에서 읽지 않음.
+        """
+        job = await AsyncJobDAO.get_by_id(db, job_id)
+        if job:
+            job.status = "processing"
+            if job.started_at is None:
+                job.started_at = db_utcnow
+            job.lease_owner = owner
+            job.lease_expires_at = db_utcnow + timedelta(seconds=lease_seconds)
+            job.attempts = (job.attempts or 0) + 1
+            await db.flush()
+        return job
+
+    @staticmethod
+    async def count_by_status(db: AsyncSession, status: str) -> int:
+        """상태별 작업 수 조회 (큐 길이 확인용)"""
+        result = await db.execute(select(func.count(Job.id)).where(Job.status == status))
+        return result.scalar() or 0
+
+    @staticmethod
+    async def get_stats(db: AsyncSession, since: Optional[datetime] = None) -> Dict:
+        """작업 통계 집계 (JobDAO.get_stats와 동일 결과)"""
+        counts = dict((await db.execute(stats_count_statement(since))).all())
+        avg_time, processing_time, wait_time = (await db.execute(stats_timing_statement(since))).one()
+
+        return stats_result(counts, avg_time, processing_time, wait_time)
+
+    @staticmethod
+    async def list_jobs(
+        db: AsyncSession,
+        limit: int = 100,
+        status: Optional[str] = None,
+        from_ts: Optional[datetime] = None,
+        to_ts: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Job]:
+        """작업 목록 조회 (created_at, id 내림차순 키셋 페이지네이션, JobDAO.list_jobs 참고)"""
+        result = await db.execute(
+            list_jobs_statement(limit, status=status, from_ts=from_ts, to_ts=to_ts, after=after)
+        )
+        return result.scalars().all()
+
+
+class AsyncJobPayloadDAO:
+    """작업 입력 파일 DAO (비동기)"""
+
+    @staticmethod
+    async def create_from_file(db: AsyncSession, job: Job, path: str) -> int:
+        """
+        스풀 파일을 청크 단위로 저장 (JobPayloadDAO.create_from_file과 동일 행)
+
+        청크마다 INSERT하므로 업로드 크기와 무관하게 메모리에는 청크 하나만 올라감.
+
+        Returns:
+            저장한 청크 수
+        """
+        seq = 0
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(PAYLOAD_CHUNK_SIZE)
+                if seq and not data:
+                    break
+                await db.execute(insert(JobPayload).values(**payload_row(job, seq, data)))
+                seq += 1
+                if len(data) < PAYLOAD_CHUNK_SIZE:
+                    break
+        return seq
+
+
+class AsyncPageDAO:
+    """페이지 DAO (비동기, 조회/캐시 복사 전용)"""
+
+    @staticmethod
+    async def copy_from_job(db: AsyncSession, source: Job, target: Job) -> None:
+        """다른 작업의 페이지/아이템을 INSERT ... SELECT 한 번으로 복사 (결과 캐시 적중 시)"""
+        await db.execute(COPY_JOB_RESULTS_SQL, copy_job_results_params(source, target))
+
+    @staticmethod
+    async def fetch_result_rows(db: AsyncSession, job_id: UUID, created_at: datetime) -> List[tuple]:
+        """작업 결과를 페이지/아이템 조인 쿼리 한 번으로 조회 (PageDAO.fetch_result_rows와 동일 행)"""
+        return (await db.execute(result_rows_statement(job_id, created_at))).all()
+
+
+class AsyncItemDAO:
+    """아이템 DAO (비동기)"""
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        query: str,
+        mode: str = "text",
+        limit: int = 50,
+        from_ts: Optional[datetime] = None,
+        to_ts: Optional[datetime] = None,
+    ) -> List[tuple]:
+        """추출 텍스트 검색 (ItemDAO.search와 동일 행)"""
+        result = await db.execute(search_statement(query, mode, limit, from_ts=from_ts, to_ts=to_ts))
+        return result.all()
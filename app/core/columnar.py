@@ -0,0 +1,108 @@
+"""컬럼형 페이지 결과 모듈: 워커 -> API 프로세스 간 결과 전달 형식"""
+from typing import List, Dict, Iterator, Tuple, Optional
+import numpy as np
+
+# 신뢰도 복원 시 소수 자릿수 (float32 유효숫자 약 7자리, 0.95가 0.949999988...로 보이지 않도록 반올림)
+CONFIDENCE_DECIMALS = 6
+
+
+def to_columnar(page_result: Dict) -> Dict:
+    """
+    아이템 dict 리스트 페이지 결과를 컬럼형으로 변환
+    
+    아이템마다 dict/bbox dict를 피클링하는 대신 컬럼 배열 몇 개만 전달하여
+    IPC 크기와 피클링 시간, 수신 측 객체 생성을 줄임.
+    
+    Args:
+        page_result: {'page_index', 'width', 'height', 'items': [{'text', 'bbox', 'confidence',
+                     'is_sensitive', 'masked_text'}]}
+    
+    Returns:
+        {
+            'page_index': int,
+            'width': int,
+            'height': int,
+            'count': int,  # 아이템 수
+            'texts': List[str],
+            'bboxes': np.ndarray,  # int32 (N, 4): x, y, w, h
+            'confidences': np.ndarray,  # float32 (N,), 인식기 점수 자체가 float32 정밀도
+            'sensitive': np.ndarray,  # uint8, np.packbits 비트맵 (is_sensitive)
+            'masked_texts': Dict[int, str],  # 민감 아이템 인덱스 -> 마스킹 텍스트
+        }
+    """
+    items = page_result['items']
+    count = len(items)
+    texts = []
+    bboxes = np.empty((count, 4), dtype=np.int32)
+    confidences = np.empty(count, dtype=np.float32)
+    sensitive = np.zeros(count, dtype=bool)
+    masked_texts = {}
+    
+    for i, item in enumerate(items):
+        bbox = item['bbox']
+        texts.append(item['text'])
+        bboxes[i] = (bbox['x'], bbox['y'], bbox['w'], bbox['h'])
+        confidences[i] = item['confidence']
+        if item.get('is_sensitive'):
+            sensitive[i] = True
+        if item.get('masked_text') is not None:
+            masked_texts[i] = item['masked_text']
+    
+    return {
+        'page_index': page_result['page_index'],
+        'width': page_result['width'],
+        'height': page_result['height'],
+        'count': count,
+        'texts': texts,
+        'bboxes': bboxes,
+        'confidences': confidences,
+        'sensitive': np.packbits(sensitive),
+        'masked_texts': masked_texts,
+    }
+
+
+def sensitive_mask(page: Dict) -> np.ndarray:
+    """민감정보 비트맵을 bool 배열로 복원"""
+    return np.unpackbits(page['sensitive'], count=page['count']).astype(bool)
+
+
+def iter_rows(page: Dict) -> Iterator[Tuple[str, int, int, int, int, float, bool, Optional[str]]]:
+    """
+    컬럼형 페이지의 아이템 행 순회
+    
+    Yields:
+        (text, x, y, w, h, confidence, is_sensitive, masked_text)
+    """
+    # numpy 스칼라 대신 파이썬 값으로 한 번에 변환
+    bboxes = page['bboxes'].tolist()
+    confidences = np.round(page['confidences'].astype(np.float64), CONFIDENCE_DECIMALS).tolist()
+    sensitive = sensitive_mask(page).tolist()
+    masked_texts = page['masked_texts']
+    
+    for i, text in enumerate(page['texts']):
+        x, y, w, h = bboxes[i]
+        yield text, x, y, w, h, confidences[i], sensitive[i], masked_texts.get(i)
+
+
+def page_to_dict(page: Dict) -> Dict:
+    """컬럼형 페이지를 응답 JSON 구조(Page 스키마)로 변환"""
+    return {
+        'page_index': page['page_index'],
+        'width': page['width'],
+        'height': page['height'],
+        'items': [
+            {
+                'text': text,
+                'bbox': {'x': x, 'y': y, 'w': w, 'h': h},
+                'confidence': confidence,
+                'is_sensitive': is_sensitive,
+                'masked_text': masked_text,
+            }
+            for text, x, y, w, h, confidence, is_sensitive, masked_text in iter_rows(page)
+        ],
+    }
+
+
+def pages_to_dicts(pages: List[Dict]) -> List[Dict]:
+    """컬럼형 페이지 리스트를 응답 JSON 구조로 변환"""
+    return [page_to_dict(page) for page in pages]
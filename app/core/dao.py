@@ -1,13 +1,16 @@
 """데이터베이스 접근 레이어"""
-from sqlalchemy import create_engine, Index
+from sqlalchemy import create_engine, Index, text, func, select, insert, literal_column, tuple_, DateTime
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
-from typing import Generator, Optional, List
+import csv
+import io
+from typing import Generator, Optional, List, Tuple, Iterable, Sequence, Dict, BinaryIO
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from app.core.models import Base, Job, Page, Item
+from app.core.models import Base, Job, JobPayload, Page, Item
+from app.core.partitions import ensure_partitions
 from app.config.settings import settings
 
 
@@ -24,15 +27,58 @@ engine = create_engine(
 # 세션 팩토리
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# DB 서버 기준 현재 시각 (UTC, naive): 여러 노드의 시계 차이와 무관하게 리스 만료를 판단
+db_utcnow = func.timezone("utc", func.now(), type_=DateTime)
+
+# 통계 백분위 (p50, p95, p99)
+STATS_PERCENTILES = (0.5, 0.95, 0.99)
+
+# 입력 파일(job_payloads) 행 하나의 크기: 저장/조회 시 메모리에는 이 크기만큼만 올라감
+PAYLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 전문 검색 설정: 한국어 형태소 분석 없이 공백 단위 토큰 (idx_items_search_tsv와 동일해야 함)
+SEARCH_TS_CONFIG = literal_column("'simple'::regconfig")
+
 
 def init_db():
-    """데이터베이스 초기화 (테이블 생성)"""
+    """데이터베이스 초기화 (테이블 및 이번 달부터 settings.partition_months_ahead개월 파티션 생성)"""
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
+    ensure_future_partitions()
     
     # 인덱스 생성
-    Index("idx_jobs_status", Job.status).create(bind=engine, checkfirst=True)
+    Index("idx_jobs_created", Job.created_at.desc(), Job.id.desc()).create(bind=engine, checkfirst=True)
+    Index(
+        "idx_jobs_status_created", Job.status, Job.created_at.desc(), Job.id.desc()
+    ).create(bind=engine, checkfirst=True)
+    Index(
+        "idx_jobs_queued", Job.created_at, postgresql_where=(Job.status == "queued")
+    ).create(bind=engine, checkfirst=True)
+    Index(
+        "idx_jobs_lease", Job.lease_expires_at, postgresql_where=(Job.status == "processing")
+    ).create(bind=engine, checkfirst=True)
+    Index(
+        "idx_jobs_content_key", Job.content_hash, Job.lang, Job.pipeline_version
+    ).create(bind=engine, checkfirst=True)
     Index("idx_pages_job", Page.job_id).create(bind=engine, checkfirst=True)
     Index("idx_items_page", Item.page_id).create(bind=engine, checkfirst=True)
+    # 식 인덱스는 Index 객체에 테이블이 연결되지 않아 checkfirst 생성이 불가하므로 DDL로 생성
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS idx_items_search_tsv ON items "
+            "USING gin (to_tsvector('simple'::regconfig, search_text))"
+        ))
+    Index(
+        "idx_items_search_trgm", Item.search_text,
+        postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"},
+    ).create(bind=engine, checkfirst=True)
+
+
+def ensure_future_partitions() -> List[str]:
+    """이번 달부터 settings.partition_months_ahead개월 파티션이 없으면 생성 (생성한 파티션 이름)"""
+    with engine.begin() as conn:
+        return ensure_partitions(conn, settings.partition_months_ahead)
 
 
 @contextmanager
@@ -58,6 +104,175 @@ def get_db_session() -> Generator[Session, None, None]:
         db.close()
 
 
+# ---------------------------------------------------------------------------
+# 쿼리 빌더 (동기 DAO와 app.core.async_dao가 같은 SQL을 사용)
+# ---------------------------------------------------------------------------
+
+# 다른 작업의 페이지/아이템 복사 (결과 캐시 적중 시, INSERT ... SELECT 한 번)
+# 두 작업의 created_at(파티션 키)을 조건으로 주어 원본/대상 월 파티션만 조회함
+COPY_JOB_RESULTS_SQL = text(
+    """
+    WITH src_pages AS (
+        SELECT id, created_at, page_index, width, height FROM pages
+        WHERE job_id = CAST(:source_job_id AS uuid) AND created_at = CAST(:source_created_at AS timestamp)
+    ),
+    new_pages AS (
+        INSERT INTO pages (job_id, created_at, page_index, width, height)
+        SELECT CAST(:target_job_id AS uuid), CAST(:target_created_at AS timestamp), page_index, width, height
+        FROM src_pages
+        RETURNING id, created_at, page_index
+    )
+    INSERT INTO items (page_id, created_at, text, x, y, w, h, confidence, is_sensitive, masked_text)
+    SELECT np.id, np.created_at, i.text, i.x, i.y, i.w, i.h, i.confidence, i.is_sensitive, i.masked_text
+    FROM items i
+    JOIN src_pages sp ON sp.id = i.page_id AND sp.created_at = i.created_at
+    JOIN new_pages np ON np.page_index = sp.page_index
+    WHERE i.created_at = CAST(:source_created_at AS timestamp)
+    ORDER BY i.id
+    """
+)
+
+
+def copy_job_results_params(source: Job, target: Job) -> Dict:
+    """COPY_JOB_RESULTS_SQL 파라미터"""
+    return {
+        "source_job_id": source.id,
+        "source_created_at": source.created_at,
+        "target_job_id": target.id,
+        "target_created_at": target.created_at,
+    }
+
+
+def has_payload_clause():
+    """입력 파일(job_payloads)이 저장된 작업 조건 (청크 행이 여러 개여도 작업 행은 1번만)"""
+    return select(JobPayload.job_id).where(JobPayload.job_id == Job.id).exists()
+
+
+def payload_row(job: Job, seq: int, data: bytes) -> Dict:
+    """입력 파일 청크 행 값"""
+    return {"job_id": job.id, "created_at": job.created_at, "seq": seq, "data": data}
+
+
+def find_cached_statement(content_hash: str, lang: str, pipeline_version: str):
+    """동일 파일/언어/파이프라인 버전으로 완료된 최신 작업"""
+    return (
+        select(Job)
+        .where(
+            Job.content_hash == content_hash,
+            Job.lang == lang,
+            Job.pipeline_version == pipeline_version,
+            Job.status == "done",
+        )
+        .order_by(Job.completed_at.desc())
+        .limit(1)
+    )
+
+
+def stats_count_statement(since: Optional[datetime] = None):
+    """상태별 작업 수 (GROUP BY status)"""
+    statement = select(Job.status, func.count(Job.id))
+    if since:
+        statement = statement.where(Job.created_at >= since)
+    return statement.group_by(Job.status)
+
+
+def stats_timing_statement(since: Optional[datetime] = None):
+    """완료 작업의 평균 처리 시간과 처리/대기 시간 백분위 (percentile_cont)"""
+    # 처리 시간: 시작 시각이 없는 이전 작업은 생성 시각 기준
+    processing = func.extract("epoch", Job.completed_at - func.coalesce(Job.started_at, Job.created_at))
+    queue_wait = func.extract("epoch", Job.started_at - Job.created_at)
+    percentiles = literal_column(
+        "ARRAY[" + ", ".join(str(p) for p in STATS_PERCENTILES) + "]::float8[]"
+    )
+    statement = select(
+        func.avg(processing),
+        func.percentile_cont(percentiles).within_group(processing),
+        func.percentile_cont(percentiles).within_group(queue_wait),
+    ).where(Job.status == "done", Job.completed_at.isnot(None))
+    if since:
+        statement = statement.where(Job.created_at >= since)
+    return statement
+
+
+def stats_result(counts: Dict, avg_time, processing_time, wait_time) -> Dict:
+    """통계 쿼리 결과를 get_stats 반환 구조로 변환"""
+    return {
+        'counts': counts,
+        'avg_processing_time': float(avg_time) if avg_time is not None else None,
+        'processing_time': processing_time,
+        'queue_wait': wait_time,
+    }
+
+
+def list_jobs_statement(
+    limit: int,
+    status: Optional[str] = None,
+    from_ts: Optional[datetime] = None,
+    to_ts: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+):
+    """작업 목록 (created_at, id 내림차순 키셋)"""
+    statement = select(Job)
+    if status:
+        statement = statement.where(Job.status == status)
+    if from_ts:
+        statement = statement.where(Job.created_at >= from_ts)
+    if to_ts:
+        statement = statement.where(Job.created_at <= to_ts)
+    if after:
+        statement = statement.where(tuple_(Job.created_at, Job.id) < tuple_(*after))
+    return statement.order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)
+
+
+def result_rows_statement(job_id: UUID, created_at: datetime):
+    """작업 결과 페이지/아이템 조인 (page_index, item id 순, 작업 생성 월 파티션만 조회)"""
+    return (
+        select(
+            Page.id, Page.page_index, Page.width, Page.height,
+            Item.text, Item.x, Item.y, Item.w, Item.h,
+            Item.confidence, Item.is_sensitive, Item.masked_text,
+        )
+        .outerjoin(Item, (Item.page_id == Page.id) & (Item.created_at == created_at))
+        .where(Page.job_id == job_id, Page.created_at == created_at)
+        .order_by(Page.page_index, Page.id, Item.id)
+    )
+
+
+def search_statement(
+    query: str,
+    mode: str,
+    limit: int,
+    from_ts: Optional[datetime] = None,
+    to_ts: Optional[datetime] = None,
+):
+    """search_text 검색 (text: tsvector 전문 검색, substring: 트라이그램 ILIKE)"""
+    if mode == "substring":
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        condition = Item.search_text.ilike(f"%{escaped}%", escape="\\")
+        rank = func.similarity(Item.search_text, query)
+    else:
+        ts_query = func.websearch_to_tsquery(SEARCH_TS_CONFIG, query)
+        ts_vector = func.to_tsvector(SEARCH_TS_CONFIG, Item.search_text)
+        condition = ts_vector.op("@@")(ts_query)
+        rank = func.ts_rank(ts_vector, ts_query)
+    
+    statement = (
+        select(
+            Job.id, Job.filename, Job.created_at, Page.page_index, Item.search_text,
+            Item.x, Item.y, Item.w, Item.h, Item.confidence, Item.is_sensitive,
+            rank.label("rank"),
+        )
+        .join(Page, (Page.id == Item.page_id) & (Page.created_at == Item.created_at))
+        .join(Job, (Job.id == Page.job_id) & (Job.created_at == Page.created_at))
+        .where(condition)
+    )
+    if from_ts:
+        statement = statement.where(Item.created_at >= from_ts)
+    if to_ts:
+        statement = statement.where(Item.created_at <= to_ts)
+    return statement.order_by(rank.desc(), Item.created_at.desc(), Item.id).limit(limit)
+
+
 class JobDAO:
     """작업 DAO"""
     
@@ -68,6 +283,8 @@ class JobDAO:
         filename: str,
         content_type: Optional[str] = None,
         lang: str = "ko",
+        content_hash: Optional[str] = None,
+        pipeline_version: Optional[str] = None,
     ) -> Job:
         """작업 생성"""
         job = Job(
@@ -75,6 +292,8 @@ class JobDAO:
             filename=filename,
             content_type=content_type,
             lang=lang,
+            content_hash=content_hash,
+            pipeline_version=pipeline_version,
             status="queued",
         )
         db.add(job)
@@ -86,6 +305,18 @@ class JobDAO:
         """작업 ID로 조회"""
         return db.query(Job).filter(Job.id == job_id).first()
     
+    @staticmethod
+    def find_cached(
+        db: Session,
+        content_hash: str,
+        lang: str,
+        pipeline_version: str,
+    ) -> Optional[Job]:
+        """동일 파일/언어/파이프라인 버전으로 완료된 최신 작업 조회 (결과 캐시)"""
+        return db.execute(
+            find_cached_statement(content_hash, lang, pipeline_version)
+        ).scalars().first()
+    
     @staticmethod
     def update_status(
         db: Session,
@@ -103,10 +334,151 @@ class JobDAO:
             if page_count is not None:
                 job.page_count = page_count
             if status in ("done", "failed"):
-                job.completed_at = datetime.utcnow()
+                job.completed_at = db_utcnow  # started_at/리스와 같은 DB 시계 (처리 시간 백분위)
+                job.lease_owner = None
+                job.lease_expires_at = None
             db.flush()
         return job
     
+    @staticmethod
+    def delete(db: Session, job_id: UUID, created_at: datetime) -> bool:
+        """
+        작업 삭제 (페이지/아이템/입력 파일은 FK ON DELETE CASCADE로 함께 삭제)
+        
+        created_at(파티션 키)을 조건으로 주어 해당 월 파티션만 조회함.
+        """
+        deleted = (
+            db.query(Job)
+            .filter(Job.id == job_id, Job.created_at == created_at)
+            .delete(synchronize_session=False)
+        )
+        return deleted > 0
+    
+    @staticmethod
+    def acquire_lease(db: Session, job_id: UUID, owner: str, lease_seconds: int) -> Optional[Job]:
+        """작업을 processing으로 전환하고 리스 부여 (시도 횟수 증가)"""
+        job = JobDAO.get_by_id(db, job_id)
+        if job:
+            job.status = "processing"
+            if job.started_at is None:
+                job.started_at = db_utcnow
+            job.lease_owner = owner
+            job.lease_expires_at = db_utcnow + timedelta(seconds=lease_seconds)
+            job.attempts = (job.attempts or 0) + 1
+            db.flush()
+        return job
+    
+    @staticmethod
+    def renew_lease(db: Session, job_id: UUID, owner: str, lease_seconds: int) -> bool:
+        """
+        하트비트: 리스 연장
+        
+        Returns:
+            여전히 owner가 리스를 보유하고 있으면 True (회수되었으면 False)
+        """
+        updated = (
+            db.query(Job)
+            .filter(Job.id == job_id, Job.lease_owner == owner, Job.status == "processing")
+            .update(
+                {Job.lease_expires_at: db_utcnow + timedelta(seconds=lease_seconds)},
+                synchronize_session=False,
+            )
+        )
+        return updated == 1
+    
+    @staticmethod
+    def reap_expired_leases(db: Session, max_attempts: int) -> Tuple[int, int]:
+        """
+        리스가 만료된 processing 작업 회수
+        
+        워커가 죽어 하트비트가 끊긴 작업 중 입력 파일(job_payloads)이 있고 시도 횟수가
+        max_attempts 미만이면 queued로 되돌려 다른 워커가 가져가게 하고,
+        그 외(입력 파일 없음, 시도 횟수 초과)는 failed로 종료함.
+        
+        Returns:
+            (재대기 수, 실패 처리 수)
+        """
+        expired = [
+            Job.status == "processing",
+            Job.lease_expires_at < db_utcnow,
+        ]
+        requeued = (
+            db.query(Job)
+            .filter(*expired, Job.attempts < max_attempts, has_payload_clause())
+            .update(
+                {Job.status: "queued", Job.lease_owner: None, Job.lease_expires_at: None},
+                synchronize_session=False,
+            )
+        )
+        failed = (
+            db.query(Job)
+            .filter(*expired)
+            .update(
+                {
+                    Job.status: "failed",
+                    Job.error_message: "작업 처리 중단 (워커 응답 없음, 리스 만료)",
+                    Job.completed_at: db_utcnow,
+                    Job.lease_owner: None,
+                    Job.lease_expires_at: None,
+                },
+                synchronize_session=False,
+            )
+        )
+        return requeued, failed
+    
+    @staticmethod
+    def count_by_status(db: Session, status: str) -> int:
+        """상태별 작업 수 조회 (큐 길이 확인용)"""
+        return db.query(func.count(Job.id)).filter(Job.status == status).scalar() or 0
+    
+    @staticmethod
+    def claim_next(db: Session, owner: str, lease_seconds: int) -> Optional[Job]:
+        """
+        DB 큐에서 가장 오래된 대기 작업을 가져와 processing으로 전환하고 리스 부여
+        
+        FOR UPDATE SKIP LOCKED로 다른 워커가 잡고 있는 행은 건너뛰므로 여러 워커가
+        동시에 호출해도 같은 작업을 중복으로 가져가지 않음. 입력 파일(job_payloads)이
+        저장된 작업만 대상이며, 호출자가 commit해야 잠금이 풀림.
+        """
+        job = (
+            db.query(Job)
+            .filter(Job.status == "queued", has_payload_clause())
+            .order_by(Job.created_at)
+            .with_for_update(skip_locked=True, of=Job)
+            .limit(1)
+            .first()
+        )
+        if job:
+            job.status = "processing"
+            if job.started_at is None:
+                job.started_at = db_utcnow
+            job.lease_owner = owner
+            job.lease_expires_at = db_utcnow + timedelta(seconds=lease_seconds)
+            job.attempts = (job.attempts or 0) + 1
+            db.flush()
+        return job
+    
+    @staticmethod
+    def get_stats(db: Session, since: Optional[datetime] = None) -> Dict:
+        """
+        작업 통계 집계 (SQL GROUP BY / percentile_cont, ORM 객체 로드 없음)
+        
+        Args:
+            since: 이 시각 이후 생성된 작업만 집계 (None이면 전체)
+            
+        Returns:
+            {
+                'counts': {status: 작업 수},
+                'avg_processing_time': float | None,
+                'processing_time': [p50, p95, p99] | None,  # 완료 - 시작 (초)
+                'queue_wait': [p50, p95, p99] | None,  # 시작 - 생성 (초)
+            }
+        """
+        counts = dict(db.execute(stats_count_statement(since)).all())
+        avg_time, processing_time, wait_time = db.execute(stats_timing_statement(since)).one()
+        
+        return stats_result(counts, avg_time, processing_time, wait_time)
+    
     @staticmethod
     def list_jobs(
         db: Session,
@@ -114,62 +486,183 @@ class JobDAO:
         status: Optional[str] = None,
         from_ts: Optional[datetime] = None,
         to_ts: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Job]:
-        """작업 목록 조회"""
-        query = db.query(Job)
-        if status:
-            query = query.filter(Job.status == status)
-        if from_ts:
-            query = query.filter(Job.created_at >= from_ts)
-        if to_ts:
-            query = query.filter(Job.created_at <= to_ts)
-        return query.order_by(Job.created_at.desc()).limit(limit).all()
+        """
+        작업 목록 조회 (created_at, id 내림차순 키셋 페이지네이션)
+        
+        Args:
+            after: 이전 페이지 마지막 작업의 (created_at, id). 주어지면 그 다음 작업부터 조회하며,
+                   (status, created_at, id) 인덱스를 따라 읽으므로 깊은 페이지도 첫 페이지와 비용이 같음
+        """
+        return db.execute(
+            list_jobs_statement(limit, status=status, from_ts=from_ts, to_ts=to_ts, after=after)
+        ).scalars().all()
+
+
+class JobPayloadDAO:
+    """작업 입력 파일 DAO (PAYLOAD_CHUNK_SIZE 단위 행으로 저장)"""
+    
+    @staticmethod
+    def create_from_file(db: Session, job: Job, path: str) -> int:
+        """
+        입력 파일을 청크 단위로 저장 (파일 전체를 메모리에 올리지 않음)
+        
+        Returns:
+            저장한 청크 수 (빈 파일도 청크 1개)
+        """
+        seq = 0
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(PAYLOAD_CHUNK_SIZE)
+                if seq and not data:
+                    break
+                db.execute(insert(JobPayload).values(**payload_row(job, seq, data)))
+                seq += 1
+                if len(data) < PAYLOAD_CHUNK_SIZE:
+                    break
+        return seq
+    
+    @staticmethod
+    def write_to_file(db: Session, job_id: UUID, f: BinaryIO) -> int:
+        """
+        입력 파일을 청크 순서대로 읽어 파일 객체에 기록 (서버 측 커서로 한 청크씩 읽음)
+        
+        Returns:
+            기록한 바이트 수
+        """
+        result = db.execute(
+            select(JobPayload.data)
+            .where(JobPayload.job_id == job_id)
+            .order_by(JobPayload.seq)
+            .execution_options(yield_per=1)
+        )
+        size = 0
+        for data in result.scalars():
+            f.write(data)
+            size += len(data)
+        return size
+    
+    @staticmethod
+    def delete(db: Session, job_id: UUID) -> None:
+        """입력 파일 삭제 (처리 완료/실패 후)"""
+        db.query(JobPayload).filter(JobPayload.job_id == job_id).delete(synchronize_session=False)
 
 
 class PageDAO:
     """페이지 DAO"""
     
     @staticmethod
-    def create(
+    def copy_from_job(db: Session, source: Job, target: Job) -> None:
+        """
+        다른 작업의 페이지/아이템을 복사 (결과 캐시 적중 시)
+        
+        INSERT ... SELECT 한 번으로 페이지와 아이템을 함께 복사하여 ORM 객체를 만들지 않음.
+        """
+        db.execute(COPY_JOB_RESULTS_SQL, copy_job_results_params(source, target))
+    
+    @staticmethod
+    def copy_results(
         db: Session,
         job_id: UUID,
-        page_index: int,
-        width: int,
-        height: int,
-    ) -> Page:
-        """페이지 생성"""
-        page = Page(
-            job_id=job_id,
-            page_index=page_index,
-            width=width,
-            height=height,
-        )
-        db.add(page)
-        db.flush()
-        return page
+        created_at: datetime,
+        pages: Sequence[Tuple[int, int, int]],
+        page_items: Sequence[Iterable[tuple]],
+    ) -> List[int]:
+        """
+        작업의 페이지/아이템을 COPY로 일괄 저장 (페이지 수와 무관하게 왕복 3회)
+        
+        페이지 id를 시퀀스에서 미리 받아 두고 pages, items를 각각 COPY FROM STDIN(CSV)
+        한 번으로 기록함. 세션과 같은 연결/트랜잭션을 사용하므로 commit은 호출자 책임.
+        
+        Args:
+            created_at: 작업 생성 시각 (파티션 키, 호출자가 가진 작업 행의 값)
+            pages: 페이지별 (page_index, width, height)
+            page_items: 페이지별 아이템 행 (text, x, y, w, h, confidence, is_sensitive, masked_text)
+            
+        Returns:
+            저장된 페이지 id 리스트 (pages 순서)
+        """
+        if not pages:
+            return []
+        
+        # 1. 페이지 id 선할당
+        page_ids = db.execute(
+            text("SELECT nextval(pg_get_serial_sequence('pages', 'id')) FROM generate_series(1, :n)"),
+            {"n": len(pages)},
+        ).scalars().all()
+        created_at = created_at.isoformat()
+        
+        # 2. CSV 버퍼 작성 (문자열은 항상 따옴표, None은 "" -> FORCE_NULL로 NULL 처리)
+        page_buf = io.StringIO()
+        item_buf = io.StringIO()
+        page_writer = csv.writer(page_buf, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+        item_writer = csv.writer(item_buf, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+        job_id_str = str(job_id)
+        has_items = False
+        for page_id, (page_index, width, height), rows in zip(page_ids, pages, page_items):
+            page_writer.writerow((page_id, created_at, job_id_str, page_index, width, height))
+            for row in rows:
+                item_writer.writerow((page_id, created_at, *row))
+                has_items = True
+        
+        # 3. COPY (psycopg2 원시 커서)
+        cursor = db.connection().connection.cursor()
+        try:
+            page_buf.seek(0)
+            cursor.copy_expert(
+                "COPY pages (id, created_at, job_id, page_index, width, height) FROM STDIN WITH (FORMAT csv)",
+                page_buf,
+            )
+            if has_items:
+                item_buf.seek(0)
+                cursor.copy_expert(
+                    "COPY items (page_id, created_at, text, x, y, w, h, confidence, is_sensitive, masked_text) "
+                    "FROM STDIN WITH (FORMAT csv, FORCE_NULL (masked_text))",
+                    item_buf,
+                )
+        finally:
+            cursor.close()
+        
+        return page_ids
     
     @staticmethod
-    def get_by_job_id(db: Session, job_id: UUID) -> List[Page]:
-        """작업 ID로 페이지 목록 조회"""
-        return db.query(Page).filter(Page.job_id == job_id).order_by(Page.page_index).all()
+    def fetch_result_rows(db: Session, job_id: UUID, created_at: datetime) -> List[tuple]:
+        """
+        작업 결과를 페이지/아이템 조인 쿼리 한 번으로 조회 (ORM 객체 생성 없음)
+        
+        Returns:
+            (page_id, page_index, width, height, text, x, y, w, h, confidence,
+             is_sensitive, masked_text) 행 리스트 (page_index, item id 순).
+            아이템이 없는 페이지는 text 이후가 None
+        """
+        return db.execute(result_rows_statement(job_id, created_at)).all()
 
 
 class ItemDAO:
     """아이템 DAO"""
     
     @staticmethod
-    def create_bulk(
+    def search(
         db: Session,
-        items: List[dict],
-    ) -> List[Item]:
-        """아이템 일괄 생성"""
-        item_objects = [Item(**item) for item in items]
-        db.bulk_save_objects(item_objects)
-        db.flush()
-        return item_objects
-    
-    @staticmethod
-    def get_by_page_id(db: Session, page_id: int) -> List[Item]:
-        """페이지 ID로 아이템 목록 조회"""
-        return db.query(Item).filter(Item.page_id == page_id).all()
+        query: str,
+        mode: str = "text",
+        limit: int = 50,
+        from_ts: Optional[datetime] = None,
+        to_ts: Optional[datetime] = None,
+    ) -> List[tuple]:
+        """
+        추출 텍스트 검색 (search_text 색인 사용, 민감 아이템은 마스킹 텍스트로만 일치)
+        
+        Args:
+            query: 검색어
+            mode: text(단어 단위 전문 검색, tsvector GIN) 또는
+                  substring(부분 문자열, 차트 번호 등, pg_trgm GIN)
+            from_ts, to_ts: 작업 생성 시각 범위 (해당 월 파티션만 조회)
+            
+        Returns:
+            (job_id, filename, job_created_at, page_index, search_text, x, y, w, h,
+             confidence, is_sensitive, rank) 행 리스트 (rank 내림차순)
+        """
+        return db.execute(search_statement(query, mode, limit, from_ts=from_ts, to_ts=to_ts)).all()
 
@@ -0,0 +1,169 @@
+"""작업 처리 공통 모듈: API 백그라운드 작업과 큐 워커가 공유하는 OCR 실행/결과 저장"""
+from datetime import datetime
+from typing import Optional, List, Union
+from uuid import UUID
+import asyncio
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.core.dao import JobDAO, JobPayloadDAO, PageDAO, SessionLocal
+from app.core.models import Job
+from app.core.ocr_pool import run_ocr
+from app.core.columnar import iter_rows
+from app.core.leases import LeaseLostError
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_content_type(filename: Optional[str]) -> Optional[str]:
+    """파일 확장자로 OCR content_type 결정 (pdf, png, jpeg 외에는 None)"""
+    filename = filename.lower() if filename else ""
+    if filename.endswith('.pdf'):
+        return "application/pdf"
+    if filename.endswith(('.png', '.jpg', '.jpeg')):
+        return "image/png"
+    return None
+
+
+async def execute_job(
+    job: Job,
+    source: Union[bytes, str],
+    lang: str = "en",
+    owner: Optional[str] = None,
+    delete_payload: bool = False,
+) -> int:
+    """
+    작업 1건 OCR 실행 후 결과 저장 및 done 처리 (commit 포함)
+    
+    OCR 동안에는 DB 세션을 잡고 있지 않으며, 결과 저장은 complete_job이 스레드에서
+    짧은 세션으로 수행함 (이벤트 루프와 다른 작업의 하트비트를 막지 않음).
+    
+    Args:
+        job: 처리할 작업 (호출자가 리스를 획득해 processing으로 전환, 세션과 분리된 객체 가능)
+        source: 스풀 파일 경로 또는 파일 바이트
+        lang: 작업에 언어가 없을 때 사용할 기본값
+        owner: 리스 소유자. 주어지면 결과 저장과 같은 트랜잭션에서 리스를 재확인하고,
+               리스를 잃었으면 LeaseLostError (다른 워커의 결과와 중복 저장 방지)
+        delete_payload: 같은 트랜잭션에서 입력 파일(job_payloads) 삭제 (DB 큐 백엔드)
+        
+    Returns:
+        처리한 페이지 수
+    """
+    if job.lang:
+        lang = job.lang
+    
+    # 파일 확장자로 타입 확인 (pdf, png, jpeg만 허용)
+    content_type = resolve_content_type(job.filename)
+    if content_type is None:
+        # 지원하지 않는 파일 형식
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {job.filename}")
+    
+    # OCR 처리 (상주 워커 프로세스에서 실행, PDF는 페이지 병렬)
+    results = await run_ocr(source, lang, content_type)
+    
+    # 결과 저장(COPY)은 동기 세션이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    return await asyncio.to_thread(complete_job, job.id, job.created_at, results, owner, delete_payload)
+
+
+def finish_job(
+    db: Session,
+    job_id: UUID,
+    created_at: datetime,
+    results: List[dict],
+    owner: Optional[str] = None,
+) -> int:
+    """리스 재확인 후 결과 저장 및 done 처리 (commit은 호출자 책임)"""
+    # 리스 재확인 (행 잠금이 commit까지 유지되어 회수와 경합하지 않음)
+    if owner and not JobDAO.renew_lease(db, job_id, owner, settings.ocr_lease_seconds):
+        raise LeaseLostError(f"작업 리스 상실: {job_id}")
+    
+    # DB 저장
+    save_results_to_db(db, job_id, created_at, results)
+    
+    # 작업 완료
+    JobDAO.update_status(db, job_id, "done", page_count=len(results))
+    return len(results)
+
+
+def complete_job(
+    job_id: UUID,
+    created_at: datetime,
+    results: List[dict],
+    owner: Optional[str] = None,
+    delete_payload: bool = False,
+) -> int:
+    """별도 동기 세션으로 finish_job 실행 후 commit (asyncio.to_thread로 호출)"""
+    db = SessionLocal()
+    try:
+        page_count = finish_job(db, job_id, created_at, results, owner)
+        if delete_payload:
+            JobPayloadDAO.delete(db, job_id)
+        db.commit()
+        return page_count
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def store_results(
+    job_id: UUID,
+    created_at: datetime,
+    results: List[dict],
+    page_count: Optional[int] = None,
+) -> None:
+    """
+    별도 동기 세션으로 결과 저장 후 commit (비동기 요청 핸들러가 asyncio.to_thread로 호출)
+    
+    Args:
+        created_at: 작업 생성 시각 (파티션 키)
+        page_count: 주어지면 같은 트랜잭션에서 작업을 done으로 전환
+    """
+    db = SessionLocal()
+    try:
+        save_results_to_db(db, job_id, created_at, results)
+        if page_count is not None:
+            JobDAO.update_status(db, job_id, "done", page_count=page_count)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def mark_job_failed(job_id: UUID, error: Exception, delete_payload: bool = False) -> None:
+    """
+    별도 동기 세션으로 작업을 failed로 기록 (asyncio.to_thread로 호출, 기록 실패는 로그만 남김)
+    
+    Args:
+        delete_payload: 같은 트랜잭션에서 입력 파일(job_payloads) 삭제 (DB 큐 백엔드)
+    """
+    db = SessionLocal()
+    try:
+        JobDAO.update_status(db, job_id, "failed", error_message=str(error))
+        if delete_payload:
+            JobPayloadDAO.delete(db, job_id)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"작업 실패 기록 중 오류: {job_id} {e}", exc_info=True)
+    finally:
+        db.close()
+
+
+def save_results_to_db(db: Session, job_id: UUID, created_at: datetime, results: List[dict]):
+    """결과를 DB에 저장 (컬럼형 페이지 결과, 페이지/아이템 COPY 일괄 저장)"""
+    PageDAO.copy_results(
+        db,
+        job_id,
+        created_at,
+        pages=[
+            (page_result['page_index'], page_result['width'], page_result['height'])
+            for page_result in results
+        ],
+        page_items=[iter_rows(page_result) for page_result in results],
+    )
@@ -0,0 +1,111 @@
+"""작업 리스 모듈: 처리 중 작업의 하트비트와 만료 리스 회수"""
+from contextlib import asynccontextmanager, suppress
+from typing import Optional, Tuple, AsyncIterator
+from uuid import UUID
+import asyncio
+import logging
+import os
+import socket
+import time
+
+from app.config.settings import settings
+from app.core.dao import SessionLocal, JobDAO, ensure_future_partitions
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLostError(Exception):
+    """작업 리스를 잃음 (만료되어 회수됨, 다른 워커가 처리 중일 수 있음)"""
+
+
+def get_worker_id() -> str:
+    """리스 소유자 식별자 (호스트명:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def renew_lease(job_id: UUID, owner: str) -> bool:
+    """별도 세션으로 리스 연장 (하트비트 1회)"""
+    db = SessionLocal()
+    try:
+        renewed = JobDAO.renew_lease(db, job_id, owner, settings.ocr_lease_seconds)
+        db.commit()
+        return renewed
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+async def _heartbeat_loop(job_id: UUID, owner: str) -> None:
+    """settings.ocr_heartbeat_interval마다 리스 연장, 리스를 잃으면 중단"""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(settings.ocr_heartbeat_interval)
+        try:
+            renewed = await loop.run_in_executor(None, renew_lease, job_id, owner)
+        except Exception as e:
+            # 일시적인 DB 오류는 다음 주기에 재시도 (리스 만료 전까지 여유가 있음)
+            logger.warning(f"하트비트 실패: {job_id} ({e})")
+            continue
+        if not renewed:
+            logger.warning(f"작업 리스 상실: {job_id} (owner={owner})")
+            return
+
+
+@asynccontextmanager
+async def hold_lease(job_id: UUID, owner: Optional[str] = None) -> AsyncIterator[None]:
+    """
+    블록 실행 동안 백그라운드 하트비트로 작업 리스 유지
+    
+    리스는 호출자가 JobDAO.acquire_lease/claim_next로 먼저 획득해야 함.
+    """
+    task = asyncio.create_task(_heartbeat_loop(job_id, owner or get_worker_id()))
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+def reap_once() -> Tuple[int, int]:
+    """만료 리스 회수 1회 실행 (재대기 수, 실패 처리 수)"""
+    db = SessionLocal()
+    try:
+        requeued, failed = JobDAO.reap_expired_leases(db, settings.ocr_max_attempts)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    
+    if requeued or failed:
+        logger.warning(f"만료 리스 회수: 재대기 {requeued}건, 실패 처리 {failed}건")
+    return requeued, failed
+
+
+async def run_reaper(interval: Optional[float] = None) -> None:
+    """
+    만료 리스 회수 루프 (API 서버와 DB 큐 워커에서 백그라운드로 실행)
+    
+    settings.partition_check_interval마다 미래 월 파티션도 확인하여, 재시작 없이
+    오래 실행되어도 새 달의 작업 INSERT가 파티션 없음으로 실패하지 않게 함.
+    """
+    interval = interval or settings.ocr_reaper_interval
+    loop = asyncio.get_running_loop()
+    next_partition_check = 0.0
+    while True:
+        if time.monotonic() >= next_partition_check:
+            try:
+                await loop.run_in_executor(None, ensure_future_partitions)
+                next_partition_check = time.monotonic() + settings.partition_check_interval
+            except Exception as e:
+                # 다음 회수 주기에 다시 시도
+                logger.error(f"월 파티션 확인 실패: {e}", exc_info=True)
+        try:
+            await loop.run_in_executor(None, reap_once)
+        except Exception as e:
+            logger.error(f"만료 리스 회수 실패: {e}", exc_info=True)
+        await asyncio.sleep(interval)
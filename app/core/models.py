@@ -1,16 +1,23 @@
 """데이터베이스 모델"""
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text, DateTime, ForeignKey, BigInteger, UUID as SQLUUID
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, DateTime, ForeignKeyConstraint, BigInteger, LargeBinary, Computed, UUID as SQLUUID, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from datetime import datetime
 import uuid
 
 Base = declarative_base()
 
+# jobs/pages/items는 작업 생성 시각(created_at) 기준 월별 RANGE 파티션 (app.core.partitions)
+# 파티션 키가 기본키/외래키에 포함되어야 하므로 pages/items에도 작업의 created_at을 그대로 저장함
+PARTITION_BY_CREATED_AT = {"postgresql_partition_by": "RANGE (created_at)"}
+
+# 검색 대상 텍스트: 민감 아이템은 원문 대신 마스킹 텍스트만 색인 (검색으로 PII 노출 방지)
+SEARCH_TEXT_EXPR = "CASE WHEN is_sensitive THEN COALESCE(masked_text, '') ELSE text END"
+
 
 class Job(Base):
     """작업 모델"""
     __tablename__ = "jobs"
+    __table_args__ = (PARTITION_BY_CREATED_AT,)
     
     id = Column(SQLUUID, primary_key=True, default=uuid.uuid4)
     api_key = Column(Text, nullable=False)  # 환경변수에서 읽은 키 값 (로그용)
@@ -20,19 +27,48 @@ class Job(Base):
     page_count = Column(Integer, default=0)
     status = Column(String(20), default="queued")  # queued, processing, done, failed
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64), nullable=True)  # 업로드 파일 SHA-256 (결과 캐시 키)
+    pipeline_version = Column(String(64), nullable=True)  # OCR 파이프라인 버전 (결과 캐시 키)
+    lease_owner = Column(Text, nullable=True)  # 처리 중인 워커 식별자 (host:pid)
+    lease_expires_at = Column(DateTime, nullable=True)  # 리스 만료 시각 (하트비트로 연장, 만료 시 회수)
+    attempts = Column(Integer, default=0)  # 처리 시도 횟수
+    # 파티션 키, started_at/completed_at과 같은 DB 시계 (INSERT ... RETURNING으로 받아옴)
+    created_at = Column(DateTime, primary_key=True, server_default=text("timezone('utc', now())"))
+    started_at = Column(DateTime, nullable=True)  # 최초 처리 시작 시각 (대기 시간 = started_at - created_at)
     completed_at = Column(DateTime, nullable=True)
     
     # 관계
     pages = relationship("Page", back_populates="job", cascade="all, delete-orphan")
+    payload_chunks = relationship("JobPayload", back_populates="job", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class JobPayload(Base):
+    """작업 입력 파일 모델 (DB 큐 백엔드에서 워커가 읽을 업로드 원본, 청크 단위 행)"""
+    __tablename__ = "job_payloads"
+    __table_args__ = (
+        ForeignKeyConstraint(["job_id", "created_at"], ["jobs.id", "jobs.created_at"], ondelete="CASCADE"),
+    )
+    
+    job_id = Column(SQLUUID, primary_key=True)
+    seq = Column(Integer, primary_key=True, default=0)  # 청크 순서 (0부터)
+    created_at = Column(DateTime, nullable=False)  # 작업 생성 시각 (jobs 파티션 키)
+    data = Column(LargeBinary, nullable=False)  # 최대 PAYLOAD_CHUNK_SIZE 바이트
+    
+    # 관계
+    job = relationship("Job", back_populates="payload_chunks")
 
 
 class Page(Base):
     """페이지 모델"""
     __tablename__ = "pages"
+    __table_args__ = (
+        ForeignKeyConstraint(["job_id", "created_at"], ["jobs.id", "jobs.created_at"], ondelete="CASCADE"),
+        PARTITION_BY_CREATED_AT,
+    )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    job_id = Column(SQLUUID, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, primary_key=True)  # 작업 생성 시각 (파티션 키)
+    job_id = Column(SQLUUID, nullable=False)
     page_index = Column(Integer, nullable=False)
     width = Column(Integer, nullable=False)
     height = Column(Integer, nullable=False)
@@ -45,9 +81,14 @@ class Page(Base):
 class Item(Base):
     """OCR 아이템 모델"""
     __tablename__ = "items"
+    __table_args__ = (
+        ForeignKeyConstraint(["page_id", "created_at"], ["pages.id", "pages.created_at"], ondelete="CASCADE"),
+        PARTITION_BY_CREATED_AT,
+    )
     
     id = Column(BigInteger, primary_key=True, autoincrement=True)
-    page_id = Column(BigInteger, ForeignKey("pages.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, primary_key=True)  # 작업 생성 시각 (파티션 키)
+    page_id = Column(BigInteger, nullable=False)
     text = Column(Text, nullable=False)
     x = Column(Integer, nullable=False)
     y = Column(Integer, nullable=False)
@@ -56,6 +97,7 @@ class Item(Base):
     confidence = Column(Float, nullable=False)
     is_sensitive = Column(Boolean, default=False)
     masked_text = Column(Text, nullable=True)
+    search_text = Column(Text, Computed(SEARCH_TEXT_EXPR, persisted=True))  # 검색 색인 대상 (생성 컬럼)
     
     # 관계
     page = relationship("Page", back_populates="items")
@@ -0,0 +1,182 @@
+"""이미지 OCR 결과 캐시 모듈: 메모리 LRU + 선택적 디스크 계층"""
+from collections import OrderedDict
+from typing import List, Dict, Optional
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 공유 카운터 배열 인덱스 (multiprocessing.Array('q', len(COUNTER_NAMES)))
+COUNTER_NAMES = ("hits", "misses", "disk_hits", "disk_evictions")
+
+# 캐시 항목 형식 버전 (키 접두사, 올리면 이전 디스크 항목은 조회되지 않고 용량 초과 시 삭제됨)
+# 2: 추론 실패 결과(빈 아이템)를 저장하던 이전 항목 폐기
+CACHE_FORMAT_VERSION = 2
+
+
+def _copy_items(items: List[Dict]) -> List[Dict]:
+    """아이템 리스트 복사 (bbox dict 포함, 호출 측 수정이 캐시에 반영되지 않도록)"""
+    return [{**item, 'bbox': dict(item['bbox'])} for item in items]
+
+
+class ImageResultCache:
+    """
+    이미지 OCR 결과 캐시
+    
+    이미지 내용 digest + 언어 + 파이프라인 버전을 키로 _process_image 결과 아이템을 저장.
+    1차는 프로세스 메모리 LRU(항목 수 제한), 2차는 여러 프로세스가 공유하는 디스크
+    디렉토리(총 크기 제한, 오래된 파일부터 삭제)를 사용함.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 0,
+        namespace: str = "",
+        counters=None,
+    ):
+        """
+        Args:
+            max_entries: 메모리 LRU 최대 항목 수 (0이면 메모리 계층 비활성화)
+            disk_dir: 디스크 계층 디렉토리 (None이면 비활성화)
+            disk_max_bytes: 디스크 계층 최대 크기 (바이트)
+            namespace: 키 접두사 (파이프라인 버전 등)
+            counters: 프로세스 간 공유 카운터 (multiprocessing.Array, 선택)
+        """
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.namespace = namespace
+        self.counters = counters
+        self._memory: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        self._local = {name: 0 for name in COUNTER_NAMES}
+        self._disk_bytes: Optional[int] = None  # 디스크 사용량 추정치 (최초 사용 시 계산)
+        
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+    
+    def make_key(self, digest: str, lang: str) -> str:
+        """캐시 키 생성"""
+        return f"v{CACHE_FORMAT_VERSION}:{self.namespace}:{lang}:{digest}"
+    
+    def get(self, digest: str, lang: str) -> Optional[List[Dict]]:
+        """캐시 조회 (없으면 None, 반환값은 복사본)"""
+        key = self.make_key(digest, lang)
+        
+        items = self._memory.get(key)
+        if items is not None:
+            self._memory.move_to_end(key)
+            self._count("hits")
+            return _copy_items(items)
+        
+        items = self._disk_get(key)
+        if items is not None:
+            self._memory_put(key, items)
+            self._count("hits")
+            self._count("disk_hits")
+            return _copy_items(items)
+        
+        self._count("misses")
+        return None
+    
+    def put(self, digest: str, lang: str, items: List[Dict]) -> None:
+        """캐시 저장 (추론에 성공한 결과만 저장해야 함, 빈 리스트는 텍스트 없는 이미지로 재사용됨)"""
+        key = self.make_key(digest, lang)
+        items = _copy_items(items)
+        self._memory_put(key, items)
+        self._disk_put(key, items)
+    
+    def stats(self) -> Dict[str, int]:
+        """현재 프로세스의 캐시 카운터"""
+        return {**self._local, "memory_entries": len(self._memory)}
+    
+    def _count(self, name: str) -> None:
+        self._local[name] += 1
+        if self.counters is not None:
+            idx = COUNTER_NAMES.index(name)
+            with self.counters.get_lock():
+                self.counters[idx] += 1
+    
+    def _memory_put(self, key: str, items: List[Dict]) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = items
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def _disk_path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.disk_dir, name[:2], f"{name}.json")
+    
+    def _disk_get(self, key: str) -> Optional[List[Dict]]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+            os.utime(path)  # 최근 사용 시각 갱신 (삭제 순서 기준)
+            return items
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"디스크 캐시 읽기 실패: {e}")
+            return None
+    
+    def _disk_put(self, key: str, items: List[Dict]) -> None:
+        if not self.disk_dir or self.disk_max_bytes <= 0:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = json.dumps(items, ensure_ascii=False).encode("utf-8")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_usage()[0]
+            else:
+                self._disk_bytes += len(data)
+            if self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+        except Exception as e:
+            logger.warning(f"디스크 캐시 쓰기 실패: {e}")
+    
+    def _scan_disk_usage(self):
+        """디스크 계층 파일 목록 스캔 -> (총 크기, [(mtime, size, path)])"""
+        total = 0
+        entries = []
+        for root, _, files in os.walk(self.disk_dir):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                total += st.st_size
+                entries.append((st.st_mtime, st.st_size, path))
+        return total, entries
+    
+    def _evict_disk(self) -> None:
+        """오래 사용되지 않은 파일부터 삭제하여 최대 크기의 90% 이하로 유지"""
+        total, entries = self._scan_disk_usage()
+        target = int(self.disk_max_bytes * 0.9)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                self._count("disk_evictions")
+            except FileNotFoundError:
+                continue
+        self._disk_bytes = total
@@ -0,0 +1,177 @@
+"""OCR 프로세스 풀 모듈: 모델이 미리 로드된 상주 워커 풀 관리"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Dict, Tuple, AsyncIterator, Union
+import asyncio
+import logging
+import multiprocessing
+
+from app.config.settings import settings
+from app.core.ocr_worker import init_ocr_process, warm_up_process, run_ocr_task_in_process
+from app.core.ocr_cache import COUNTER_NAMES
+from app.core.pdf_processor import PDFProcessor
+
+logger = logging.getLogger(__name__)
+
+# 전역 실행기 (최초 사용 시 생성)
+_ocr_executor: Optional[ProcessPoolExecutor] = None
+# 워커 프로세스 간 공유되는 이미지 캐시 카운터
+_cache_counters = None
+
+
+def get_ocr_executor() -> ProcessPoolExecutor:
+    """
+    OCR 프로세스 풀 가져오기
+    
+    풀 크기는 settings.ocr_workers를 따르며, 각 프로세스는 initializer에서
+    en/ko PaddleOCR 모델을 한 번만 로드한 뒤 모든 작업에 재사용함.
+    """
+    global _ocr_executor, _cache_counters
+    if _ocr_executor is None:
+        max_workers = max(1, settings.ocr_workers)
+        if _cache_counters is None:
+            _cache_counters = multiprocessing.Array('q', len(COUNTER_NAMES))
+        _ocr_executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_ocr_process,
+            initargs=(_cache_counters,),
+        )
+        logger.info(f"OCR 프로세스 풀 생성 (workers={max_workers})")
+    return _ocr_executor
+
+
+async def warm_up_ocr_pool() -> None:
+    """
+    워커 프로세스를 미리 기동하여 모델 로드를 완료시킴
+    
+    ProcessPoolExecutor는 프로세스를 지연 생성하므로, 풀 크기만큼 작업을 동시에
+    제출해 첫 요청이 모델 로드 시간을 부담하지 않도록 함.
+    """
+    executor = get_ocr_executor()
+    loop = asyncio.get_running_loop()
+    pids = await asyncio.gather(*[
+        loop.run_in_executor(executor, warm_up_process)
+        for _ in range(max(1, settings.ocr_workers))
+    ])
+    logger.info(f"OCR 워커 준비 완료: PID {sorted(set(pids))}")
+
+
+async def iter_ocr_pages(source: Union[bytes, str], lang: str, content_type: str) -> AsyncIterator[Dict]:
+    """
+    OCR 결과를 페이지 단위로 순서대로 반환 (스트리밍 응답용)
+    
+    PDF는 settings.ocr_stream_chunk_pages 페이지씩 나눠 워커 풀에 한꺼번에 제출하고,
+    앞 구간부터 완료되는 즉시 페이지를 내보냄. 첫 페이지는 문서 전체가 아니라
+    첫 구간의 처리 시간만에 반환됨. 소비자가 중단하면 시작 전 구간은 취소됨.
+    """
+    executor = get_ocr_executor()
+    loop = asyncio.get_running_loop()
+    
+    page_ranges: List[Optional[Tuple[int, int]]] = [None]
+    if content_type == "application/pdf":
+        page_count = PDFProcessor.count_pages(source)
+        chunk = max(1, settings.ocr_stream_chunk_pages)
+        page_ranges = [
+            (start, min(start + chunk, page_count))
+            for start in range(0, page_count, chunk)
+        ]
+    
+    futures = [
+        loop.run_in_executor(
+            executor,
+            run_ocr_task_in_process,
+            source,
+            lang,
+            content_type,
+            page_range,
+        )
+        for page_range in page_ranges
+    ]
+    try:
+        for future in futures:
+            pages = await future
+            for page in sorted(pages, key=lambda x: x['page_index']):
+                yield page
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def get_image_cache_stats() -> Optional[Dict[str, int]]:
+    """워커 프로세스 전체의 이미지 캐시 적중/실패 카운터 (풀 미생성 시 None)"""
+    if _cache_counters is None:
+        return None
+    with _cache_counters.get_lock():
+        values = list(_cache_counters)
+    return dict(zip(COUNTER_NAMES, values))
+
+
+def shutdown_ocr_pool() -> None:
+    """OCR 프로세스 풀 종료"""
+    global _ocr_executor
+    if _ocr_executor is not None:
+        _ocr_executor.shutdown(wait=False, cancel_futures=True)
+        _ocr_executor = None
+
+
+def split_page_ranges(page_count: int, shards: int) -> List[Tuple[int, int]]:
+    """
+    페이지 범위를 연속 구간으로 균등 분할
+    
+    Args:
+        page_count: 전체 페이지 수
+        shards: 분할 수
+        
+    Returns:
+        [(start, stop), ...] (stop 미포함, 빈 구간 없음)
+    """
+    shards = max(1, min(shards, page_count))
+    base, extra = divmod(page_count, shards)
+    ranges = []
+    start = 0
+    for i in range(shards):
+        stop = start + base + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+async def run_ocr(source: Union[bytes, str], lang: str, content_type: str) -> List[Dict]:
+    """
+    OCR 작업 실행 (워커 풀)
+    
+    source는 파일 바이트 또는 스풀 파일 경로이며, 경로를 넘기면 구간 수만큼 파일을
+    피클링하지 않고 각 워커가 파일을 직접 엶.
+    PDF이고 settings.ocr_parallel_pages > 1이면 페이지 범위를 N개 구간으로 나눠
+    여러 워커 프로세스에서 동시에 처리한 뒤 page_index 기준으로 병합함.
+    """
+    executor = get_ocr_executor()
+    loop = asyncio.get_running_loop()
+    
+    shards = settings.ocr_parallel_pages
+    if content_type == "application/pdf" and shards > 1:
+        page_count = PDFProcessor.count_pages(source)
+        page_ranges = split_page_ranges(page_count, shards)
+        if len(page_ranges) > 1:
+            logger.info(f"페이지 병렬 OCR: {page_count}페이지 -> {len(page_ranges)}개 구간 {page_ranges}")
+            shard_results = await asyncio.gather(*[
+                loop.run_in_executor(
+                    executor,
+                    run_ocr_task_in_process,
+                    source,
+                    lang,
+                    content_type,
+                    page_range,
+                )
+                for page_range in page_ranges
+            ])
+            results = [page for pages in shard_results for page in pages]
+            results.sort(key=lambda x: x['page_index'])
+            return results
+    
+    return await loop.run_in_executor(
+        executor,
+        run_ocr_task_in_process,
+        source,
+        lang,
+        content_type,
+    )
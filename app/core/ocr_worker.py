@@ -1,10 +1,11 @@
 """OCR 워커 모듈"""
 from paddleocr import PaddleOCR
-from typing import List, Dict
+from typing import List, Dict, Optional, Iterator, Tuple, Union
 import logging
 import numpy as np
 from PIL import Image
 import io
+import hashlib
 import os  # 추가
 
 # [추가] PaddleOCR/ONNXRuntime이 과도하게 스레드를 점유하지 못하도록 제한
@@ -18,10 +19,17 @@ from app.core.pdf_processor import PDFProcessor
 from app.core.postprocess import PostProcessor
 from app.config.settings import settings
 from app.core.pii import PIIDetector  # 추가
+from app.core.pii_rules import get_rule_set
+from app.core.ocr_cache import ImageResultCache
+from app.core.columnar import to_columnar
 
 logger = logging.getLogger(__name__)
 
 
+class OCRPredictError(Exception):
+    """OCR 추론 실패 (이미지 단위 재시도 후에도 실패, 작업은 failed 처리)"""
+
+
 def normalize_lang_code(lang: str) -> str:
     """
     언어 코드를 PaddleOCR에서 사용하는 형식으로 변환
@@ -39,28 +47,117 @@ def normalize_lang_code(lang: str) -> str:
     return lang_map.get(lang.lower(), "en")  # 기본값은 en
 
 
+def get_pipeline_version() -> str:
+    """
+    OCR 파이프라인 버전 문자열 (결과 캐시 키)
+    
+    결과에 영향을 주는 설정이 바뀌면 버전이 달라져 이전 결과를 재사용하지 않음.
+    """
+    return (
+        f"{settings.app_version}"
+        f":dpi{settings.ocr_dpi}"
+        f":{settings.ocr_render_mode}"
+        f":max{settings.ocr_max_image_size}"
+        f":draft{int(settings.ocr_jpeg_draft)}"
+        f":pii{PIIDetector.VERSION}.{get_rule_set().fingerprint()}"
+    )
+
+
+# 프로세스 로컬 워커 캐시 (언어 코드 -> OCRWorker)
+# 풀 initializer에서 채워지며, 프로세스 수명 동안 모델을 재사용함
+_process_workers: Dict[str, "OCRWorker"] = {}
+_process_pii_detector: Optional[PIIDetector] = None
+_process_image_cache: Optional[ImageResultCache] = None
+
+# 워커 프로세스 기동 시 미리 로드할 언어
+PRELOAD_LANGS = ("en", "ko")
+
+
+def build_image_cache(counters=None) -> Optional[ImageResultCache]:
+    """설정 기반 이미지 OCR 결과 캐시 생성 (메모리/디스크 계층 모두 꺼져 있으면 None)"""
+    if settings.ocr_image_cache_size <= 0 and not settings.ocr_image_cache_dir:
+        return None
+    return ImageResultCache(
+        max_entries=settings.ocr_image_cache_size,
+        disk_dir=settings.ocr_image_cache_dir,
+        disk_max_bytes=settings.ocr_image_cache_disk_mb * 1024 * 1024,
+        namespace=get_pipeline_version(),
+        counters=counters,
+    )
+
+
+def init_ocr_process(cache_counters=None) -> None:
+    """
+    OCR 프로세스 풀 initializer
+    
+    프로세스 기동 시 en/ko 모델을 한 번만 로드하여 이후 작업은 추론 시간만 부담하도록 함.
+    
+    Args:
+        cache_counters: 이미지 캐시 적중/실패 공유 카운터 (multiprocessing.Array)
+    """
+    global _process_pii_detector, _process_image_cache
+    pid = os.getpid()
+    _process_image_cache = build_image_cache(cache_counters)
+    for lang in PRELOAD_LANGS:
+        if lang not in _process_workers:
+            logger.info(f"[Worker Process PID: {pid}] PaddleOCR 모델 로드: {lang}")
+            _process_workers[lang] = OCRWorker(lang=lang, image_cache=_process_image_cache)
+    _process_pii_detector = PIIDetector()
+
+
+def warm_up_process() -> int:
+    """워커 프로세스 기동 확인용 (initializer 완료 후 PID 반환)"""
+    return os.getpid()
+
+
+def get_process_worker(lang: str) -> "OCRWorker":
+    """현재 프로세스의 상주 OCRWorker 가져오기 (없으면 생성 후 캐시)"""
+    lang = lang.lower()
+    worker = _process_workers.get(lang)
+    if worker is None:
+        worker = OCRWorker(lang=lang, image_cache=_process_image_cache)
+        _process_workers[lang] = worker
+    return worker
+
+
 # [추가] 별도 프로세스 실행 함수
-def run_ocr_task_in_process(file_bytes: bytes, lang: str, content_type: str) -> List[Dict]:
+def run_ocr_task_in_process(
+    source: Union[bytes, str],
+    lang: str,
+    content_type: str,
+    page_range: Optional[Tuple[int, int]] = None,
+) -> List[Dict]:
     """
     별도 프로세스에서 실행될 OCR 작업 함수.
-    OCRWorker와 PIIDetector를 내부에서 초기화하여 실행.
+    프로세스에 상주하는 OCRWorker와 PIIDetector를 재사용하여 실행.
+    source는 파일 바이트 또는 API 프로세스가 스풀한 파일 경로 (경로 권장: 피클링 없음).
+    page_range가 주어지면 PDF의 해당 페이지 구간(start, stop)만 처리함.
+    
+    Returns:
+        컬럼형 페이지 결과 리스트 (app.core.columnar.to_columnar 참조)
     """
+    global _process_pii_detector
     pid = os.getpid()
     logger.info(f"🚀 [Worker Process PID: {pid}] 별도 프로세스에서 OCR 작업 시작")
     
     try:
-        # 워커 초기화 (프로세스마다 새로 생성)
-        worker = OCRWorker(lang=lang)
+        # 상주 워커 사용 (initializer에서 로드된 모델 재사용)
+        worker = get_process_worker(lang)
         
         # OCR 수행
-        results = worker.process_file(file_bytes, content_type)
+        results = worker.process_file(source, content_type, page_range=page_range)
         
         # PII 탐지 및 마스킹
-        pii_detector = PIIDetector()
+        if _process_pii_detector is None:
+            _process_pii_detector = PIIDetector()
         for page_result in results:
-            page_result['items'] = pii_detector.detect_and_mask(page_result['items'])
-            
-        return results
+            page_result['items'] = _process_pii_detector.detect_and_mask(page_result['items'])
+        
+        if _process_image_cache is not None:
+            logger.info(f"[Worker Process PID: {pid}] 이미지 캐시: {_process_image_cache.stats()}")
+        
+        # 부모 프로세스로 돌려보낼 결과는 컬럼형으로 압축
+        return [to_columnar(page_result) for page_result in results]
     except Exception as e:
         logger.error(f"Process-isolated OCR task failed: {e}", exc_info=True)
         raise e
@@ -69,13 +166,20 @@ def run_ocr_task_in_process(file_bytes: bytes, lang: str, content_type: str) ->
 class OCRWorker:
     """OCR 워커"""
     
-    def __init__(self, lang: str = "en", use_angle_cls: bool = True):
+    def __init__(
+        self,
+        lang: str = "en",
+        use_angle_cls: bool = True,
+        image_cache: Optional[ImageResultCache] = None,
+    ):
         """
         Args:
             lang: 언어 (기본값: en - 영어, 'ko'는 내부적으로 'korean'으로 변환)
             use_angle_cls: 텍스트 방향 분류 사용 여부
+            image_cache: 이미지 OCR 결과 캐시 (작업 간 공유, None이면 미사용)
         """
         self.lang = lang  # 원본 언어 코드 저장 (DB용)
+        self.image_cache = image_cache
         # PaddleOCR에서 사용할 언어 코드로 변환
         paddle_lang = normalize_lang_code(lang)
         
@@ -85,17 +189,30 @@ class OCRWorker:
             use_doc_orientation_classify=False,
             use_doc_unwarping=False,
             use_textline_orientation=False,
+            # 인식기는 텍스트 라인 crop을 배치 단위로 처리
+            text_recognition_batch_size=settings.ocr_rec_batch_size,
+        )
+        # predict 1회 호출에 넘길 이미지 수 (문서 내 이미지 배치)
+        self.batch_size = max(1, settings.ocr_det_batch_size)
+        self.pdf_processor = PDFProcessor(
+            dpi=settings.ocr_dpi,
+            render_mode=settings.ocr_render_mode,
         )
-        self.pdf_processor = PDFProcessor(dpi=settings.ocr_dpi)
         self.postprocessor = PostProcessor()
     
-    def process_file(self, file_bytes: bytes, content_type: str = None) -> List[Dict]:
+    def process_file(
+        self,
+        source: Union[bytes, str],
+        content_type: str = None,
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> List[Dict]:
         """
         파일 처리 메인 엔트리포인트 (구조 개선)
         
         Args:
-            file_bytes: 파일 바이트 데이터
+            source: 파일 바이트 데이터 또는 파일 경로
             content_type: 파일 MIME 타입
+            page_range: PDF 처리 페이지 범위 (start, stop), None이면 전체
             
         Returns:
             페이지별 결과 리스트
@@ -104,31 +221,42 @@ class OCRWorker:
         # 확장자 처리는 호출하는 쪽에서 content-type을 정확히 맞춰주거나, 여기서 확장자를 받을 수 없으므로 
         # routes.py에서 처리된 content_type을 신뢰함.
         if content_type and content_type.startswith("image/"):
-            # 1-1. 이미지는 _process_image로 이동
-            # 이미지의 경우 width, height를 알기 위해 먼저 열어야 함
-            try:
-                img = Image.open(io.BytesIO(file_bytes)).convert('RGB')
-                width, height = img.size
-                
-                # 단일 이미지 처리지만 결과 구조 통일을 위해 리스트로 감쌈
-                ocr_items = self._process_image(file_bytes, width, height)
-                
-                # 결과 포맷팅 (단일 페이지)
-                page_result = {
-                    'page_index': 0,
-                    'width': width,
-                    'height': height,
-                    'items': ocr_items,
-                }
-                final_results = [page_result]
+            if isinstance(source, str):
+                with open(source, "rb") as f:
+                    file_bytes = f.read()
+            else:
+                file_bytes = source
+            
+            # 1-1. 동일 이미지 캐시 적중 시 헤더에서 크기만 읽고 추론 생략
+            digest = hashlib.sha256(file_bytes).hexdigest()
+            ocr_items = self._cache_get(digest)
+            if ocr_items is not None:
+                width, height = Image.open(io.BytesIO(file_bytes)).size
+            else:
+                # 이미지는 한 번만 디코딩 (원본 크기 확인 + 최대 크기 제한 축소)
+                decoded = self._decode_image(file_bytes)
+                if decoded is None:
+                    logger.error("이미지 처리 시작 실패: 디코딩 불가")
+                    return []
+                img_array, (width, height) = decoded
                 
-            except Exception as e:
-                logger.error(f"이미지 처리 시작 실패: {e}", exc_info=True)
-                return []
+                # 단일 이미지 처리 (bbox는 원본 좌표로 복원됨)
+                # 추론 실패는 OCRPredictError로 전파되므로 캐시에는 성공한 결과만 저장됨
+                ocr_items = self._process_image(img_array, (width, height))
+                self._cache_put(digest, ocr_items)
+            
+            # 결과 포맷팅 (단일 페이지)
+            page_result = {
+                'page_index': 0,
+                'width': width,
+                'height': height,
+                'items': ocr_items,
+            }
+            final_results = [page_result]
                 
         elif content_type == "application/pdf":
             # 1-2. PDF는 _process_pdf로 이동
-            final_results = self._process_pdf(file_bytes)
+            final_results = self._process_pdf(source, page_range)
             
         else:
             # 1-3. 그 외 타입은 처리 중지
@@ -150,29 +278,53 @@ class OCRWorker:
         # 3. 결과 리턴
         return final_results
 
-    def _process_pdf(self, pdf_bytes: bytes) -> List[Dict]:
+    def _process_pdf(
+        self,
+        pdf_bytes: Union[bytes, str],
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> List[Dict]:
         """
         PDF 처리 내부 로직 (구조 개선)
         
         A. _process_pdf 함수
         1) pdf 에서 텍스트 추출
         2) pdf 에서 이미지 추출(존재한다면)
-        3) 각각의 이미지는 _process_image 함수로 이동하여, ocr 진행
+        3) 문서 내 이미지를 모아 배치 단위로 ocr 진행
         4) 추출한 텍스트와, ocr 결과값을 가지고, 최종 결과 리스트 생성
         """
-        # PDFProcessor를 사용하여 텍스트/이미지 추출 (기존 로직 활용)
-        pdf_results = self.pdf_processor.process_pdf(pdf_bytes)
+        final_results = list(self._iter_pdf_pages(pdf_bytes, page_range))
+            
+        # 페이지 순서 정렬
+        final_results.sort(key=lambda x: x['page_index'])
+        return final_results
+
+    def _iter_pdf_pages(
+        self,
+        pdf_bytes: Union[bytes, str],
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Dict]:
+        """
+        PDF 페이지별 결과 생성기 (배치 OCR)
         
-        final_results = []
+        페이지의 임베딩 이미지를 디코딩하여 대기열에 쌓고, 대기열이 배치 크기 이상이 되면
+        한 번의 predict 호출로 처리함. 이미지는 내용 digest 키로 문서 내에서 1회만 OCR하며,
+        같은 이미지를 쓰는 모든 페이지에 결과를 복사해 넣음 (로고, 레터헤드 등).
+        페이지 아이템은 (텍스트, 이미지 순서) 그대로 조립되며 완료된 페이지는 순서대로 반환.
+        """
+        pending_pages: List[Tuple[Dict, List[str]]] = []  # (페이지 결과, 이미지 키 목록)
+        # {'key': 이미지 키, 'image': 이미지 배열, 'size': 원본 크기, 'owner': 버퍼 소유 객체}
+        queue: List[Dict] = []
+        doc_results: Dict[str, List[Dict]] = {}  # 이미지 키 -> OCR 아이템 (문서 단위)
+        queued_keys = set()
         
-        # 각 페이지별 처리
-        for pdf_page in pdf_results:
+        for pdf_page in self.pdf_processor.iter_pages(pdf_bytes, page_range):
             page_result = {
                 'page_index': pdf_page['page_index'],
                 'width': pdf_page['width'],
                 'height': pdf_page['height'],
                 'items': [],
             }
+            image_keys: List[str] = []
             
             # 1) 텍스트 추출 결과 추가
             if pdf_page.get('has_text') and pdf_page.get('text_items'):
@@ -182,84 +334,229 @@ class OCRWorker:
                     new_item['bbox'] = {'x': 0, 'y': 0, 'w': 0, 'h': 0}
                     page_result['items'].append(new_item)
             
-            # 2) 이미지 추출 및 3) _process_image로 OCR 진행
-            if pdf_page.get('images'):
-                for img_bytes in pdf_page['images']:
-                    ocr_items = self._process_image(
-                        img_bytes, 
-                        0,
-                        0 
-                    )
-                    page_result['items'].extend(ocr_items)
+            # 2) 처음 보는 이미지만 디코딩 후 배치 대기열에 추가
+            for image in pdf_page.get('images') or []:
+                key = image['key']
+                image_keys.append(key)
+                if key in doc_results or key in queued_keys or image['data'] is None:
+                    continue
+                cached = self._cache_get(key)
+                if cached is not None:
+                    doc_results[key] = cached
+                    continue
+                decoded = self._decode_image(image['data'])
+                if decoded is None:
+                    doc_results[key] = []
+                    continue
+                img_array, size = decoded
+                queue.append({'key': key, 'image': img_array, 'size': size, 'owner': None})
+                queued_keys.add(key)
             
-            final_results.append(page_result)
+            # 2-1) 렌더링된 페이지는 pixmap 버퍼 뷰를 그대로 전달 (좌표 = 페이지 픽셀)
+            raster = pdf_page.get('raster')
+            if raster is not None:
+                key = f"page:{pdf_page['page_index']}"
+                image_keys.append(key)
+                queue.append({
+                    'key': key,
+                    'image': PDFProcessor.pixmap_to_array(raster),
+                    'size': (raster.width, raster.height),
+                    'owner': raster,
+                })
             
-        # 페이지 순서 정렬
-        final_results.sort(key=lambda x: x['page_index'])
-        return final_results
+            pending_pages.append((page_result, image_keys))
+            
+            # 3) 배치가 찼으면 OCR 수행 후 완료된 페이지 반환
+            if len(queue) >= self.batch_size:
+                self._flush_batch(queue, doc_results)
+                queue = []
+                queued_keys.clear()
+                for page_result, keys in pending_pages:
+                    yield self._assemble_page(page_result, keys, doc_results)
+                pending_pages = []
+        
+        # 남은 이미지 처리
+        if queue:
+            self._flush_batch(queue, doc_results)
+        for page_result, keys in pending_pages:
+            yield self._assemble_page(page_result, keys, doc_results)
+        
+        unique = sum(1 for key in doc_results if not key.startswith("page:"))
+        logger.info(f"문서 이미지 OCR: 고유 이미지 {unique}개")
+
+    def _flush_batch(self, queue: List[Dict], doc_results: Dict[str, List[Dict]]) -> None:
+        """
+        대기열의 이미지를 배치 OCR하고 결과를 이미지 키별로 저장
+        
+        _predict_batch는 모든 이미지 추론에 성공했을 때만 반환하므로 (실패 시 OCRPredictError)
+        일시적인 추론 오류의 빈 결과가 이미지 캐시에 남지 않음.
+        """
+        batch_items = self._predict_batch([entry['image'] for entry in queue])
+        for entry, items in zip(queue, batch_items):
+            self._restore_scale(items, entry['image'], entry['size'])
+            doc_results[entry['key']] = items
+            if entry['owner'] is None:  # 렌더링 페이지는 작업 간 재사용 대상 아님
+                self._cache_put(entry['key'], items)
+
+    def _cache_get(self, digest: str) -> Optional[List[Dict]]:
+        """이미지 캐시 조회 (캐시 미사용 시 None)"""
+        if self.image_cache is None:
+            return None
+        return self.image_cache.get(digest, self.lang)
+
+    def _cache_put(self, digest: str, items: List[Dict]) -> None:
+        """이미지 캐시 저장"""
+        if self.image_cache is not None:
+            self.image_cache.put(digest, self.lang, items)
 
-    def _process_image(self, image_bytes: bytes, page_width: int, page_height: int) -> List[Dict]:
+    @staticmethod
+    def _assemble_page(page_result: Dict, image_keys: List[str], doc_results: Dict[str, List[Dict]]) -> Dict:
+        """이미지 키 순서대로 OCR 아이템을 복사하여 페이지 결과에 추가"""
+        for key in image_keys:
+            for item in doc_results.get(key, []):
+                page_result['items'].append({**item, 'bbox': dict(item['bbox'])})
+        return page_result
+
+    def _process_image(self, img_array: np.ndarray, original_size: Tuple[int, int]) -> List[Dict]:
         """
         이미지 OCR 처리 내부 로직 (구조 개선)
         
         B. _process_image 함수
-        1) 받은 이미지를 paddle ocr 로 ocr 인식 진행 (별도 전처리등 진행하지 않음)
-        2) 나온 결과를 정형화 하여, 리턴
+        1) 디코딩된 이미지를 paddle ocr 로 ocr 인식 진행 (별도 전처리등 진행하지 않음)
+        2) 나온 결과를 원본 좌표로 정형화 하여, 리턴
         """
         logger.info("Image OCR Processing Start")
         
+        items = self._predict_batch([img_array])[0]
+        self._restore_scale(items, img_array, original_size)
+        logger.info(f"이미지 OCR 완료: {len(items)} 개 항목 추출")
+        return items
+
+    def _decode_image(self, image_bytes: bytes) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+        """
+        이미지 바이트를 RGB 배열로 1회 디코딩 (실패 시 None)
+        
+        긴 변이 settings.ocr_max_image_size를 넘으면 축소하여 디코딩함.
+        JPEG은 draft 모드로 DCT 단계에서 1/2~1/8 축소 디코딩 후 나머지만 리샘플링.
+        
+        Returns:
+            (RGB 배열, 원본 크기 (width, height))
+        """
         try:
-            img = Image.open(io.BytesIO(image_bytes)).convert('RGB')
-            img_array = np.array(img)
-            
-            ocr_result = self.ocr.predict(img_array) 
-            
-            items = []
+            img = Image.open(io.BytesIO(image_bytes))
+            original_size = img.size
+            max_side = settings.ocr_max_image_size
+            longest = max(original_size)
             
-            for res in ocr_result:
-                if isinstance(res, dict):
-                    texts = res.get('rec_texts', [])
-                    scores = res.get('rec_scores', [])
-                    polys = res.get('dt_polys', [])
-                    
-                    if texts and scores and len(texts) == len(scores):
-                        for i, (text, score) in enumerate(zip(texts, scores)):
-                            bbox = {'x': 0, 'y': 0, 'w': 0, 'h': 0}
-                            
-                            # 좌표 정보 추출 (dt_polys 활용)
-                            if polys is not None and len(polys) > i:
-                                try:
-                                    poly = polys[i]
-                                    # numpy array인 경우 리스트로 변환
-                                    if hasattr(poly, 'tolist'):
-                                        poly = poly.tolist()
-                                    if len(poly) >= 4:
-                                        xs = [p[0] for p in poly]
-                                        ys = [p[1] for p in poly]
-                                        x_min = min(xs)
-                                        y_min = min(ys)
-                                        x_max = max(xs)
-                                        y_max = max(ys)
-                                        
-                                        bbox = {
-                                            'x': int(x_min),
-                                            'y': int(y_min),
-                                            'w': int(x_max - x_min),
-                                            'h': int(y_max - y_min)
-                                        }
-                                except Exception as e:
-                                    logger.warning(f"좌표 변환 실패 index={i}: {e}")
-                            items.append({
-                                'text': text,
-                                'bbox': bbox,
-                                'confidence': float(score),
-                            })
-                    else:
-                        logger.warning(f"OCR 결과에 텍스트가 없거나 길이가 맞지 않음: {res.keys()}")
-            
-            logger.info(f"이미지 OCR 완료: {len(items)} 개 항목 추출")
-            return items
+            if max_side and longest > max_side:
+                if settings.ocr_jpeg_draft and img.format == "JPEG":
+                    ratio = max_side / longest
+                    img.draft('RGB', (int(original_size[0] * ratio), int(original_size[1] * ratio)))
+                img = img.convert('RGB')
+                if max(img.size) > max_side:
+                    img.thumbnail((max_side, max_side), Image.BILINEAR)
+                logger.info(f"이미지 축소 디코딩: {original_size} -> {img.size}")
+            else:
+                img = img.convert('RGB')
             
+            return np.array(img), original_size
         except Exception as e:
-            logger.error(f"이미지 OCR 처리 중 오류: {e}", exc_info=True)
-            return []
+            logger.error(f"이미지 디코딩 실패: {e}", exc_info=True)
+            return None
+
+    def _restore_scale(self, items: List[Dict], img_array: np.ndarray, original_size: Tuple[int, int]) -> None:
+        """축소 디코딩된 이미지의 bbox를 원본 이미지 좌표로 복원 (in-place)"""
+        height, width = img_array.shape[:2]
+        if (width, height) == tuple(original_size):
+            return
+        scale_x = original_size[0] / width
+        scale_y = original_size[1] / height
+        for item in items:
+            item['bbox'] = self.postprocessor.scale_bbox(item['bbox'], scale_x, scale_y)
+
+    def _predict_batch(self, images: List[np.ndarray]) -> List[List[Dict]]:
+        """
+        이미지 배열 목록을 batch_size 단위로 OCR
+        
+        배치 predict가 실패하면 해당 배치만 이미지 1장씩 다시 시도하며, 1장 단위로도
+        실패한 이미지가 있으면 OCRPredictError (빈 결과로 done 처리되지 않도록 작업 실패).
+        
+        Returns:
+            입력 순서와 동일한 이미지별 아이템 리스트
+        """
+        results: List[List[Dict]] = []
+        
+        for start in range(0, len(images), self.batch_size):
+            chunk = images[start:start + self.batch_size]
+            try:
+                chunk_items = self._predict(chunk)
+            except Exception as e:
+                if len(chunk) == 1:
+                    raise OCRPredictError(f"이미지 OCR 처리 중 오류: {e}") from e
+                logger.warning(f"배치 OCR 실패, 이미지 단위로 재시도: {e}", exc_info=True)
+                chunk_items = []
+                for image in chunk:
+                    try:
+                        chunk_items.extend(self._predict([image]))
+                    except Exception as e:
+                        raise OCRPredictError(f"이미지 OCR 처리 중 오류: {e}") from e
+            results.extend(chunk_items)
+        
+        calls = (len(images) + self.batch_size - 1) // self.batch_size
+        logger.info(f"배치 OCR 완료: 이미지 {len(images)}개, predict 호출 {calls}회")
+        return results
+
+    def _predict(self, images: List[np.ndarray]) -> List[List[Dict]]:
+        """predict 1회 호출 (결과 수가 입력 수와 다르면 ValueError)"""
+        items = [self._parse_ocr_result(res) for res in self.ocr.predict(images)]
+        if len(items) != len(images):
+            raise ValueError(f"OCR 결과 수 불일치: 입력 {len(images)}, 결과 {len(items)}")
+        return items
+
+    def _parse_ocr_result(self, res) -> List[Dict]:
+        """PaddleOCR 단일 이미지 결과를 아이템 리스트로 정형화"""
+        items = []
+        
+        if not isinstance(res, dict):
+            return items
+        
+        texts = res.get('rec_texts', [])
+        scores = res.get('rec_scores', [])
+        polys = res.get('dt_polys', [])
+        
+        if texts and scores and len(texts) == len(scores):
+            for i, (text, score) in enumerate(zip(texts, scores)):
+                bbox = {'x': 0, 'y': 0, 'w': 0, 'h': 0}
+                
+                # 좌표 정보 추출 (dt_polys 활용)
+                if polys is not None and len(polys) > i:
+                    try:
+                        poly = polys[i]
+                        # numpy array인 경우 리스트로 변환
+                        if hasattr(poly, 'tolist'):
+                            poly = poly.tolist()
+                        if len(poly) >= 4:
+                            xs = [p[0] for p in poly]
+                            ys = [p[1] for p in poly]
+                            x_min = min(xs)
+                            y_min = min(ys)
+                            x_max = max(xs)
+                            y_max = max(ys)
+                            
+                            bbox = {
+                                'x': int(x_min),
+                                'y': int(y_min),
+                                'w': int(x_max - x_min),
+                                'h': int(y_max - y_min)
+                            }
+                    except Exception as e:
+                        logger.warning(f"좌표 변환 실패 index={i}: {e}")
+                items.append({
+                    'text': text,
+                    'bbox': bbox,
+                    'confidence': float(score),
+                })
+        else:
+            logger.warning(f"OCR 결과에 텍스트가 없거나 길이가 맞지 않음: {res.keys()}")
+        
+        return items
@@ -0,0 +1,148 @@
+"""파티션 관리 모듈: jobs/pages/items 월별 RANGE 파티션 생성 및 보존 기간 경과 파티션 삭제"""
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+import logging
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+# 파티션 테이블 (생성 순서: 참조되는 쪽 먼저, 삭제는 역순)
+PARTITIONED_TABLES = ("jobs", "pages", "items")
+
+# 파티션 생성/삭제 직렬화용 advisory lock 키 (API 서버/워커/ocr-cli가 동시에 점검해도 충돌 없음)
+PARTITION_LOCK_KEY = 7_402_019
+
+
+def lock_partitions(conn: Connection) -> None:
+    """트랜잭션이 끝날 때까지 파티션 관리 잠금"""
+    conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+
+def month_start(value) -> date:
+    """해당 월의 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    """월 단위 이동 (month는 1일)"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """월별 파티션 이름 (예: items_2026_10)"""
+    return f"{table}_{month:%Y_%m}"
+
+
+def create_month_partitions(conn: Connection, month: date) -> List[str]:
+    """
+    한 달 치 jobs/pages/items 파티션 생성 (이미 있으면 건너뜀)
+    
+    Returns:
+        새로 생성한 파티션 이름 리스트
+    """
+    start = month_start(month)
+    end = add_months(start, 1)
+    created = []
+    for table in PARTITIONED_TABLES:
+        name = partition_name(table, start)
+        exists = conn.execute(text("SELECT to_regclass(:name)"), {"name": name}).scalar()
+        if exists:
+            continue
+        conn.execute(text(
+            f"CREATE TABLE {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        created.append(name)
+    return created
+
+
+def ensure_partitions(
+    conn: Connection,
+    months_ahead: int,
+    start: Optional[date] = None,
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    start 월(기본값: 이번 달)부터 이번 달 + months_ahead 월까지 파티션 생성
+    
+    작업 생성 시각은 UTC(datetime.utcnow) 기준이므로 파티션 경계도 UTC 월 단위임.
+    장기 실행 프로세스(API 서버, DB 큐 워커)의 회수 루프가 주기적으로 호출함 (app.core.leases.run_reaper).
+    """
+    lock_partitions(conn)
+    current = month_start(now or datetime.utcnow())
+    month = month_start(start) if start else current
+    last = add_months(current, months_ahead)
+    created = []
+    while month <= last:
+        created.extend(create_month_partitions(conn, month))
+        month = add_months(month, 1)
+    if created:
+        logger.info(f"파티션 생성: {created}")
+    return created
+
+
+def list_month_partitions(conn: Connection, table: str) -> List[Tuple[date, str]]:
+    """테이블의 월별 파티션 목록 [(월, 파티션 이름)] (월 오름차순)"""
+    rows = conn.execute(
+        text(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = :table
+            """
+        ),
+        {"table": table},
+    ).scalars()
+    pattern = re.compile(rf"^{table}_(\d{{4}})_(\d{{2}})$")
+    partitions = []
+    for name in rows:
+        match = pattern.match(name)
+        if match:
+            partitions.append((date(int(match.group(1)), int(match.group(2)), 1), name))
+    return sorted(partitions)
+
+
+def drop_expired_partitions(
+    conn: Connection,
+    retention_months: int,
+    dry_run: bool = False,
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    보존 기간이 지난 월 파티션을 통째로 분리 후 삭제
+    
+    행 단위 DELETE + ON DELETE CASCADE 대신 파티션을 DROP하므로 테이블 팽창과 VACUUM 부담이
+    없음. 외래키 참조 순서에 따라 items -> pages -> jobs 순으로 분리/삭제하며, 이번 달을
+    포함해 retention_months개월은 항상 남김.
+    API 프로세스의 결과 본문 캐시(GET /result)에 남은 삭제된 작업은 result_body_cache_ttl이 지나면 사라짐.
+    
+    Returns:
+        삭제한(dry_run이면 삭제 대상) 파티션 이름 리스트
+    """
+    if not dry_run:
+        lock_partitions(conn)
+    cutoff = add_months(month_start(now or datetime.utcnow()), -max(1, retention_months) + 1)
+    dropped = []
+    for table in reversed(PARTITIONED_TABLES):
+        for month, name in list_month_partitions(conn, table):
+            if month >= cutoff:
+                continue
+            dropped.append(name)
+            if dry_run:
+                continue
+            if table == "jobs":
+                # 남아 있는 입력 파일(job_payloads)이 분리 시 외래키 검사에 걸리지 않도록 먼저 삭제
+                conn.execute(
+                    text("DELETE FROM job_payloads WHERE created_at >= :start AND created_at < :end"),
+                    {"start": month, "end": add_months(month, 1)},
+                )
+            conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            conn.execute(text(f"DROP TABLE {name}"))
+            logger.info(f"파티션 삭제: {name}")
+    return dropped
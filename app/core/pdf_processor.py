@@ -1,6 +1,8 @@
 """PDF 처리 모듈: 텍스트 레이어 추출 및 이미지 OCR"""
 import fitz  # PyMuPDF
-from typing import List, Dict, Optional
+import hashlib
+import numpy as np
+from typing import List, Dict, Optional, Iterator, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,42 +11,110 @@ logger = logging.getLogger(__name__)
 class PDFProcessor:
     """PDF 처리기: 텍스트 추출 및 이미지 렌더링"""
     
-    def __init__(self, dpi: int = 300):
+    # 렌더링 모드
+    RENDER_EMBEDDED = "embedded"  # 임베딩된 이미지만 추출하여 OCR
+    RENDER_SCANNED = "scanned"  # 텍스트 레이어 없는 이미지 페이지는 페이지 전체를 렌더링하여 OCR
+    
+    def __init__(self, dpi: int = 300, render_mode: str = RENDER_EMBEDDED):
         """
         Args:
             dpi: 이미지 렌더링 DPI
+            render_mode: 이미지 페이지 처리 방식 (embedded, scanned)
         """
         self.dpi = dpi
         self.zoom = dpi / 72.0  # PyMuPDF는 72 DPI 기준
         self.mat = fitz.Matrix(self.zoom, self.zoom)
+        self.render_mode = render_mode
+    
+    @staticmethod
+    def pixmap_to_array(pix: fitz.Pixmap) -> np.ndarray:
+        """
+        Pixmap 샘플 버퍼를 복사 없이 (H, W, C) uint8 배열 뷰로 변환
+        
+        배열은 pixmap 메모리를 참조하므로 사용하는 동안 pixmap 참조를 유지해야 함.
+        """
+        buf = np.frombuffer(pix.samples_mv, dtype=np.uint8)
+        rows = buf.reshape(pix.height, pix.stride)
+        return rows[:, :pix.width * pix.n].reshape(pix.height, pix.width, pix.n)
     
-    def process_pdf(self, pdf_bytes: bytes) -> List[Dict]:
+    @staticmethod
+    def open_document(source: Union[bytes, str]) -> fitz.Document:
+        """
+        PDF 문서 열기
+        
+        Args:
+            source: PDF 바이트 데이터 또는 파일 경로 (경로는 메모리로 전체 복사하지 않음)
+        """
+        if isinstance(source, str):
+            return fitz.open(source, filetype="pdf")
+        return fitz.open(stream=source, filetype="pdf")
+    
+    @staticmethod
+    def count_pages(source: Union[bytes, str]) -> int:
+        """PDF 페이지 수 조회 (페이지 내용은 파싱하지 않음)"""
+        doc = PDFProcessor.open_document(source)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    
+    def process_pdf(
+        self,
+        pdf_bytes: Union[bytes, str],
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> List[Dict]:
         """
         PDF 처리: 텍스트 레이어 추출 및 이미지 페이지 렌더링
         
         Args:
-            pdf_bytes: PDF 바이트 데이터
+            pdf_bytes: PDF 바이트 데이터 또는 파일 경로
+            page_range: 처리할 페이지 범위 (start, stop), None이면 전체
             
         Returns:
             페이지별 결과 리스트
         """
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        results = []
+        return list(self.iter_pages(pdf_bytes, page_range))
+    
+    def iter_pages(
+        self,
+        pdf_bytes: Union[bytes, str],
+        page_range: Optional[Tuple[int, int]] = None,
+    ) -> Iterator[Dict]:
+        """
+        페이지 단위 처리 생성기 (문서 전체 결과를 메모리에 쌓지 않음)
+        
+        Args:
+            pdf_bytes: PDF 바이트 데이터 또는 파일 경로
+            page_range: 처리할 페이지 범위 (start, stop), None이면 전체
+            
+        Yields:
+            페이지별 결과 (_process_page 참조, page_index는 문서 기준)
+        """
+        doc = self.open_document(pdf_bytes)
+        # 문서 내 이미지 xref -> 내용 digest (같은 xref는 1회만 추출)
+        xref_digests: Dict[int, str] = {}
         
         try:
-            for page_num in range(len(doc)):
+            start, stop = page_range if page_range else (0, len(doc))
+            for page_num in range(max(0, start), min(stop, len(doc))):
                 page = doc[page_num]
-                result = self._process_page(page, page_num, doc)
-                results.append(result)
+                yield self._process_page(page, page_num, doc, xref_digests)
         finally:
             doc.close()
-        
-        return results
     
-    def _process_page(self, page: fitz.Page, page_index: int, doc: fitz.Document) -> Dict:
+    def _process_page(
+        self,
+        page: fitz.Page,
+        page_index: int,
+        doc: fitz.Document,
+        xref_digests: Optional[Dict[int, str]] = None,
+    ) -> Dict:
         """
         페이지 처리: 텍스트 추출 및 이미지 페이지 판별
         
+        Args:
+            xref_digests: 문서 단위 xref -> digest 맵 (이미 추출한 이미지는 data=None)
+        
         Returns:
             {
                 'page_index': int,
@@ -52,7 +122,8 @@ class PDFProcessor:
                 'height': int,
                 'has_text': bool,
                 'text_items': List[Dict],  # 텍스트 레이어 아이템
-                'images': List[bytes],  # 임베딩된 이미지 목록
+                'images': List[Dict],  # 임베딩된 이미지 [{'key': digest, 'data': bytes | None}]
+                'raster': Optional[fitz.Pixmap],  # 페이지 렌더링 결과 (scanned 모드)
             }
         """
         # 페이지 크기 (픽셀 단위)
@@ -67,17 +138,36 @@ class PDFProcessor:
         # 이미지 추출 (User Request: 페이지 내의 임베딩된 이미지만 추출)
         # 2. 페이지 내의 임베딩된 이미지만 추출 (get_images)
         images = []
+        raster = None
         
         # 페이지 내 이미지 목록 가져오기
         image_list = page.get_images()
         
+        # scanned 모드: 텍스트 레이어 없는 이미지 페이지는 페이지 픽셀 좌표로 전체 렌더링
+        # (PNG/JPEG 인코딩 없이 pixmap 샘플 버퍼를 그대로 OCR에 전달)
+        if self.render_mode == self.RENDER_SCANNED and not has_text and image_list:
+            raster = page.get_pixmap(matrix=self.mat, colorspace=fitz.csRGB, alpha=False)
+            width, height = raster.width, raster.height
+            image_list = []
+        
+        if xref_digests is None:
+            xref_digests = {}
+        
         for img in image_list:
             xref = img[0]
+            # 같은 문서에서 이미 추출한 xref는 키만 전달 (재추출/재OCR 방지)
+            digest = xref_digests.get(xref)
+            if digest is not None:
+                images.append({'key': digest, 'data': None})
+                continue
             # 이미지 데이터 추출
             try:
                 base_image = doc.extract_image(xref)
                 if base_image:
-                    images.append(base_image["image"])
+                    data = base_image["image"]
+                    digest = hashlib.sha256(data).hexdigest()
+                    xref_digests[xref] = digest
+                    images.append({'key': digest, 'data': data})
             except Exception:
                 continue
         
@@ -88,10 +178,29 @@ class PDFProcessor:
             'has_text': has_text,
             'text_items': text_items,
             'images': images, # 이미지 리스트
+            'raster': raster,
         }
         
         return result
     
+    @staticmethod
+    def iter_text_spans(page: fitz.Page) -> Iterator[Tuple[str, Tuple[float, float, float, float]]]:
+        """
+        텍스트 레이어 span을 추출 순서대로 (텍스트, PDF 좌표 bbox)로 반환 (빈 span 제외)
+        
+        텍스트 레이어 아이템은 결과에 좌표 없이 저장되므로 가림 처리(redactor)가 같은 순서로
+        span을 다시 읽어 아이템 위치를 찾음.
+        """
+        blocks = page.get_text("dict")
+        for block in blocks.get("blocks", []):
+            if "lines" not in block:  # 이미지 블록은 건너뜀
+                continue
+            for line in block["lines"]:
+                for span in line.get("spans", []):
+                    text = span.get("text", "").strip()
+                    if text:
+                        yield text, span["bbox"]
+    
     def _extract_text_items(self, page: fitz.Page) -> List[Dict]:
         """
         페이지에서 텍스트 아이템 추출
@@ -105,31 +214,18 @@ class PDFProcessor:
         """
         items = []
         
-        # 텍스트 블록 추출
-        blocks = page.get_text("dict")
-        
-        for block in blocks.get("blocks", []):
-            if "lines" not in block:  # 이미지 블록은 건너뜀
-                continue
+        for text, bbox in self.iter_text_spans(page):
+            # bbox를 픽셀 좌표로 변환
+            x = int(bbox[0] * self.zoom)
+            y = int(bbox[1] * self.zoom)
+            w = int((bbox[2] - bbox[0]) * self.zoom)
+            h = int((bbox[3] - bbox[1]) * self.zoom)
             
-            for line in block["lines"]:
-                for span in line.get("spans", []):
-                    text = span.get("text", "").strip()
-                    if not text:
-                        continue
-                    
-                    # bbox를 픽셀 좌표로 변환
-                    bbox = span["bbox"]
-                    x = int(bbox[0] * self.zoom)
-                    y = int(bbox[1] * self.zoom)
-                    w = int((bbox[2] - bbox[0]) * self.zoom)
-                    h = int((bbox[3] - bbox[1]) * self.zoom)
-                    
-                    items.append({
-                        'text': text,
-                        'bbox': {'x': x, 'y': y, 'w': w, 'h': h},
-                        'confidence': 1.0,  # 텍스트 레이어는 완벽한 정확도
-                    })
+            items.append({
+                'text': text,
+                'bbox': {'x': x, 'y': y, 'w': w, 'h': h},
+                'confidence': 1.0,  # 텍스트 레이어는 완벽한 정확도
+            })
         
         return items
 
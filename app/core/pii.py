@@ -1,18 +1,75 @@
-"""PII 탐지 및 마스킹 모듈: 주민번호, 이름"""
+"""PII 탐지 및 마스킹 모듈: 규칙 기반(주민번호, 전화번호 등, app.core.pii_rules), 이름"""
 import re
-from typing import List, Dict, Optional
+from bisect import bisect_left
+from itertools import accumulate
+from typing import List, Dict, Optional, Iterator, Tuple
 import logging
 
+from app.core.spatial import SpatialIndex
+from app.core.pii_rules import PIIRuleSet, get_rule_set
+
 logger = logging.getLogger(__name__)
 
 
+class KeywordAutomaton:
+    """
+    다중 키워드 검색 (Aho-Corasick)
+    
+    텍스트를 한 번 훑어 모든 키워드의 모든 출현(겹치는 출현 포함)을 찾음.
+    """
+    
+    def __init__(self, keywords: List[str]):
+        self.lengths = [len(keyword) for keyword in keywords]
+        # 상태별 전이 / 실패 링크 / 해당 상태에서 끝나는 키워드 id
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        
+        for keyword_id, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(keyword_id)
+        
+        # 실패 링크 (BFS)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+    
+    def finditer(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(키워드 id, 시작 위치)를 끝 위치 순으로 반환"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        lengths = self.lengths
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_id in output[state]:
+                yield keyword_id, end - lengths[keyword_id]
+
+
 class PIIDetector:
     """PII 탐지 및 마스킹"""
     
-    # 주민등록번호 패턴: 6자리-7자리 (하이픈 포함/미포함)
-    RRN_PATTERN = re.compile(
-        r'\b\d{6}[-]?\d{7}\b'
-    )
+    # 탐지 로직 버전 (이름 탐지 등 코드가 바뀌어 결과가 달라지면 올림, 파이프라인 버전/결과 캐시 키에 포함)
+    # 2: 텍스트 레이어 아이템(1x1 bbox)을 좌표 없음으로 보고 리스트 순서 컨텍스트로 판단
+    VERSION = 2
     
     # 이름 패턴: 한글 2-4음절 (단순 패턴)
     NAME_PATTERN = re.compile(
@@ -25,9 +82,29 @@ class PIIDetector:
         '이름:', '성명:', '환자명:', '이름 :', '성명 :',
     ]
     
-    def __init__(self):
-        """PII 탐지기 초기화"""
-        pass
+    # 라벨 아이템 (공백/끝 콜론 제거 후 일치): 자신은 이름이 아니며 오른쪽/아래 값이 이름
+    NAME_LABELS = frozenset(
+        keyword.replace(' ', '').rstrip(':') for keyword in NAME_CONTEXT_KEYWORDS
+    )
+    
+    # 라벨과 값 사이 최대 간격 (라벨 높이 배수)
+    LABEL_RIGHT_GAP = 10.0
+    LABEL_BELOW_GAP = 2.0
+    
+    # 라벨과 값 사이에 따로 인식되는 구분 기호 (건너뛰고 다음 아이템 확인)
+    LABEL_SEPARATORS = frozenset([':', '：', '-', '|'])
+    
+    def __init__(self, rules: Optional[PIIRuleSet] = None):
+        """
+        PII 탐지기 초기화 (컨텍스트 키워드 오토마톤 사전 구성)
+        
+        Args:
+            rules: 규칙 묶음 (None이면 설정의 pii_rules / pii_rules_file)
+        """
+        self.rules = rules if rules is not None else get_rule_set()
+        self._keyword_automaton = KeywordAutomaton(
+            [keyword.lower() for keyword in self.NAME_CONTEXT_KEYWORDS]
+        )
     
     def detect_and_mask(self, items: List[Dict]) -> List[Dict]:
         """
@@ -40,20 +117,22 @@ class PIIDetector:
             마스킹된 아이템 리스트 (is_sensitive, masked_text 필드 추가)
         """
         masked_items = []
+        name_flags = self._detect_names_with_context(items)
         
-        for item in items:
+        for item, is_name in zip(items, name_flags):
             text = item['text']
             masked_item = item.copy()
             
-            # 주민번호 탐지 및 마스킹
-            if self._detect_rrn(text):
+            # 규칙 탐지 및 마스킹 (주민번호, 전화번호 등 결합 스캐너 1회)
+            masked_text = self.rules.mask(text)
+            if masked_text is not None:
                 masked_item['is_sensitive'] = True
-                masked_item['masked_text'] = self._mask_rrn(text)
+                masked_item['masked_text'] = masked_text
                 masked_items.append(masked_item)
                 continue
             
             # 이름 탐지 및 마스킹 (컨텍스트 기반)
-            if self._detect_name_with_context(text, items):
+            if is_name:
                 masked_item['is_sensitive'] = True
                 masked_item['masked_text'] = self._mask_name(text)
                 masked_items.append(masked_item)
@@ -66,89 +145,111 @@ class PIIDetector:
         
         return masked_items
     
-    def _detect_rrn(self, text: str) -> bool:
-        """주민등록번호 탐지"""
-        # 패턴 매칭
-        if not self.RRN_PATTERN.search(text):
-            return False
+    def _detect_names_with_context(self, items: List[Dict]) -> List[bool]:
+        """
+        이름 탐지 (컨텍스트 기반, 페이지 전체 1회 처리)
         
-        # 간단한 유효성 검사 (생년월일 체크는 생략, 패턴만 확인)
-        matches = self.RRN_PATTERN.findall(text)
-        for match in matches:
-            # 하이픈 제거
-            rrn = match.replace('-', '')
-            if len(rrn) == 13:
-                # 첫 6자리는 생년월일 (YYMMDD)
-                # 간단한 범위 체크
-                try:
-                    month = int(rrn[2:4])
-                    day = int(rrn[4:6])
-                    if 1 <= month <= 12 and 1 <= day <= 31:
-                        return True
-                except ValueError:
-                    continue
+        좌표가 있는 아이템은 레이아웃 기준으로 판단함:
+        - 라벨 아이템(성명, 환자명: 등)의 같은 줄 오른쪽 최근접 아이템
+          (같은 줄에 아이템이 없으면 바로 아래 아이템)
+        - 라벨과 이름이 한 아이템으로 인식된 경우 (성명: 홍길동)
+        라벨 아이템 자체는 이름으로 보지 않음.
         
-        return False
-    
-    def _mask_rrn(self, text: str) -> str:
-        """주민등록번호 마스킹"""
-        def mask_match(match):
-            rrn = match.group(0)
-            if '-' in rrn:
-                # 하이픈 포함: 123456-1******
-                return rrn[:7] + '*' * 6
-            else:
-                # 하이픈 없음: 1234561******
-                return rrn[:7] + '*' * 6
+        좌표가 없는 아이템(텍스트 레이어, is_degenerate_bbox)은 리스트 순서 앞뒤 3개 아이템을 공백으로 이은
+        컨텍스트에서 키워드 첫 위치가 아이템 위치와 2단어 이내이면 이름으로 판단함.
         
-        return self.RRN_PATTERN.sub(mask_match, text)
-    
-    def _detect_name_with_context(self, text: str, all_items: List[Dict]) -> bool:
-        """
-        이름 탐지 (컨텍스트 기반)
+        페이지 텍스트를 한 번 이어 붙여 키워드 오토마톤을 한 번만 돌리고, 아이템 위치는
+        순회 인덱스로 추적하며, 이웃 조회는 격자 색인(SpatialIndex)을 사용함.
         
-        Args:
-            text: 탐지할 텍스트
-            all_items: 전체 아이템 리스트 (컨텍스트 확인용)
+        Returns:
+            아이템별 이름 여부 (items 순서)
         """
-        # 이름 패턴 매칭
-        if not self.NAME_PATTERN.match(text.strip()):
-            return False
+        candidates = [bool(self.NAME_PATTERN.match(item['text'].strip())) for item in items]
+        if not any(candidates):
+            return candidates
+        
+        # 페이지 텍스트 (아이템 사이 공백 1칸)와 아이템별 시작/끝 위치
+        texts = [item['text'].lower() for item in items]
+        starts = []
+        ends = []
+        pos = 0
+        for text in texts:
+            starts.append(pos)
+            pos += len(text)
+            ends.append(pos)
+            pos += 1
+        page_text = ' '.join(texts)
         
-        # 컨텍스트 확인: 이름 패턴 앞뒤 아이템에서 키워드 검색
-        text_lower = text.lower()
+        # 위치 p 이전의 공백 수 (단어 거리 계산용)
+        spaces_before = [0]
+        spaces_before.extend(accumulate(char == ' ' for char in page_text))
         
-        # 현재 아이템 인덱스 찾기
-        current_idx = None
-        for idx, item in enumerate(all_items):
-            if item['text'] == text:
-                current_idx = idx
-                break
+        # 키워드별 출현 시작 위치 (오름차순)
+        keyword_lengths = self._keyword_automaton.lengths
+        occurrences = [[] for _ in keyword_lengths]
+        for keyword_id, match_start in self._keyword_automaton.finditer(page_text):
+            occurrences[keyword_id].append(match_start)
         
-        if current_idx is None:
+        def keyword_near(name_pos: int, window_start: int, window_end: int) -> bool:
+            """[window_start, window_end) 안 각 키워드의 첫 출현이 name_pos와 2단어 이내인지"""
+            name_words = spaces_before[name_pos]
+            for keyword_id, positions in enumerate(occurrences):
+                cursor = bisect_left(positions, window_start)
+                if cursor == len(positions):
+                    continue
+                # 같은 키워드는 길이가 같으므로 첫 후보만 확인
+                keyword_pos = positions[cursor]
+                if keyword_pos + keyword_lengths[keyword_id] > window_end:
+                    continue
+                # 키워드와 이름 사이 거리 (단어 수)
+                if abs(name_words - spaces_before[keyword_pos]) <= 2:  # 2단어 이내
+                    return True
             return False
         
-        # 앞뒤 3개 아이템 확인
-        context_start = max(0, current_idx - 3)
-        context_end = min(len(all_items), current_idx + 4)
-        context_items = all_items[context_start:context_end]
+        index = SpatialIndex(items)
+        n = len(items)
+        flags = [False] * n
         
-        # 컨텍스트에서 키워드 검색
-        context_text = ' '.join([item['text'] for item in context_items]).lower()
+        # 레이아웃 기준: 라벨의 오른쪽/아래 최근접 아이템
+        for idx in range(n):
+            if not index.has_box(idx) or not self._is_name_label(items[idx]['text']):
+                continue
+            label_height = index.boxes[idx][3] - index.boxes[idx][1]
+            
+            neighbor = index.right_of(idx, max_gap=label_height * self.LABEL_RIGHT_GAP)
+            while neighbor is not None and items[neighbor]['text'].strip() in self.LABEL_SEPARATORS:
+                neighbor = index.right_of(neighbor, max_gap=label_height * self.LABEL_RIGHT_GAP)
+            if neighbor is None:
+                # 같은 줄에 값이 없으면 라벨 바로 아래 (세로 배치 양식)
+                neighbor = index.below(idx, max_gap=label_height * self.LABEL_BELOW_GAP)
+            
+            if (
+                neighbor is not None
+                and candidates[neighbor]
+                and not self._is_name_label(items[neighbor]['text'])
+            ):
+                flags[neighbor] = True
         
-        for keyword in self.NAME_CONTEXT_KEYWORDS:
-            if keyword.lower() in context_text:
-                # 키워드 근처에 이름 패턴이 있으면 이름으로 판단
-                keyword_pos = context_text.find(keyword.lower())
-                name_pos = context_text.find(text_lower)
-                
-                # 키워드와 이름 사이 거리 (단어 수)
-                distance = abs(context_text[:name_pos].count(' ') - context_text[:keyword_pos].count(' '))
-                
-                if distance <= 2:  # 2단어 이내
-                    return True
+        for idx in range(n):
+            if not candidates[idx] or flags[idx]:
+                continue
+            if index.has_box(idx):
+                # 라벨과 이름이 한 아이템 (성명: 홍길동)
+                flags[idx] = (
+                    not self._is_name_label(items[idx]['text'])
+                    and keyword_near(starts[idx], starts[idx], ends[idx])
+                )
+            else:
+                # 좌표 없음: 리스트 순서 앞뒤 3개 아이템 컨텍스트
+                window_start = starts[max(0, idx - 3)]
+                window_end = ends[min(n, idx + 4) - 1]
+                flags[idx] = keyword_near(starts[idx], window_start, window_end)
         
-        return False
+        return flags
+    
+    def _is_name_label(self, text: str) -> bool:
+        """이름 라벨 아이템 여부 (성명, 성명:, 환자명 : 등)"""
+        return text.strip().replace(' ', '').rstrip(':').strip() in self.NAME_LABELS
     
     def _mask_name(self, text: str) -> str:
         """이름 마스킹"""
@@ -0,0 +1,376 @@
+"""PII 규칙 레지스트리: 정규식 규칙을 이름 그룹 하나의 결합 스캐너로 컴파일 (규칙 수와 무관하게 아이템당 1회 스캔)"""
+import hashlib
+import json
+import logging
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+Validator = Callable[[str], bool]
+Masker = Callable[[str], str]
+
+DIGITS = '0123456789'
+
+
+# ---------------------------------------------------------------------------
+# 검증기: 정규식 일치 후 오탐을 거르는 함수 (이름 -> 함수, 규칙 파일에서 이름으로 참조)
+# ---------------------------------------------------------------------------
+
+def _digits(text: str) -> str:
+    return ''.join(char for char in text if char.isdigit())
+
+
+def validate_birthdate(text: str) -> bool:
+    """주민등록번호 앞 6자리(YYMMDD)의 월/일 범위 확인"""
+    digits = _digits(text)
+    if len(digits) != 13:
+        return False
+    month = int(digits[2:4])
+    day = int(digits[4:6])
+    return 1 <= month <= 12 and 1 <= day <= 31
+
+
+def validate_phone(text: str) -> bool:
+    """국내 전화번호 자릿수 확인 (02 지역번호 9~10자리, 그 외 10~11자리)"""
+    digits = _digits(text)
+    if not digits.startswith('0'):
+        return False
+    if digits.startswith('02'):
+        return 9 <= len(digits) <= 10
+    return 10 <= len(digits) <= 11
+
+
+def validate_health_insurance(text: str) -> bool:
+    """건강보험증 번호 (11자리, 0으로 시작하지 않음 -> 휴대전화 번호와 구분)"""
+    digits = _digits(text)
+    return len(digits) == 11 and digits[0] != '0'
+
+
+VALIDATORS: Dict[str, Validator] = {
+    'birthdate': validate_birthdate,
+    'phone': validate_phone,
+    'health_insurance': validate_health_insurance,
+}
+
+
+# ---------------------------------------------------------------------------
+# 마스커: 일치 부분 -> 마스킹 문자열 (이름 + 인자로 생성, 규칙 파일에서 {"type": ..., ...}로 참조)
+# ---------------------------------------------------------------------------
+
+def mask_keep_prefix(keep: int = 0, stars: Optional[int] = None) -> Masker:
+    """앞 keep글자만 남기고 나머지를 *로 (stars가 주어지면 * 개수 고정, 원래 길이 노출 방지)"""
+    def masker(text: str) -> str:
+        count = stars if stars is not None else max(len(text) - keep, 0)
+        return text[:keep] + '*' * count
+    return masker
+
+
+def mask_digits(keep_head: int = 0, keep_tail: int = 0) -> Masker:
+    """숫자만 마스킹 (앞 keep_head, 뒤 keep_tail개 숫자와 하이픈 등 구분 기호는 유지)"""
+    def masker(text: str) -> str:
+        total = sum(char.isdigit() for char in text)
+        result = []
+        seen = 0
+        for char in text:
+            if char.isdigit():
+                seen += 1
+                if keep_head < seen <= total - keep_tail:
+                    char = '*'
+            result.append(char)
+        return ''.join(result)
+    return masker
+
+
+def mask_keep_words(keep: int = 1) -> Masker:
+    """앞 keep개 단어(공백 구분)만 남기고 이후 글자를 *로 (공백 유지)"""
+    def masker(text: str) -> str:
+        words = text.split(' ')
+        masked = [
+            word if idx < keep else '*' * len(word)
+            for idx, word in enumerate(words)
+        ]
+        return ' '.join(masked)
+    return masker
+
+
+def mask_phone() -> Masker:
+    """전화번호 국번 마스킹 (지역번호 02는 2자리, 그 외 3자리와 뒤 4자리 유지)"""
+    area_masker = mask_digits(keep_head=2, keep_tail=4)
+    other_masker = mask_digits(keep_head=3, keep_tail=4)
+
+    def masker(text: str) -> str:
+        return area_masker(text) if text.startswith('02') else other_masker(text)
+    return masker
+
+
+MASKERS: Dict[str, Callable[..., Masker]] = {
+    'keep_prefix': mask_keep_prefix,
+    'digits': mask_digits,
+    'keep_words': mask_keep_words,
+    'phone': mask_phone,
+}
+
+
+
+class PIIRule:
+    """PII 규칙: 정규식 + 검증기 + 마스커"""
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        masker: Masker,
+        validator: Optional[Validator] = None,
+        ignore_case: bool = False,
+        spec: Optional[str] = None,
+        first_chars: Optional[str] = None,
+    ):
+        """
+        Args:
+            name: 규칙 이름 (결합 스캐너의 그룹 이름, 식별자 형식)
+            pattern: 정규식 (결합 스캐너에 그대로 들어가므로 이름 그룹 사용 금지)
+            masker: 일치 부분 -> 마스킹 문자열
+            validator: 일치 부분 검증 (False면 해당 일치는 무시)
+            ignore_case: 대소문자 무시
+            spec: 규칙 구성 문자열 (지문 계산용, 생략 시 정규식)
+            first_chars: 일치가 시작될 수 있는 글자 전체 (모든 활성 규칙에 있으면 결합 스캐너가
+                         이 글자 위치에서만 규칙을 시도하여 일반 텍스트를 빠르게 건너뜀)
+        """
+        if not name.isidentifier():
+            raise ValueError(f"PII 규칙 이름은 식별자 형식이어야 합니다: {name!r}")
+        self.name = name
+        self.pattern = f"(?i:{pattern})" if ignore_case else pattern
+        self.regex = re.compile(self.pattern)
+        if self.regex.groupindex:
+            raise ValueError(f"PII 규칙 정규식에 이름 그룹을 사용할 수 없습니다: {name}")
+        self.masker = masker
+        self.validator = validator
+        self.spec = spec or self.pattern
+        self.first_chars = first_chars
+
+    def accepts(self, text: str) -> bool:
+        """검증기 통과 여부 (검증기가 없으면 항상 True)"""
+        return self.validator is None or self.validator(text)
+
+
+# 기본 제공 규칙 (등록 순서 = 같은 위치에서 일치할 때 우선순위)
+BUILTIN_RULES: Dict[str, PIIRule] = {
+    rule.name: rule
+    for rule in (
+        # 주민등록번호: 6자리-7자리 (하이픈 포함/미포함), 앞 7글자 + ****** (123456-******, 1234561******)
+        PIIRule(
+            'rrn',
+            r'\b\d{6}-?\d{7}\b',
+            masker=mask_keep_prefix(7, stars=6),
+            validator=validate_birthdate,
+            first_chars=DIGITS,
+        ),
+        # 건강보험증 번호: 11자리 (1-2345678901 형식 포함), 앞 3자리 유지
+        PIIRule(
+            'health_insurance',
+            r'\b[1-9]-?\d{10}\b',
+            masker=mask_digits(keep_head=3),
+            validator=validate_health_insurance,
+            first_chars=DIGITS,
+        ),
+        # 전화번호: 지역번호/휴대전화 (하이픈, 점, 공백 구분), 국번 마스킹 (010-****-5678, 02-***-4567)
+        PIIRule(
+            'phone',
+            r'\b0\d{1,2}[-. ]?\d{3,4}[-. ]?\d{4}\b',
+            masker=mask_phone(),
+            validator=validate_phone,
+            first_chars='0',
+        ),
+        # 환자 등록번호/차트 번호 (라벨과 함께 인식된 경우, 병원별 형식은 규칙 파일로 교체), 뒤 2자리 유지
+        PIIRule(
+            'chart_id',
+            r'(?:등록번호|차트번호|환자번호|MRN)\s*[:：]?\s*[A-Za-z]{0,3}-?\d{5,10}\b',
+            masker=mask_digits(keep_tail=2),
+            ignore_case=True,
+            first_chars='등차환Mm',
+        ),
+        # 도로명 주소: 시/도 + 시/군/구 (+ 구) + 도로명 + 건물번호, 시/도와 시/군/구만 유지
+        PIIRule(
+            'address',
+            r'(?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충청|충북|충남|전라|전북|전남|경상|경북|경남|제주)'
+            r'[가-힣]*\s+[가-힣]+(?:시|군|구)(?:\s+[가-힣]+구)?\s+[가-힣0-9]+(?:로|길)\s*\d+(?:-\d+)?',
+            masker=mask_keep_words(2),
+            first_chars='서부대인광울세경강충전제',
+        ),
+    )
+}
+
+
+class PIIRuleSet:
+    """
+    활성 규칙 묶음: 모든 규칙을 (?P<이름>...)|... 정규식 하나로 컴파일한 결합 스캐너
+
+    텍스트를 한 번 훑으며 일치한 그룹 이름으로 규칙을 찾아 검증/마스킹함.
+    같은 위치에서 먼저 등록된 규칙이 일치했지만 검증에 실패하면 그 위치에서만
+    나머지 규칙을 개별 정규식으로 다시 시도함 (드문 경로).
+    """
+
+    def __init__(self, rules: Iterable[PIIRule]):
+        self.rules: List[PIIRule] = list(rules)
+        self._by_name = {rule.name: rule for rule in self.rules}
+        if len(self._by_name) != len(self.rules):
+            raise ValueError("PII 규칙 이름이 중복되었습니다")
+        self._scanner = None
+        if self.rules:
+            pattern = '|'.join(f"(?P<{rule.name}>{rule.pattern})" for rule in self.rules)
+            if all(rule.first_chars for rule in self.rules):
+                # 시작 글자 선검사: 해당 글자가 아닌 위치에서는 규칙 분기를 시도하지 않음
+                first_chars = ''.join(sorted(set(''.join(rule.first_chars for rule in self.rules))))
+                pattern = f"(?=[{re.escape(first_chars)}])(?:{pattern})"
+            self._scanner = re.compile(pattern)
+
+    @property
+    def names(self) -> List[str]:
+        return [rule.name for rule in self.rules]
+
+    def fingerprint(self) -> str:
+        """규칙 구성 지문 (파이프라인 버전/결과 캐시 키용, 기본 제공 규칙/탐지 코드 변경은 PIIDetector.VERSION으로 반영)"""
+        raw = '\n'.join(f"{rule.name}={rule.spec}" for rule in self.rules)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:8]
+
+    def scan(self, text: str) -> List[Tuple[PIIRule, int, int]]:
+        """
+        텍스트에서 규칙 일치 구간 탐지
+
+        Returns:
+            (규칙, 시작, 끝) 리스트 (위치 순, 구간 겹침 없음)
+        """
+        if self._scanner is None:
+            return []
+        spans = []
+        pos = 0
+        while True:
+            match = self._scanner.search(text, pos)
+            if match is None:
+                return spans
+            start = match.start()
+            rule = self._by_name[match.lastgroup]
+            end = match.end()
+            if not rule.accepts(match.group()):
+                rule, end = self._fallback(text, start, rule)
+                if rule is None:
+                    pos = start + 1
+                    continue
+            spans.append((rule, start, end))
+            pos = max(end, start + 1)
+
+    def _fallback(self, text: str, start: int, failed: PIIRule) -> Tuple[Optional[PIIRule], int]:
+        """검증 실패 위치에서 나머지 규칙 개별 시도"""
+        for rule in self.rules:
+            if rule is failed:
+                continue
+            match = rule.regex.match(text, start)
+            if match and match.end() > start and rule.accepts(match.group()):
+                return rule, match.end()
+        return None, start
+
+    def mask(self, text: str) -> Optional[str]:
+        """
+        규칙 일치 구간을 마스킹한 텍스트
+
+        Returns:
+            마스킹된 텍스트 (일치 없으면 None)
+        """
+        spans = self.scan(text)
+        if not spans:
+            return None
+        parts = []
+        pos = 0
+        for rule, start, end in spans:
+            parts.append(text[pos:start])
+            parts.append(rule.masker(text[start:end]))
+            pos = end
+        parts.append(text[pos:])
+        return ''.join(parts)
+
+
+def rule_from_config(config: Dict) -> PIIRule:
+    """
+    규칙 파일 항목 -> PIIRule
+
+    {"name": "chart_id", "pattern": "\\\\bC\\\\d{8}\\\\b", "first_chars": "C",
+     "masker": {"type": "digits", "keep_tail": 2}, "ignore_case": false}
+    masker는 MASKERS 이름 문자열 또는 {"type": 이름, 인자...}, 생략 시 전체 마스킹.
+    validator는 VALIDATORS 이름 (생략 가능).
+    """
+    name = config['name']
+    masker_config = config.get('masker', 'keep_prefix')
+    if isinstance(masker_config, str):
+        masker_config = {'type': masker_config}
+    masker_args = {key: value for key, value in masker_config.items() if key != 'type'}
+    if masker_config['type'] not in MASKERS:
+        raise ValueError(f"알 수 없는 PII 마스커: {masker_config['type']} (규칙 {name})")
+
+    validator = None
+    if config.get('validator'):
+        if config['validator'] not in VALIDATORS:
+            raise ValueError(f"알 수 없는 PII 검증기: {config['validator']} (규칙 {name})")
+        validator = VALIDATORS[config['validator']]
+
+    return PIIRule(
+        name,
+        config['pattern'],
+        masker=MASKERS[masker_config['type']](**masker_args),
+        validator=validator,
+        ignore_case=bool(config.get('ignore_case', False)),
+        spec=json.dumps(config, sort_keys=True, ensure_ascii=False),
+        first_chars=config.get('first_chars'),
+    )
+
+
+def load_rules_file(path: str) -> List[Tuple[PIIRule, bool]]:
+    """
+    규칙 파일(JSON 배열) 로드
+
+    Returns:
+        (규칙, 활성 여부) 리스트 (항목의 "enabled" 생략 시 활성)
+    """
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    return [(rule_from_config(entry), bool(entry.get('enabled', True))) for entry in entries]
+
+
+def build_rule_set(enabled: str, rules_file: Optional[str] = None) -> PIIRuleSet:
+    """
+    설정으로 활성 규칙 묶음 구성
+
+    Args:
+        enabled: 활성 규칙 이름 (쉼표 구분, 기본 제공 규칙 또는 규칙 파일 규칙)
+        rules_file: 추가/교체 규칙 JSON 파일 (기본 제공 규칙과 이름이 같으면 교체,
+                    파일 규칙은 enabled에 없어도 항목의 enabled 값에 따라 활성)
+    """
+    registry: Dict[str, PIIRule] = dict(BUILTIN_RULES)
+    active = [name.strip() for name in enabled.split(',') if name.strip()]
+
+    if rules_file:
+        for rule, rule_enabled in load_rules_file(rules_file):
+            registry[rule.name] = rule
+            if rule_enabled and rule.name not in active:
+                active.append(rule.name)
+
+    unknown = [name for name in active if name not in registry]
+    if unknown:
+        raise ValueError(f"알 수 없는 PII 규칙: {', '.join(unknown)}")
+
+    # 같은 위치 일치 시 우선순위는 등록 순서 (기본 제공 규칙 -> 규칙 파일)
+    return PIIRuleSet(rule for name, rule in registry.items() if name in active)
+
+
+_default_rule_set: Optional[PIIRuleSet] = None
+
+
+def get_rule_set() -> PIIRuleSet:
+    """settings.pii_rules / settings.pii_rules_file 기준 규칙 묶음 (프로세스당 1회 구성)"""
+    global _default_rule_set
+    if _default_rule_set is None:
+        _default_rule_set = build_rule_set(settings.pii_rules, settings.pii_rules_file)
+        logger.info(f"PII 규칙: {', '.join(_default_rule_set.names)}")
+    return _default_rule_set
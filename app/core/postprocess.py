@@ -28,3 +28,23 @@ class PostProcessor:
         
         return {'x': x, 'y': y, 'w': w, 'h': h}
 
+    
+    @staticmethod
+    def scale_bbox(bbox: Dict, scale_x: float, scale_y: float) -> Dict:
+        """
+        bbox 좌표 배율 변환 (축소 이미지 좌표 -> 원본 이미지 좌표)
+        
+        Args:
+            bbox: {'x': int, 'y': int, 'w': int, 'h': int}
+            scale_x: 가로 배율
+            scale_y: 세로 배율
+            
+        Returns:
+            변환된 bbox
+        """
+        return {
+            'x': int(round(bbox['x'] * scale_x)),
+            'y': int(round(bbox['y'] * scale_y)),
+            'w': int(round(bbox['w'] * scale_x)),
+            'h': int(round(bbox['h'] * scale_y)),
+        }
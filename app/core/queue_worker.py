@@ -0,0 +1,124 @@
+"""DB 큐 워커 모듈: job_payloads에 저장된 작업을 가져와 OCR 처리"""
+from typing import Optional, Set
+import asyncio
+import logging
+import os
+import tempfile
+
+from app.config.settings import settings
+from app.core.dao import SessionLocal, JobDAO, JobPayloadDAO
+from app.core.async_dao import AsyncSessionLocal, AsyncJobDAO
+from app.core.jobs import execute_job, mark_job_failed
+from app.core.leases import LeaseLostError, get_worker_id, hold_lease, run_reaper
+from app.core.ocr_pool import warm_up_ocr_pool, shutdown_ocr_pool
+
+logger = logging.getLogger(__name__)
+
+
+def claim_job(owner: str):
+    """
+    대기 작업 1건에 리스를 걸어 processing으로 전환하고 입력 파일을 임시 파일로 기록
+    
+    Returns:
+        (job_id, 임시 파일 경로) 또는 대기 작업이 없으면 None
+    """
+    os.makedirs(settings.temp_dir, exist_ok=True)
+    db = SessionLocal()
+    path = None
+    try:
+        job = JobDAO.claim_next(db, owner, settings.ocr_lease_seconds)
+        if job is None:
+            db.commit()
+            return None
+        job_id = job.id
+        
+        # 입력 파일은 청크 단위로 읽어 바로 기록 (파일 전체를 메모리에 올리지 않음)
+        fd, path = tempfile.mkstemp(prefix="job-", dir=settings.temp_dir)
+        with os.fdopen(fd, "wb") as f:
+            JobPayloadDAO.write_to_file(db, job_id, f)
+        db.commit()
+    except Exception:
+        db.rollback()
+        if path is not None:
+            os.remove(path)
+        raise
+    finally:
+        db.close()
+    
+    return job_id, path
+
+
+async def process_claimed_job(job_id, path: str, owner: str) -> None:
+    """
+    가져온 작업을 리스를 유지하며 처리한 뒤 입력 파일(DB/임시 파일) 정리
+    
+    DB 접근은 비동기 세션 또는 스레드의 짧은 동기 세션으로만 하므로 OCR 동안 세션을 잡고 있지
+    않고, 이벤트 루프(다른 작업 처리, 리스 하트비트)도 막지 않음.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            job = await AsyncJobDAO.get_by_id(db, job_id)
+        async with hold_lease(job_id, owner):
+            page_count = await execute_job(job, path, owner=owner, delete_payload=True)
+        logger.info(f"작업 완료: {job_id} ({page_count}페이지)")
+    except LeaseLostError as e:
+        # 리스가 회수되어 다른 워커가 처리 중일 수 있으므로 결과/상태를 기록하지 않음
+        logger.warning(f"{e}, 결과를 버림")
+    except Exception as e:
+        logger.error(f"작업 처리 중 오류: {job_id} {e}", exc_info=True)
+        await asyncio.to_thread(mark_job_failed, job_id, e, delete_payload=True)
+    finally:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+async def run_queue_worker(concurrency: Optional[int] = None, poll_interval: Optional[float] = None) -> None:
+    """
+    DB 큐 소비 루프
+    
+    동시에 최대 concurrency건을 처리하며, 큐가 비면 poll_interval초 대기 후 다시 조회함.
+    작업 선점은 FOR UPDATE SKIP LOCKED이므로 워커를 여러 대 띄워도 안전함.
+    처리 중 작업은 하트비트로 리스를 연장하고, 죽은 워커의 만료 리스는 회수 루프가 재대기시킴.
+    
+    Args:
+        concurrency: 동시 처리 작업 수 (기본값: settings.ocr_workers)
+        poll_interval: 빈 큐 폴링 간격 (기본값: settings.ocr_queue_poll_interval)
+    """
+    concurrency = max(1, concurrency or settings.ocr_workers)
+    poll_interval = poll_interval or settings.ocr_queue_poll_interval
+    loop = asyncio.get_running_loop()
+    running: Set[asyncio.Task] = set()
+    owner = get_worker_id()
+    
+    await warm_up_ocr_pool()
+    reaper = asyncio.create_task(run_reaper())
+    logger.info(f"DB 큐 워커 시작 (owner={owner}, concurrency={concurrency})")
+    
+    try:
+        while True:
+            if len(running) >= concurrency:
+                await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            
+            try:
+                claimed = await loop.run_in_executor(None, claim_job, owner)
+            except Exception as e:
+                logger.error(f"작업 조회 실패: {e}", exc_info=True)
+                claimed = None
+            
+            if claimed is None:
+                await asyncio.sleep(poll_interval)
+                continue
+            
+            job_id, path = claimed
+            logger.info(f"작업 시작: {job_id}")
+            task = asyncio.create_task(process_claimed_job(job_id, path, owner))
+            running.add(task)
+            task.add_done_callback(running.discard)
+    finally:
+        reaper.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        shutdown_ocr_pool()
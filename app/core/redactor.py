@@ -0,0 +1,369 @@
+"""민감정보 가림 처리 모듈: OCR 결과의 is_sensitive bbox를 원본 문서에 검은 상자로 가려 PDF/PNG로 출력"""
+import fitz  # PyMuPDF
+import io
+import logging
+import os
+import tempfile
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.core.pdf_processor import PDFProcessor
+from app.core.spatial import is_degenerate_bbox
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 출력 형식 -> (media type, 확장자)
+REDACT_FORMATS = {
+    "pdf": ("application/pdf", "pdf"),
+    "png": ("application/zip", "zip"),
+}
+
+# 스트리밍 응답 청크 크기
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# PDF 출력 첫 증분 저장 단위 (페이지 수, 이후 묶음은 저장한 페이지 수만큼 커짐)
+PDF_FLUSH_PAGES = 32
+
+# 가림 상자 색 (검정)
+REDACT_FILL = (0, 0, 0)
+
+# 원본 파일 확장자 -> PyMuPDF 문서 형식 (업로드 스풀 파일에는 확장자가 없음)
+DOCUMENT_FILETYPES = {
+    ".pdf": "pdf",
+    ".png": "png",
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+}
+
+
+def parse_render_mode(pipeline_version: Optional[str]) -> str:
+    """작업의 파이프라인 버전 문자열에서 PDF 렌더링 모드 추출 (없으면 현재 설정)"""
+    parts = (pipeline_version or "").split(":")
+    for mode in (PDFProcessor.RENDER_SCANNED, PDFProcessor.RENDER_EMBEDDED):
+        if mode in parts:
+            return mode
+    return settings.ocr_render_mode
+
+
+def document_filetype(filename: Optional[str]) -> Optional[str]:
+    """원본 파일명 확장자로 PyMuPDF 문서 형식 결정 (pdf, png, jpeg, 그 외는 None)"""
+    return DOCUMENT_FILETYPES.get(os.path.splitext(filename or "")[1].lower())
+
+
+def open_document(
+    source: str,
+    content_type: Optional[str],
+    filetype: Optional[str] = None,
+) -> fitz.Document:
+    """
+    원본 파일을 PDF 문서로 열기 (이미지는 1페이지 PDF로 변환해야 가림 주석 적용 가능)
+
+    Args:
+        filetype: PyMuPDF 문서 형식 (document_filetype, 확장자 없는 스풀 파일은 필수)
+    """
+    doc = fitz.open(source, filetype=filetype)
+    if content_type == "application/pdf" or doc.is_pdf:
+        return doc
+    try:
+        return fitz.open("pdf", doc.convert_to_pdf())
+    finally:
+        doc.close()
+
+
+def _text_span_rects(page: fitz.Page) -> Dict[str, List[fitz.Rect]]:
+    """텍스트 레이어 span 영역을 텍스트별로 추출 순서대로 모음 (PDFProcessor.iter_text_spans)"""
+    spans: Dict[str, List[fitz.Rect]] = {}
+    for text, bbox in PDFProcessor.iter_text_spans(page):
+        spans.setdefault(text, []).append(fitz.Rect(bbox))
+    return spans
+
+
+def _nearest_hit(hits: List[fitz.Rect], cx: float, cy: float) -> fitz.Rect:
+    """검색 결과 중 중심이 (cx, cy)에 가장 가까운 영역"""
+    return min(hits, key=lambda rect: (rect.x0 + rect.x1 - 2 * cx) ** 2 + (rect.y0 + rect.y1 - 2 * cy) ** 2)
+
+
+def page_redaction_rects(
+    page: fitz.Page,
+    page_result: Dict,
+    is_image_source: bool,
+    render_mode: str,
+) -> List[fitz.Rect]:
+    """
+    페이지의 민감 아이템 가림 영역 (PDF 좌표)
+
+    OCR 결과 좌표계는 아이템 출처에 따라 다름:
+    - 이미지 파일 / scanned 모드로 렌더링된 페이지: 페이지 픽셀 좌표 (페이지 크기 비율로 변환)
+    - embedded 모드 임베딩 이미지: 이미지 픽셀 좌표 (아이템이 들어가는 배치 이미지마다 변환,
+      어느 이미지에서 나온 아이템인지 결과에 없으므로 후보 이미지를 모두 가림,
+      들어가는 이미지가 없으면 페이지 텍스트 검색 결과 중 bbox 위치에 가장 가까운 영역)
+    - 텍스트 레이어 아이템: 좌표 없음 (bbox 0) -> 같은 텍스트의 n번째 아이템은 n번째 텍스트 span
+      (결과 아이템은 span 추출 순서로 저장되므로, 페이지에 같은 텍스트가 여러 번 있어도 해당 span만 가림)
+    """
+    items = page_result.get('items') or []
+    if not any(item.get('is_sensitive') for item in items):
+        return []
+
+    page_width = page_result.get('width') or 0
+    page_height = page_result.get('height') or 0
+    raster_page = is_image_source or (
+        render_mode == PDFProcessor.RENDER_SCANNED
+        and not page.get_text("text").strip()
+        and bool(page.get_images())
+    )
+    images = [] if raster_page else [
+        info for info in page.get_image_info()
+        if info.get('width') and info.get('height')
+    ]
+
+    rects: List[fitz.Rect] = []
+    text_spans: Optional[Dict[str, List[fitz.Rect]]] = None
+    occurrences: Dict[str, int] = {}  # 텍스트 레이어 아이템 텍스트 -> 지금까지 나온 수
+    for item in items:
+        bbox = item['bbox']
+        if is_degenerate_bbox(bbox):
+            occurrence = occurrences.get(item['text'], 0)
+            occurrences[item['text']] = occurrence + 1
+            if not item.get('is_sensitive'):
+                continue
+            if text_spans is None:
+                text_spans = _text_span_rects(page)
+            spans = text_spans.get(item['text']) or []
+            if occurrence < len(spans):
+                rects.append(spans[occurrence])
+            else:
+                logger.warning(f"가림 위치를 찾지 못한 민감 아이템 (페이지 {page.number})")
+            continue
+
+        if not item.get('is_sensitive'):
+            continue
+
+        x0, y0 = bbox['x'], bbox['y']
+        x1, y1 = x0 + bbox['w'], y0 + bbox['h']
+
+        if raster_page:
+            if not page_width or not page_height:
+                continue
+            # 렌더링 좌표는 회전 적용 후 페이지 기준 -> 주석 좌표(회전 전)로 변환
+            sx = page.rect.width / page_width
+            sy = page.rect.height / page_height
+            rects.append(fitz.Rect(x0 * sx, y0 * sy, x1 * sx, y1 * sy) * page.derotation_matrix)
+            continue
+
+        # 임베딩 이미지 좌표: 아이템이 들어가는 크기의 배치 이미지마다 변환
+        matched = False
+        for info in images:
+            if x1 > info['width'] or y1 > info['height']:
+                continue
+            placement = fitz.Rect(info['bbox'])
+            sx = placement.width / info['width']
+            sy = placement.height / info['height']
+            rects.append(fitz.Rect(
+                placement.x0 + x0 * sx,
+                placement.y0 + y0 * sy,
+                placement.x0 + x1 * sx,
+                placement.y0 + y1 * sy,
+            ))
+            matched = True
+        if not matched:
+            hits = page.search_for(item['text'])
+            if not hits:
+                logger.warning(f"가림 위치를 찾지 못한 민감 아이템 (페이지 {page.number})")
+                continue
+            # bbox를 페이지 픽셀 좌표로 보고 가장 가까운 검색 결과 하나만 가림
+            sx = page.rect.width / page_width if page_width else 0
+            sy = page.rect.height / page_height if page_height else 0
+            rects.append(_nearest_hit(hits, (x0 + x1) / 2 * sx, (y0 + y1) / 2 * sy))
+
+    return rects
+
+
+def redact_page(page: fitz.Page, page_result: Dict, is_image_source: bool, render_mode: str) -> int:
+    """
+    페이지에 가림 주석을 추가하고 적용 (아래 텍스트 삭제, 이미지 픽셀 검게 덮어씀)
+
+    Returns:
+        가린 영역 수
+    """
+    rects = page_redaction_rects(page, page_result, is_image_source, render_mode)
+    if not rects:
+        return 0
+    for rect in rects:
+        page.add_redact_annot(rect, fill=REDACT_FILL)
+    page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_PIXELS)
+    return len(rects)
+
+
+def _page_results(pages: List[Dict]) -> Dict[int, Dict]:
+    """페이지 인덱스 -> 작업 결과 페이지"""
+    return {page_result.get('page_index', idx): page_result for idx, page_result in enumerate(pages)}
+
+
+def _iter_redacted_pages(
+    doc: fitz.Document,
+    pages: List[Dict],
+    is_image_source: bool,
+    render_mode: str,
+) -> Iterator[Tuple[fitz.Page, Optional[Dict]]]:
+    """페이지 순서대로 가림 처리 후 (페이지, 결과) 반환 (결과에 없는 페이지는 그대로)"""
+    results = _page_results(pages)
+    for page_index in range(doc.page_count):
+        page = doc[page_index]
+        page_result = results.get(page_index)
+        if page_result is not None:
+            redact_page(page, page_result, is_image_source, render_mode)
+        yield page, page_result
+
+
+class _ZipStream(io.RawIOBase):
+    """zipfile 출력 버퍼 (탐색 불가 스트림으로 동작, 쓰인 바이트를 drain으로 꺼냄)"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_redacted_png_zip(
+    source: str,
+    content_type: Optional[str],
+    pages: List[Dict],
+    render_mode: str,
+    dpi: Optional[int] = None,
+    filetype: Optional[str] = None,
+) -> Iterator[bytes]:
+    """
+    가림 처리된 페이지 PNG 묶음(zip)을 페이지 단위로 생성
+
+    페이지마다 가림 -> 렌더링 -> zip 항목 기록 후 바로 내보내므로 메모리에는 한 페이지의
+    이미지만 올라가고, 클라이언트는 첫 페이지부터 내려받음.
+
+    Args:
+        pages: 작업 결과 페이지 (page_index, width, height, items[bbox, is_sensitive, text])
+        dpi: 렌더링 DPI (None이면 settings.ocr_dpi, 이미지 파일은 원본 해상도)
+        filetype: PyMuPDF 문서 형식 (open_document 참고)
+    """
+    is_image_source = content_type != "application/pdf"
+    zoom = (dpi or settings.ocr_dpi) / 72.0
+    doc = open_document(source, content_type, filetype)
+    stream = _ZipStream()
+    try:
+        with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_STORED) as archive:
+            for page, page_result in _iter_redacted_pages(doc, pages, is_image_source, render_mode):
+                if is_image_source and page_result and page_result.get('width'):
+                    # 원본 이미지 픽셀 크기로 렌더링 (OCR 결과 width 기준)
+                    scale = page_result['width'] / page.rect.width
+                    matrix = fitz.Matrix(scale, scale)
+                else:
+                    matrix = fitz.Matrix(zoom, zoom)
+                pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False)
+                archive.writestr(f"page_{page.number + 1:04d}.png", pix.tobytes("png"))
+                pix = None
+                yield stream.drain()
+        yield stream.drain()
+    finally:
+        doc.close()
+
+
+def iter_redacted_pdf(
+    source: str,
+    content_type: Optional[str],
+    pages: List[Dict],
+    render_mode: str,
+    filetype: Optional[str] = None,
+) -> Iterator[bytes]:
+    """
+    가림 처리된 PDF를 페이지 묶음 단위로 생성
+
+    가림 처리한 페이지 묶음을 새 출력 문서로 복사(insert_pdf)하고 임시 파일(settings.temp_dir)에
+    증분 저장한 뒤 새로 덧붙은 바이트만 내보냄. 증분 저장은 바뀐 객체와 상호 참조 테이블을 파일 끝에
+    추가하므로 앞서 보낸 바이트는 바뀌지 않고, 클라이언트는 첫 묶음부터 내려받음.
+
+    - PyMuPDF 증분 저장은 문서를 연 뒤의 변경을 모두 다시 쓰므로 묶음마다 출력 문서를 저장한 파일로,
+      원본 문서도 다시 열어 메모리에는 한 묶음만 올라감
+    - 증분 저장 1회 비용이 파일 크기에 비례하므로 묶음은 PDF_FLUSH_PAGES부터 시작해 저장한 페이지 수만큼
+      커짐 (저장 횟수는 페이지 수의 로그, 가장 큰 묶음은 문서의 절반)
+    - 가려진 텍스트/이미지 픽셀은 가림 처리된 페이지 내용만 복사되므로 출력 파일에 남지 않음
+    """
+    is_image_source = content_type != "application/pdf"
+    results = _page_results(pages)
+    os.makedirs(settings.temp_dir, exist_ok=True)
+    fd, output_path = tempfile.mkstemp(prefix="redact_", suffix=".pdf", dir=settings.temp_dir)
+    os.close(fd)
+    doc: Optional[fitz.Document] = None
+    out: Optional[fitz.Document] = None
+    sent = 0
+    start = 0  # 아직 출력 문서로 복사하지 않은 첫 페이지
+    try:
+        doc = open_document(source, content_type, filetype)
+        out = fitz.open()
+        # 문서 정보/목차는 페이지 복사에 포함되지 않으므로 첫 저장/마지막 저장에 함께 기록
+        out.set_metadata(doc.metadata)
+        toc = doc.get_toc()
+        page_count = doc.page_count
+        for page_index in range(page_count):
+            page_result = results.get(page_index)
+            if page_result is not None and redact_page(doc[page_index], page_result, is_image_source, render_mode):
+                # 가림 처리로 새로 쓴 내용 스트림은 압축되지 않으므로 복사 전에 압축 (증분 저장은 deflate 없음)
+                for xref in doc[page_index].get_contents():
+                    doc.update_stream(xref, doc.xref_stream(xref), compress=True)
+
+            remaining = page_count - page_index - 1
+            if remaining and page_index + 1 - start < max(PDF_FLUSH_PAGES, start):
+                continue
+            # 묶음을 한 번에 복사해야 페이지가 공유하는 객체(글꼴 등)가 한 번만 복사됨
+            out.insert_pdf(doc, from_page=start, to_page=page_index)
+            start = page_index + 1
+            if not remaining and toc:
+                out.set_toc(toc)
+            if sent:
+                out.save(output_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+            else:
+                out.save(output_path, garbage=3, deflate=True)
+            if remaining:
+                out.close()
+                out = fitz.open(output_path)
+                doc.close()
+                doc = open_document(source, content_type, filetype)
+
+            with open(output_path, "rb") as f:
+                f.seek(sent)
+                while True:
+                    chunk = f.read(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sent += len(chunk)
+                    yield chunk
+    finally:
+        for opened in (out, doc):
+            if opened is not None and not opened.is_closed:
+                opened.close()
+        try:
+            os.remove(output_path)
+        except FileNotFoundError:
+            pass
+
+
+def iter_redacted(
+    source: str,
+    content_type: Optional[str],
+    pages: List[Dict],
+    output_format: str,
+    render_mode: str,
+    filetype: Optional[str] = None,
+) -> Iterator[bytes]:
+    """출력 형식(pdf, png)에 맞는 가림 처리 결과 생성기 (filetype: open_document 참고)"""
+    if output_format == "png":
+        return iter_redacted_png_zip(source, content_type, pages, render_mode, filetype=filetype)
+    return iter_redacted_pdf(source, content_type, pages, render_mode, filetype=filetype)
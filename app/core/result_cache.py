@@ -0,0 +1,106 @@
+"""결과 응답 캐시 모듈: 완료된 작업의 직렬화된 결과 본문을 바이트 예산 LRU로 보관"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+import hashlib
+import threading
+import time
+
+
+def make_etag(job_id: UUID, completed_at: Optional[datetime]) -> str:
+    """
+    완료된 작업 결과의 강한 ETag
+    
+    done 작업의 결과는 바뀌지 않으므로 본문 대신 작업 ID + 완료 시각으로 만들어,
+    If-None-Match 검증 시 결과를 조회/직렬화하지 않아도 됨.
+    """
+    stamp = completed_at.isoformat() if completed_at else ""
+    return '"' + hashlib.sha1(f"{job_id}:{stamp}".encode()).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (목록, *, W/ 접두사 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResultBodyCache:
+    """
+    작업 결과 본문 LRU (프로세스 단위)
+    
+    항목 수가 아니라 본문 바이트 합계(max_bytes)로 크기를 제한하며, 한 항목이 예산을
+    넘으면 저장하지 않음. 작업 삭제 시 invalidate로 제거하고, ttl초가 지난 항목은 조회 시 버림.
+    다른 프로세스에서의 삭제는 이 캐시가 알 수 없으므로 ttl이 지날 때까지 남아 있음.
+    """
+    
+    def __init__(self, max_bytes: int, ttl: float = 0):
+        """
+        Args:
+            max_bytes: 본문 바이트 합계 최대값 (0이면 비활성화)
+            ttl: 항목 유효 시간 (초, 0이면 무제한)
+        """
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[UUID, Tuple[str, bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+    
+    def get(self, job_id: UUID) -> Optional[Tuple[str, bytes]]:
+        """(etag, body) 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is not None and self.ttl and time.monotonic() - entry[2] > self.ttl:
+                self._remove(job_id)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(job_id)
+            self._hits += 1
+            return entry[0], entry[1]
+    
+    def put(self, job_id: UUID, etag: str, body: bytes) -> None:
+        """본문 저장 (예산 초과 시 오래 사용되지 않은 항목부터 제거)"""
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove(job_id)
+            self._entries[job_id] = (etag, body, time.monotonic())
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+    
+    def invalidate(self, job_id: UUID) -> None:
+        """항목 제거 (작업 삭제 시)"""
+        with self._lock:
+            self._remove(job_id)
+    
+    def stats(self) -> Dict[str, int]:
+        """적중/실패 횟수와 사용량"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+    
+    def _remove(self, job_id: UUID) -> None:
+        """잠금을 잡은 상태에서 항목 제거"""
+        entry = self._entries.pop(job_id, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
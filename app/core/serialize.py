@@ -0,0 +1,43 @@
+"""결과 직렬화 모듈: DB 행/컬럼형 결과를 Pydantic 모델 없이 JSON 바이트로 변환"""
+from typing import Any, Dict, Iterable, List, Tuple
+
+import orjson
+
+
+def dumps(data: Any) -> bytes:
+    """JSON 바이트 직렬화 (orjson, UTF-8 그대로 출력)"""
+    return orjson.dumps(data)
+
+
+def rows_to_pages(rows: Iterable[Tuple]) -> List[Dict]:
+    """
+    페이지/아이템 조인 행을 응답 JSON 구조(Page 스키마)로 묶음
+    
+    Args:
+        rows: page_index 순으로 정렬된 (page_id, page_index, width, height,
+              text, x, y, w, h, confidence, is_sensitive, masked_text) 행.
+              아이템이 없는 페이지는 text 이후가 None인 행 1개 (LEFT JOIN)
+    """
+    pages: List[Dict] = []
+    current_page_id = None
+    items: List[Dict] = []
+    for page_id, page_index, width, height, text, x, y, w, h, confidence, is_sensitive, masked_text in rows:
+        if page_id != current_page_id:
+            current_page_id = page_id
+            items = []
+            pages.append({
+                'page_index': page_index,
+                'width': width,
+                'height': height,
+                'items': items,
+            })
+        if text is None:
+            continue
+        items.append({
+            'text': text,
+            'bbox': {'x': x, 'y': y, 'w': w, 'h': h},
+            'confidence': confidence,
+            'is_sensitive': bool(is_sensitive),
+            'masked_text': masked_text,
+        })
+    return pages
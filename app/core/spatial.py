@@ -0,0 +1,164 @@
+"""페이지 아이템 공간 색인: bbox 기준 오른쪽/아래 최근접 아이템 조회 (균일 격자)"""
+from typing import List, Dict, Optional, Tuple
+
+
+def is_degenerate_bbox(bbox: Optional[Dict]) -> bool:
+    """
+    좌표 없는 bbox 여부
+
+    텍스트 레이어 아이템은 bbox가 0으로 초기화된 뒤 후처리(normalize_bbox)에서 너비/높이가
+    최소 1로 보정되므로 1 이하를 좌표 없음으로 봄.
+    """
+    if not bbox:
+        return True
+    return (bbox.get('w') or 0) <= 1 or (bbox.get('h') or 0) <= 1
+
+
+class SpatialIndex:
+    """
+    페이지 아이템 bbox 균일 격자 색인
+
+    셀 크기는 아이템 높이의 중앙값(글자 줄 높이)이며, 각 아이템은 bbox가 걸친 모든 셀에 등록됨.
+    조회는 기준 아이템과 같은 줄(행 범위) 또는 같은 열(열 범위)의 셀만 가까운 순서로 한 칸씩 넓혀
+    훑다가 다음 칸의 최소 거리가 현재 최근접보다 멀어지면 멈추므로 보통은 주변 셀만 확인함.
+    여러 셀에 걸친 아이템은 조회마다 한 번만 검사하며, 후보 수로 조회를 끊지 않으므로 빽빽한
+    페이지에서도 결과는 항상 최근접 아이템임 (최악의 경우 조회 1회가 같은 줄/열 아이템 수에 비례).
+    좌표 없는 bbox(텍스트 레이어 아이템, is_degenerate_bbox)는 색인하지 않음.
+    """
+
+    def __init__(self, items: List[Dict]):
+        """
+        Args:
+            items: OCR 아이템 리스트 [{'bbox': {'x', 'y', 'w', 'h'}, ...}] (인덱스로 조회)
+        """
+        self.boxes: List[Optional[Tuple[float, float, float, float]]] = [
+            self._box(item.get('bbox')) for item in items
+        ]
+        heights = sorted(box[3] - box[1] for box in self.boxes if box is not None)
+        self.cell_size = max(heights[len(heights) // 2], 1.0) if heights else 1.0
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.max_col = 0
+        self.max_row = 0
+
+        for idx, box in enumerate(self.boxes):
+            if box is None:
+                continue
+            col0, row0, col1, row1 = self._cell_range(box)
+            self.max_col = max(self.max_col, col1)
+            self.max_row = max(self.max_row, row1)
+            for row in range(row0, row1 + 1):
+                for col in range(col0, col1 + 1):
+                    self.cells.setdefault((col, row), []).append(idx)
+
+    @staticmethod
+    def _box(bbox: Optional[Dict]) -> Optional[Tuple[float, float, float, float]]:
+        """bbox dict -> (x0, y0, x1, y1), 좌표 없는 bbox면 None"""
+        if is_degenerate_bbox(bbox):
+            return None
+        x = bbox.get('x', 0) or 0
+        y = bbox.get('y', 0) or 0
+        return (x, y, x + bbox['w'], y + bbox['h'])
+
+    def _cell_range(self, box: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
+        """bbox가 걸친 셀 범위 (col0, row0, col1, row1)"""
+        size = self.cell_size
+        return (
+            max(int(box[0] // size), 0),
+            max(int(box[1] // size), 0),
+            max(int(box[2] // size), 0),
+            max(int(box[3] // size), 0),
+        )
+
+    def has_box(self, idx: int) -> bool:
+        """색인된(좌표가 있는) 아이템인지 여부"""
+        return self.boxes[idx] is not None
+
+    def right_of(self, idx: int, max_gap: Optional[float] = None) -> Optional[int]:
+        """
+        같은 줄에서 오른쪽으로 가장 가까운 아이템
+
+        같은 줄: 세로 구간이 겹치는 길이가 두 아이템 중 낮은 쪽 높이의 절반 이상.
+        오른쪽: 아이템 중심이 기준 아이템 오른쪽 끝보다 오른쪽 (약간의 겹침 허용).
+
+        Args:
+            max_gap: 기준 아이템 오른쪽 끝과의 최대 간격 (None이면 제한 없음)
+
+        Returns:
+            아이템 인덱스 (없거나 기준 아이템이 색인되지 않았으면 None)
+        """
+        box = self.boxes[idx]
+        if box is None:
+            return None
+        x0, y0, x1, y1 = box
+        col0, row0, col1, row1 = self._cell_range(box)
+
+        best, best_gap = None, None
+        seen = {idx}
+        for col in range(col1, self.max_col + 1):
+            # 이 열의 왼쪽 경계가 현재 최근접보다 멀면 이후 열도 더 멀다
+            col_gap = col * self.cell_size - x1
+            if best_gap is not None and col_gap > best_gap:
+                break
+            if max_gap is not None and col_gap > max_gap:
+                break
+            for row in range(row0, row1 + 1):
+                for other in self.cells.get((col, row), ()):
+                    if other in seen:
+                        continue
+                    seen.add(other)
+                    ox0, oy0, ox1, oy1 = self.boxes[other]
+                    if (ox0 + ox1) / 2 <= x1:
+                        continue
+                    overlap = min(y1, oy1) - max(y0, oy0)
+                    if overlap < min(y1 - y0, oy1 - oy0) / 2:
+                        continue
+                    gap = max(ox0 - x1, 0)
+                    if max_gap is not None and gap > max_gap:
+                        continue
+                    if best_gap is None or gap < best_gap or (gap == best_gap and other < best):
+                        best, best_gap = other, gap
+        return best
+
+    def below(self, idx: int, max_gap: Optional[float] = None) -> Optional[int]:
+        """
+        같은 열에서 아래로 가장 가까운 아이템
+
+        같은 열: 가로 구간이 겹침 (왼쪽 정렬된 양식의 라벨/값처럼 너비가 달라도 겹치면 인정).
+        아래: 아이템 중심이 기준 아이템 아래쪽 끝보다 아래.
+
+        Args:
+            max_gap: 기준 아이템 아래쪽 끝과의 최대 간격 (None이면 제한 없음)
+
+        Returns:
+            아이템 인덱스 (없거나 기준 아이템이 색인되지 않았으면 None)
+        """
+        box = self.boxes[idx]
+        if box is None:
+            return None
+        x0, y0, x1, y1 = box
+        col0, row0, col1, row1 = self._cell_range(box)
+
+        best, best_gap = None, None
+        seen = {idx}
+        for row in range(row1, self.max_row + 1):
+            row_gap = row * self.cell_size - y1
+            if best_gap is not None and row_gap > best_gap:
+                break
+            if max_gap is not None and row_gap > max_gap:
+                break
+            for col in range(col0, col1 + 1):
+                for other in self.cells.get((col, row), ()):
+                    if other in seen:
+                        continue
+                    seen.add(other)
+                    ox0, oy0, ox1, oy1 = self.boxes[other]
+                    if (oy0 + oy1) / 2 <= y1:
+                        continue
+                    if min(x1, ox1) - max(x0, ox0) <= 0:
+                        continue
+                    gap = max(oy0 - y1, 0)
+                    if max_gap is not None and gap > max_gap:
+                        continue
+                    if best_gap is None or gap < best_gap or (gap == best_gap and other < best):
+                        best, best_gap = other, gap
+        return best
@@ -0,0 +1,89 @@
+"""업로드 스풀 모듈: 업로드 파일을 임시 파일로 저장하고 워커에는 경로만 전달"""
+from typing import Optional
+import hashlib
+import logging
+import os
+import tempfile
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 업로드 스트림 읽기 단위
+CHUNK_SIZE = 1024 * 1024
+
+
+class UploadTooLargeError(Exception):
+    """업로드 크기 제한 초과"""
+
+
+class SpooledUpload:
+    """
+    임시 파일로 스풀된 업로드
+    
+    API 프로세스는 업로드를 한 번만 디스크(페이지 캐시)에 기록하고, OCR 워커 프로세스에는
+    파일 경로만 넘김. 워커는 PDF를 파일에서 직접 열기 때문에 bytes 피클링과
+    프로세스 간 중복 메모리가 발생하지 않음.
+    """
+    
+    def __init__(self, path: str, size: int, sha256: str):
+        """
+        Args:
+            path: 임시 파일 경로
+            size: 파일 크기 (바이트)
+            sha256: 파일 내용 SHA-256 (결과 캐시 키)
+        """
+        self.path = path
+        self.size = size
+        self.sha256 = sha256
+    
+    def read_bytes(self) -> bytes:
+        """파일 내용 읽기"""
+        with open(self.path, "rb") as f:
+            return f.read()
+    
+    def cleanup(self) -> None:
+        """임시 파일 삭제"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"임시 파일 삭제 실패: {self.path} ({e})")
+
+
+async def spool_upload(upload_file, max_bytes: Optional[int] = None) -> SpooledUpload:
+    """
+    업로드 파일을 청크 단위로 임시 파일에 기록 (SHA-256 동시 계산)
+    
+    Args:
+        upload_file: FastAPI UploadFile
+        max_bytes: 최대 크기 (초과 시 UploadTooLargeError, 임시 파일은 삭제됨)
+        
+    Returns:
+        SpooledUpload
+    """
+    os.makedirs(settings.temp_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="upload-", dir=settings.temp_dir)
+    digest = hashlib.sha256()
+    size = 0
+    
+    try:
+        with os.fdopen(fd, "wb") as f:
+            while True:
+                chunk = await upload_file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLargeError(f"업로드 크기 제한 초과: {size} > {max_bytes}")
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        raise
+    
+    return SpooledUpload(path, size, digest.hexdigest())
@@ -72,7 +72,7 @@ function App() {
           'Authorization': API_KEY,
         },
       })
-      setJobs(response.data)
+      setJobs(response.data.jobs)
     } catch (err) {
       console.error('작업 목록 로드 실패:', err)
     }
@@ -0,0 +1,31 @@
+"""add_job_content_hash
+
+Revision ID: 003_add_job_content_hash
+Revises: 002_change_default_lang
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_add_job_content_hash'
+down_revision: Union[str, None] = '002_change_default_lang'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 결과 캐시 키: 업로드 파일 SHA-256 + 언어 + 파이프라인 버전
+    op.add_column('jobs', sa.Column('content_hash', sa.String(64), nullable=True))
+    op.add_column('jobs', sa.Column('pipeline_version', sa.String(64), nullable=True))
+    op.create_index('idx_jobs_content_key', 'jobs', ['content_hash', 'lang', 'pipeline_version'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_content_key', table_name='jobs')
+    op.drop_column('jobs', 'pipeline_version')
+    op.drop_column('jobs', 'content_hash')
@@ -0,0 +1,39 @@
+"""add_job_payloads
+
+Revision ID: 004_add_job_payloads
+Revises: 003_add_job_content_hash
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_add_job_payloads'
+down_revision: Union[str, None] = '003_add_job_content_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # DB 큐 백엔드: 워커가 읽을 업로드 원본 (처리 완료/실패 시 삭제)
+    op.create_table(
+        'job_payloads',
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    )
+    # 대기 작업을 오래된 순으로 가져오기 위한 부분 인덱스
+    op.create_index(
+        'idx_jobs_queued', 'jobs', ['created_at'],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_queued', table_name='jobs')
+    op.drop_table('job_payloads')
@@ -0,0 +1,37 @@
+"""add_job_leases
+
+Revision ID: 005_add_job_leases
+Revises: 004_add_job_payloads
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_job_leases'
+down_revision: Union[str, None] = '004_add_job_payloads'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 처리 중 작업 리스: 소유 워커, 만료 시각(하트비트로 연장), 시도 횟수
+    op.add_column('jobs', sa.Column('lease_owner', sa.Text(), nullable=True))
+    op.add_column('jobs', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+    op.add_column('jobs', sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+    # 만료 리스 회수용 부분 인덱스
+    op.create_index(
+        'idx_jobs_lease', 'jobs', ['lease_expires_at'],
+        postgresql_where=sa.text("status = 'processing'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_lease', table_name='jobs')
+    op.drop_column('jobs', 'attempts')
+    op.drop_column('jobs', 'lease_expires_at')
+    op.drop_column('jobs', 'lease_owner')
@@ -0,0 +1,27 @@
+"""add_job_started_at
+
+Revision ID: 006_add_job_started_at
+Revises: 005_add_job_leases
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_job_started_at'
+down_revision: Union[str, None] = '005_add_job_leases'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 최초 처리 시작 시각 (/stats 대기 시간 백분위)
+    op.add_column('jobs', sa.Column('started_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('jobs', 'started_at')
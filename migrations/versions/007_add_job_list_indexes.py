@@ -0,0 +1,35 @@
+"""add_job_list_indexes
+
+Revision ID: 007_add_job_list_indexes
+Revises: 006_add_job_started_at
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_job_list_indexes'
+down_revision: Union[str, None] = '006_add_job_started_at'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # /jobs 키셋 페이지네이션 (created_at DESC, id DESC) 및 상태 필터
+    op.create_index('idx_jobs_created', 'jobs', [sa.text('created_at DESC'), sa.text('id DESC')])
+    op.create_index(
+        'idx_jobs_status_created', 'jobs',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+    # status 단일 인덱스는 복합 인덱스 선두 컬럼으로 대체
+    op.drop_index('idx_jobs_status', table_name='jobs')
+
+
+def downgrade() -> None:
+    op.create_index('idx_jobs_status', 'jobs', ['status'])
+    op.drop_index('idx_jobs_status_created', table_name='jobs')
+    op.drop_index('idx_jobs_created', table_name='jobs')
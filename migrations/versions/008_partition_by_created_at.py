@@ -0,0 +1,225 @@
+"""partition_by_created_at
+
+Revision ID: 008_partition_by_created_at
+Revises: 007_add_job_list_indexes
+Create Date: 2026-10-17 16:00:00.000000
+
+jobs/pages/items를 작업 생성 시각(created_at) 기준 월별 RANGE 파티션 테이블로 전환.
+파티션 키가 기본키/외래키에 포함되어야 하므로 pages/items/job_payloads에 작업의
+created_at을 복사해 두고 (id, created_at) 복합 키로 참조함.
+기존 테이블은 *_legacy로 이름을 바꾼 뒤 데이터를 옮기고 삭제하며, id 시퀀스는 그대로 이어 씀.
+"""
+from typing import Sequence, Union
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_partition_by_created_at'
+down_revision: Union[str, None] = '007_add_job_list_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 미리 만들어 둘 미래 월 파티션 수 (이후는 서버/워커의 주기 점검, ocr-cli retention에서 생성)
+MONTHS_AHEAD = 3
+
+TABLES = ('jobs', 'pages', 'items')
+
+INDEXES = (
+    'idx_jobs_created',
+    'idx_jobs_status_created',
+    'idx_jobs_queued',
+    'idx_jobs_lease',
+    'idx_jobs_content_key',
+    'idx_pages_job',
+    'idx_items_page',
+)
+
+
+def create_indexes() -> None:
+    op.execute("CREATE INDEX idx_jobs_created ON jobs (created_at DESC, id DESC)")
+    op.execute("CREATE INDEX idx_jobs_status_created ON jobs (status, created_at DESC, id DESC)")
+    op.execute("CREATE INDEX idx_jobs_queued ON jobs (created_at) WHERE status = 'queued'")
+    op.execute("CREATE INDEX idx_jobs_lease ON jobs (lease_expires_at) WHERE status = 'processing'")
+    op.execute("CREATE INDEX idx_jobs_content_key ON jobs (content_hash, lang, pipeline_version)")
+    op.execute("CREATE INDEX idx_pages_job ON pages (job_id)")
+    op.execute("CREATE INDEX idx_items_page ON items (page_id)")
+
+
+def add_months(month: date, months: int) -> date:
+    """월 단위 이동 (month는 1일)"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def create_month_partitions(oldest: datetime) -> None:
+    """
+    oldest가 속한 월부터 이번 달 + MONTHS_AHEAD까지 jobs/pages/items 월 파티션 생성
+    
+    이 리비전 시점의 DDL을 그대로 둠 (app.core.partitions가 바뀌어도 마이그레이션 결과는 고정)
+    """
+    month = date(oldest.year, oldest.month, 1)
+    now = datetime.utcnow()
+    last = add_months(date(now.year, now.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        end = add_months(month, 1)
+        for table in TABLES:
+            op.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}_{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        month = end
+
+
+def rename_to_legacy() -> None:
+    """기존 테이블/기본키/인덱스를 *_legacy로 비켜 두고 id 시퀀스 소유 관계 해제"""
+    for index in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+    op.execute("ALTER TABLE job_payloads DROP CONSTRAINT IF EXISTS job_payloads_job_id_fkey")
+    op.execute("ALTER TABLE job_payloads DROP CONSTRAINT IF EXISTS job_payloads_job_id_created_at_fkey")
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        op.execute(f"ALTER TABLE {table}_legacy RENAME CONSTRAINT {table}_pkey TO {table}_legacy_pkey")
+    op.execute("ALTER SEQUENCE pages_id_seq OWNED BY NONE")
+    op.execute("ALTER SEQUENCE items_id_seq OWNED BY NONE")
+
+
+def drop_legacy() -> None:
+    """*_legacy 테이블 삭제 후 id 시퀀스를 새 테이블에 연결"""
+    for table in reversed(TABLES):
+        op.execute(f"DROP TABLE {table}_legacy")
+    op.execute("ALTER SEQUENCE pages_id_seq OWNED BY pages.id")
+    op.execute("ALTER SEQUENCE items_id_seq OWNED BY items.id")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    rename_to_legacy()
+    # 파티션 키는 NULL일 수 없음 (init_db로 만든 테이블은 created_at이 nullable)
+    op.execute("UPDATE jobs_legacy SET created_at = timezone('utc', now()) WHERE created_at IS NULL")
+
+    # 파티션 부모 테이블 (컬럼/기본값은 기존 테이블에서 복사)
+    op.execute(
+        """
+        CREATE TABLE jobs (
+            LIKE jobs_legacy INCLUDING DEFAULTS,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE pages (
+            LIKE pages_legacy INCLUDING DEFAULTS,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (id, created_at),
+            FOREIGN KEY (job_id, created_at) REFERENCES jobs (id, created_at) ON DELETE CASCADE
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE items (
+            LIKE items_legacy INCLUDING DEFAULTS,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY (id, created_at),
+            FOREIGN KEY (page_id, created_at) REFERENCES pages (id, created_at) ON DELETE CASCADE
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+
+    # 기존 데이터가 있는 가장 오래된 월부터 이번 달 + MONTHS_AHEAD까지 월 파티션 생성
+    oldest = bind.execute(sa.text("SELECT min(created_at) FROM jobs_legacy")).scalar()
+    create_month_partitions(oldest or datetime.utcnow())
+    create_indexes()
+
+    # 데이터 이전 (pages/items에는 작업 생성 시각을 파티션 키로 복사)
+    op.execute("INSERT INTO jobs SELECT * FROM jobs_legacy")
+    op.execute(
+        """
+        INSERT INTO pages (id, job_id, page_index, width, height, created_at)
+        SELECT p.id, p.job_id, p.page_index, p.width, p.height, j.created_at
+        FROM pages_legacy p
+        JOIN jobs_legacy j ON j.id = p.job_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO items (id, page_id, text, x, y, w, h, confidence, is_sensitive, masked_text, created_at)
+        SELECT i.id, i.page_id, i.text, i.x, i.y, i.w, i.h, i.confidence, i.is_sensitive, i.masked_text, p.created_at
+        FROM items_legacy i
+        JOIN pages p ON p.id = i.page_id
+        """
+    )
+
+    # 입력 파일도 (job_id, created_at)으로 작업 참조
+    op.add_column('job_payloads', sa.Column('created_at', sa.DateTime(), nullable=True))
+    op.execute(
+        "UPDATE job_payloads jp SET created_at = j.created_at FROM jobs_legacy j WHERE j.id = jp.job_id"
+    )
+    op.execute("DELETE FROM job_payloads WHERE created_at IS NULL")
+    op.alter_column('job_payloads', 'created_at', nullable=False)
+
+    drop_legacy()
+    op.create_foreign_key(
+        'job_payloads_job_id_created_at_fkey', 'job_payloads', 'jobs',
+        ['job_id', 'created_at'], ['id', 'created_at'], ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    rename_to_legacy()
+
+    op.execute(
+        """
+        CREATE TABLE jobs (
+            LIKE jobs_legacy INCLUDING DEFAULTS,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE pages (
+            LIKE pages_legacy INCLUDING DEFAULTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (job_id) REFERENCES jobs (id) ON DELETE CASCADE
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TABLE items (
+            LIKE items_legacy INCLUDING DEFAULTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (page_id) REFERENCES pages (id) ON DELETE CASCADE
+        )
+        """
+    )
+    op.execute("ALTER TABLE pages DROP COLUMN created_at")
+    op.execute("ALTER TABLE items DROP COLUMN created_at")
+    create_indexes()
+
+    op.execute("INSERT INTO jobs SELECT * FROM jobs_legacy")
+    op.execute(
+        """
+        INSERT INTO pages (id, job_id, page_index, width, height)
+        SELECT id, job_id, page_index, width, height FROM pages_legacy
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO items (id, page_id, text, x, y, w, h, confidence, is_sensitive, masked_text)
+        SELECT id, page_id, text, x, y, w, h, confidence, is_sensitive, masked_text FROM items_legacy
+        """
+    )
+
+    # 파티션은 부모(*_legacy)와 함께 삭제됨
+    drop_legacy()
+    op.drop_column('job_payloads', 'created_at')
+    op.create_foreign_key(
+        'job_payloads_job_id_fkey', 'job_payloads', 'jobs',
+        ['job_id'], ['id'], ondelete='CASCADE',
+    )
@@ -0,0 +1,40 @@
+"""add_item_search
+
+Revision ID: 009_add_item_search
+Revises: 008_partition_by_created_at
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_add_item_search'
+down_revision: Union[str, None] = '008_partition_by_created_at'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # 검색 대상 텍스트: 민감 아이템은 마스킹 텍스트만 (파티션 전체에 생성 컬럼으로 추가)
+    op.execute(
+        """
+        ALTER TABLE items ADD COLUMN search_text TEXT
+        GENERATED ALWAYS AS (CASE WHEN is_sensitive THEN COALESCE(masked_text, '') ELSE text END) STORED
+        """
+    )
+    # 단어 단위 전문 검색 (tsvector) / 부분 문자열 검색 (트라이그램)
+    op.execute(
+        "CREATE INDEX idx_items_search_tsv ON items "
+        "USING gin (to_tsvector('simple'::regconfig, search_text))"
+    )
+    op.execute("CREATE INDEX idx_items_search_trgm ON items USING gin (search_text gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.drop_index('idx_items_search_trgm', table_name='items')
+    op.drop_index('idx_items_search_tsv', table_name='items')
+    op.drop_column('items', 'search_text')
@@ -0,0 +1,49 @@
+"""chunk_job_payloads
+
+Revision ID: 010_chunk_job_payloads
+Revises: 009_add_item_search
+Create Date: 2026-10-18 10:00:00.000000
+
+job_payloads를 작업당 1행(파일 전체)에서 청크 단위 행(job_id, seq)으로 전환.
+API는 스풀 파일을 청크씩 INSERT하고 워커는 청크씩 읽어 임시 파일에 기록하므로
+업로드 크기와 무관하게 프로세스 메모리에는 청크 하나만 올라감.
+기존 행은 seq 0 청크 하나로 유지됨.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_chunk_job_payloads'
+down_revision: Union[str, None] = '009_add_item_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('job_payloads', sa.Column('seq', sa.Integer(), nullable=False, server_default='0'))
+    op.alter_column('job_payloads', 'seq', server_default=None)
+    op.drop_constraint('job_payloads_pkey', 'job_payloads', type_='primary')
+    op.create_primary_key('job_payloads_pkey', 'job_payloads', ['job_id', 'seq'])
+
+
+def downgrade() -> None:
+    # 청크를 순서대로 이어 붙여 seq 0 행에 합친 뒤 나머지 청크 삭제
+    op.execute(
+        """
+        UPDATE job_payloads jp SET data = merged.data
+        FROM (
+            SELECT job_id, string_agg(data, ''::bytea ORDER BY seq) AS data
+            FROM job_payloads
+            GROUP BY job_id
+            HAVING count(*) > 1
+        ) merged
+        WHERE jp.job_id = merged.job_id AND jp.seq = 0
+        """
+    )
+    op.execute("DELETE FROM job_payloads WHERE seq > 0")
+    op.drop_constraint('job_payloads_pkey', 'job_payloads', type_='primary')
+    op.create_primary_key('job_payloads_pkey', 'job_payloads', ['job_id'])
+    op.drop_column('job_payloads', 'seq')
@@ -0,0 +1,29 @@
+"""db_clock_created_at
+
+Revision ID: 011_db_clock_created_at
+Revises: 010_chunk_job_payloads
+Create Date: 2026-10-19 10:00:00.000000
+
+jobs.created_at 기본값을 DB 시계의 UTC 시각(timezone('utc', now()))으로 변경.
+started_at/completed_at/리스와 같은 시계를 써서 대기/처리 시간 백분위가 앱 호스트와
+DB 사이 시계 차이의 영향을 받지 않음. 기존 기본값 now()는 세션 시간대를 따름.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_db_clock_created_at'
+down_revision: Union[str, None] = '010_chunk_job_payloads'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 파티션 부모에서 변경하면 모든 월 파티션에 적용됨
+    op.execute("ALTER TABLE jobs ALTER COLUMN created_at SET DEFAULT timezone('utc', now())")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE jobs ALTER COLUMN created_at SET DEFAULT now()")
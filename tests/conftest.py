@@ -0,0 +1,5 @@
+"""테스트 공통 설정: Settings 필수 환경 변수 기본값 (앱 모듈 import 전에 설정)"""
+import os
+
+os.environ.setdefault("API_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/ocr_test")
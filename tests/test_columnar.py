@@ -0,0 +1,59 @@
+"""컬럼형 페이지 결과 테스트 (아이템 dict 리스트 <-> 컬럼 배열 왕복)"""
+import pickle
+
+import numpy as np
+
+from app.core.columnar import iter_rows, page_to_dict, sensitive_mask, to_columnar
+
+
+def page_result(count):
+    return {
+        'page_index': 2,
+        'width': 800,
+        'height': 1200,
+        'items': [
+            {
+                'text': f'텍스트 {i}',
+                'bbox': {'x': i, 'y': i * 2, 'w': 30 + i, 'h': 12},
+                'confidence': round(0.5 + i / (2 * max(count, 1)), 4),
+                'is_sensitive': i % 3 == 0,
+                'masked_text': f'텍*** {i}' if i % 3 == 0 else None,
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def test_round_trip():
+    original = page_result(11)
+    assert page_to_dict(to_columnar(original)) == original
+
+
+def test_empty_page():
+    original = page_result(0)
+    page = to_columnar(original)
+    assert page['count'] == 0
+    assert page_to_dict(page) == original
+
+
+def test_column_types():
+    page = to_columnar(page_result(9))
+    assert page['bboxes'].dtype == np.int32 and page['bboxes'].shape == (9, 4)
+    assert page['confidences'].dtype == np.float32
+    # 9개 비트 -> 2바이트
+    assert page['sensitive'].nbytes == 2
+    assert sensitive_mask(page).tolist() == [i % 3 == 0 for i in range(9)]
+
+
+def test_confidences_are_python_floats_without_float32_noise():
+    page = to_columnar({'page_index': 0, 'width': 1, 'height': 1, 'items': [
+        {'text': 'a', 'bbox': {'x': 0, 'y': 0, 'w': 1, 'h': 1}, 'confidence': 0.95},
+    ]})
+    confidence = next(iter_rows(page))[5]
+    assert type(confidence) is float
+    assert confidence == 0.95
+
+
+def test_pickle_is_smaller_than_dicts():
+    original = page_result(500)
+    assert len(pickle.dumps(to_columnar(original))) < len(pickle.dumps(original))
@@ -0,0 +1,76 @@
+"""
+페이지/아이템 COPY 저장 왕복 테스트 (실제 PostgreSQL 필요)
+
+TEST_DATABASE_URL에 마이그레이션된 DB를 지정하면 실행됨 (예: postgresql://postgres@/ocr_test?host=/tmp).
+모든 쓰기는 트랜잭션 안에서 하고 롤백하므로 DB에 남지 않음.
+"""
+import os
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.dao import PageDAO
+from app.core.models import Job
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL이 설정되지 않음")
+
+ITEMS = [
+    # (text, x, y, w, h, confidence, is_sensitive, masked_text)
+    ("홍길동", 10, 20, 60, 18, 0.987654, True, "홍길*"),
+    ("plain text", 0, 0, 1, 1, 0.5, False, None),
+    ('quote " and, comma', 5, 6, 7, 8, 0.25, False, None),
+    ("line1\nline2\r\nline3", 1, 2, 3, 4, 0.75, True, "line*\n*****"),
+    ("back\\slash \\. and 'single'", 9, 9, 9, 9, 1.0, False, None),
+    ("", 3, 3, 3, 3, 0.0, False, None),
+    ("NULL", 4, 4, 4, 4, 0.1, True, '"quoted", masked'),
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(TEST_DATABASE_URL)
+    with Session(engine) as session:
+        try:
+            yield session
+        finally:
+            session.rollback()
+    engine.dispose()
+
+
+def create_job(db: Session) -> Job:
+    job = Job(id=uuid4(), api_key="test", filename="copy.pdf", status="processing",
+              created_at=datetime.utcnow().replace(microsecond=0))
+    db.add(job)
+    db.flush()
+    return job
+
+
+def test_copy_results_round_trip(db):
+    job = create_job(db)
+    pages = [(0, 800, 1200), (1, 800, 1200), (2, 640, 480)]
+    page_items = [ITEMS[:4], [], ITEMS[4:]]
+    
+    page_ids = PageDAO.copy_results(db, job.id, job.created_at, pages, page_items)
+    assert len(page_ids) == 3
+    
+    rows = PageDAO.fetch_result_rows(db, job.id, job.created_at)
+    assert [row[0] for row in rows] == [page_ids[0]] * 4 + [page_ids[1]] + [page_ids[2]] * 3
+    assert [row[1:4] for row in rows] == [pages[0]] * 4 + [pages[1]] + [pages[2]] * 3
+    
+    stored = [tuple(row[4:]) for row in rows if row[4] is not None]
+    assert stored == ITEMS
+    # 아이템 없는 페이지는 LEFT JOIN 행 1개 (text 이후 None)
+    assert rows[4][4:] == (None,) * 8
+
+
+def test_copy_results_without_items(db):
+    job = create_job(db)
+    page_ids = PageDAO.copy_results(db, job.id, job.created_at, [(0, 10, 10)], [[]])
+    rows = PageDAO.fetch_result_rows(db, job.id, job.created_at)
+    assert [row[0] for row in rows] == page_ids
+    assert PageDAO.copy_results(db, job.id, job.created_at, [], []) == []
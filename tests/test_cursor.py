@@ -0,0 +1,31 @@
+"""키셋 커서 테스트 (GET /jobs next_cursor)"""
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.cursor import decode_cursor, encode_cursor
+from app.core.dao import list_jobs_statement
+
+
+def test_round_trip():
+    created_at = datetime(2026, 10, 17, 3, 4, 5, 123456)
+    job_id = uuid4()
+    cursor = encode_cursor(created_at, job_id)
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == (created_at, job_id)
+
+
+@pytest.mark.parametrize('cursor', ['', 'not-base64!', encode_cursor(datetime(2026, 1, 1), uuid4())[:-4]])
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+def test_keyset_condition_uses_row_comparison():
+    statement = list_jobs_statement(limit=10, after=(datetime(2026, 10, 1), uuid4()))
+    sql = str(statement.compile())
+    assert '(jobs.created_at, jobs.id) <' in sql
+    assert 'ORDER BY jobs.created_at DESC, jobs.id DESC' in sql
@@ -0,0 +1,96 @@
+"""월별 파티션 날짜 계산 및 생성/삭제 대상 테스트 (SQL을 기록하는 가짜 연결 사용)"""
+from datetime import date, datetime
+
+from app.core import partitions
+from app.core.partitions import add_months, drop_expired_partitions, ensure_partitions, month_start, partition_name
+
+
+class RecordingConnection:
+    """실행한 SQL 기록 (to_regclass는 existing에 있으면 존재, pg_inherits는 existing 반환)"""
+
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if 'to_regclass' in sql:
+            return Result([params['name'] if params['name'] in self.existing else None])
+        if 'pg_inherits' in sql:
+            return Result([name for name in self.existing if name.startswith(params['table'] + '_')])
+        return Result([])
+
+
+class Result:
+    def __init__(self, values):
+        self.values = values
+
+    def scalar(self):
+        return self.values[0]
+
+    def scalars(self):
+        return self.values
+
+
+def test_month_start():
+    assert month_start(datetime(2026, 10, 17, 23, 59)) == date(2026, 10, 1)
+    assert month_start(date(2024, 2, 29)) == date(2024, 2, 1)
+
+
+def test_add_months_across_years():
+    assert add_months(date(2026, 11, 1), 1) == date(2026, 12, 1)
+    assert add_months(date(2026, 12, 1), 1) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 10, 1), -22) == date(2024, 12, 1)
+    assert add_months(date(2026, 10, 1), 27) == date(2029, 1, 1)
+
+
+def test_partition_name():
+    assert partition_name('items', date(2027, 1, 1)) == 'items_2027_01'
+
+
+def test_ensure_partitions_creates_missing_months_in_table_order():
+    conn = RecordingConnection(existing={'jobs_2026_11', 'pages_2026_11', 'items_2026_11'})
+    created = ensure_partitions(conn, 2, now=datetime(2026, 11, 30, 23, 0))
+    assert created == [
+        'jobs_2026_12', 'pages_2026_12', 'items_2026_12',
+        'jobs_2027_01', 'pages_2027_01', 'items_2027_01',
+    ]
+    assert 'pg_advisory_xact_lock' in conn.statements[0]
+    ddl = [sql for sql in conn.statements if sql.startswith('CREATE TABLE')]
+    assert ddl[-1] == "CREATE TABLE items_2027_01 PARTITION OF items FOR VALUES FROM ('2027-01-01') TO ('2027-02-01')"
+
+
+def test_ensure_partitions_from_start_month():
+    conn = RecordingConnection()
+    created = ensure_partitions(conn, 0, start=date(2026, 8, 15), now=datetime(2026, 10, 1))
+    assert [name for name in created if name.startswith('jobs_')] == ['jobs_2026_08', 'jobs_2026_09', 'jobs_2026_10']
+
+
+def test_drop_expired_partitions_keeps_retention_window():
+    existing = {
+        f'{table}_{month:%Y_%m}'
+        for table in partitions.PARTITIONED_TABLES
+        for month in (date(2025, 9, 1), date(2025, 10, 1), date(2025, 11, 1), date(2026, 10, 1))
+    }
+    conn = RecordingConnection(existing=existing)
+    dropped = drop_expired_partitions(conn, 12, dry_run=True, now=datetime(2026, 10, 17))
+    # 이번 달 포함 12개월 = 2025-11 ~ 2026-10 보존, 외래키 역순(items -> pages -> jobs)
+    assert dropped == [
+        'items_2025_09', 'items_2025_10',
+        'pages_2025_09', 'pages_2025_10',
+        'jobs_2025_09', 'jobs_2025_10',
+    ]
+    assert not any('DROP' in sql or 'lock' in sql for sql in conn.statements)
+
+
+def test_drop_expired_partitions_detaches_before_drop():
+    conn = RecordingConnection(existing={'jobs_2020_01'})
+    assert drop_expired_partitions(conn, 1, now=datetime(2026, 10, 17)) == ['jobs_2020_01']
+    ddl = [sql for sql in conn.statements if sql.startswith(('ALTER', 'DROP', 'DELETE'))]
+    assert ddl == [
+        'DELETE FROM job_payloads WHERE created_at >= :start AND created_at < :end',
+        'ALTER TABLE jobs DETACH PARTITION jobs_2020_01',
+        'DROP TABLE jobs_2020_01',
+    ]
@@ -0,0 +1,115 @@
+"""PII 이름 탐지 테스트 (키워드 오토마톤, 라벨/값 레이아웃, 텍스트 레이어 순서 컨텍스트)"""
+import gc
+import re
+import time
+
+from app.core.pii import KeywordAutomaton, PIIDetector
+from app.core.pii_rules import build_rule_set
+
+
+def item(text, x=0, y=0, w=0, h=0):
+    return {'text': text, 'bbox': {'x': x, 'y': y, 'w': w, 'h': h}, 'confidence': 0.9}
+
+
+def detector():
+    return PIIDetector(rules=build_rule_set("rrn,phone,health_insurance"))
+
+
+class TestKeywordAutomaton:
+    def test_finds_overlapping_matches(self):
+        automaton = KeywordAutomaton(['he', 'she', 'his', 'hers'])
+        found = sorted(automaton.finditer('ushers'))
+        assert found == [(0, 2), (1, 1), (3, 2)]
+
+    def test_matches_naive_search(self):
+        keywords = ['환자', '환자명:', '성명', '성명 :', '이름']
+        text = '환자명: 홍길동 성명 : 김철수 이름 환자환자'
+        automaton = KeywordAutomaton(keywords)
+        expected = sorted(
+            (keyword_id, match.start())
+            for keyword_id, keyword in enumerate(keywords)
+            for match in re.finditer(f'(?={re.escape(keyword)})', text)
+        )
+        assert sorted(automaton.finditer(text)) == expected
+
+
+class TestNameDetection:
+    def test_label_right_value_is_name(self):
+        items = [item('성명', 10, 10, 40, 20), item('홍길동', 70, 10, 60, 20), item('내과', 300, 10, 40, 20)]
+        result = detector().detect_and_mask(items)
+        assert [entry['is_sensitive'] for entry in result] == [False, True, False]
+        assert result[1]['masked_text'] == '홍길*'
+
+    def test_label_skips_separator(self):
+        items = [item('환자명', 10, 10, 60, 20), item(':', 75, 10, 5, 20), item('김철수', 90, 10, 60, 20)]
+        result = detector().detect_and_mask(items)
+        assert result[2]['is_sensitive'] is True
+
+    def test_label_below_value_when_row_empty(self):
+        items = [item('보호자', 10, 10, 60, 20), item('이영희', 10, 35, 60, 20)]
+        result = detector().detect_and_mask(items)
+        assert [entry['is_sensitive'] for entry in result] == [False, True]
+
+    def test_far_away_word_is_not_name(self):
+        items = [item('성명', 10, 10, 40, 20), item('홍길동', 10, 500, 60, 20)]
+        result = detector().detect_and_mask(items)
+        assert result[1]['is_sensitive'] is False
+
+    def test_label_and_name_in_one_item(self):
+        result = detector().detect_and_mask([item('성명: 홍길동', 10, 10, 120, 20), item('내과', 300, 10, 40, 20)])
+        assert [entry['is_sensitive'] for entry in result] == [True, False]
+
+    def test_text_layer_uses_list_order_context(self):
+        # 텍스트 레이어 아이템은 bbox가 1x1로 보정되어 좌표 대신 앞뒤 3개 아이템 컨텍스트를 사용
+        items = [item('성명', 0, 0, 1, 1), item('홍길동', 0, 0, 1, 1)]
+        items += [item(f'항목{i}', 0, 0, 1, 1) for i in range(5)]
+        items.append(item('박영수', 0, 0, 1, 1))
+        result = detector().detect_and_mask(items)
+        assert result[1]['is_sensitive'] is True
+        assert result[-1]['is_sensitive'] is False
+
+    def test_rule_match_takes_precedence(self):
+        result = detector().detect_and_mask([item('010-1234-5678', 10, 10, 120, 20)])
+        assert result[0]['is_sensitive'] is True
+        assert result[0]['masked_text'] == '010-****-5678'
+
+    def test_large_page_scales_linearly(self):
+        # 라벨/이름 쌍 n개와 4n개의 처리 시간 비 (선형이면 약 4, O(n^2)이면 약 16)
+        pii_detector = detector()
+
+        def form_page(pairs):
+            items = []
+            for row in range(pairs):
+                items.append(item('성명', 10, row * 30, 40, 20))
+                items.append(item('홍길동', 70, row * 30, 60, 20))
+                items.append(item('내과', 200, row * 30, 40, 20))
+            return items
+
+        def best_time(items):
+            # 가비지 컬렉션 멈춤이 한쪽 측정에만 들어가지 않도록 끄고 5회 중 최소값
+            timings = []
+            gc.collect()
+            gc.disable()
+            try:
+                for _ in range(5):
+                    start = time.perf_counter()
+                    result = pii_detector.detect_and_mask(items)
+                    timings.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+            return min(timings), result
+
+        small, _ = best_time(form_page(1000))
+        large, result = best_time(form_page(4000))
+        assert sum(entry['is_sensitive'] for entry in result) == 4000
+        assert large / small < 8
+
+
+def test_dense_form_keeps_label_value():
+    # 라벨 주변 칸에 아이템이 많이 등록된 빽빽한 양식에서도 라벨 오른쪽 이름을 찾음
+    items = [item('성명', 10, 100, 40, 20)]
+    items += [item('·', 12 + i % 30, 100, 8, 20) for i in range(120)]
+    items += [item('━━━━━━━━━━', 0, 88, 600, 10) for _ in range(10)]
+    items.append(item('홍길동', 200, 100, 60, 20))
+    result = detector().detect_and_mask(items)
+    assert result[-1]['is_sensitive'] is True
@@ -0,0 +1,92 @@
+"""PII 규칙 레지스트리 테스트 (결합 스캐너, 검증 실패 시 대체 규칙, 규칙 파일)"""
+import json
+
+import pytest
+
+from app.core.pii_rules import BUILTIN_RULES, PIIRule, PIIRuleSet, build_rule_set, mask_digits
+
+
+def rule_set(*names):
+    return PIIRuleSet(BUILTIN_RULES[name] for name in names)
+
+
+class TestBuiltinRules:
+    def test_rrn(self):
+        assert rule_set('rrn').mask('주민번호 900101-1234567') == '주민번호 900101-******'
+
+    def test_rrn_invalid_birthdate_is_ignored(self):
+        assert rule_set('rrn').mask('991399-1234567') is None
+
+    def test_phone(self):
+        rules = rule_set('phone')
+        assert rules.mask('010-1234-5678') == '010-****-5678'
+        assert rules.mask('02-123-4567') == '02-***-4567'
+
+    def test_health_insurance_vs_phone(self):
+        rules = rule_set('rrn', 'health_insurance', 'phone')
+        assert rules.mask('1-2345678901') == '1-23********'
+        assert rules.mask('01012345678') == '010****5678'
+
+    def test_chart_id_and_address(self):
+        rules = rule_set('chart_id', 'address')
+        assert rules.mask('등록번호: A-1234567') == '등록번호: A-*****67'
+        assert rules.mask('서울특별시 강남구 테헤란로 123') == '서울특별시 강남구 **** ***'
+
+    def test_plain_text_has_no_match(self):
+        assert rule_set(*BUILTIN_RULES).mask('Hello world 123') is None
+
+
+class TestRuleSet:
+    def test_scan_matches_per_rule_search(self):
+        rules = rule_set('rrn', 'health_insurance', 'phone')
+        text = '연락처 010-1234-5678, 주민 900101-1234567, 보험 1-2345678901 끝'
+        spans = [(rule.name, text[start:end]) for rule, start, end in rules.scan(text)]
+        assert spans == [
+            ('phone', '010-1234-5678'),
+            ('rrn', '900101-1234567'),
+            ('health_insurance', '1-2345678901'),
+        ]
+
+    def test_validator_failure_falls_back_to_later_rule(self):
+        # 11자리 0 시작: health_insurance 패턴은 불일치, rrn은 자릿수 불일치 -> phone
+        rules = rule_set('rrn', 'health_insurance', 'phone')
+        assert [rule.name for rule, _, _ in rules.scan('01098765432')] == ['phone']
+
+    def test_duplicate_names_rejected(self):
+        with pytest.raises(ValueError):
+            PIIRuleSet([BUILTIN_RULES['rrn'], BUILTIN_RULES['rrn']])
+
+    def test_named_group_rejected(self):
+        with pytest.raises(ValueError):
+            PIIRule('bad', r'(?P<x>\d+)', masker=mask_digits())
+
+    def test_rule_without_first_chars_disables_prefilter(self):
+        rules = PIIRuleSet([BUILTIN_RULES['phone'], PIIRule('code', r'\bX\d{3}\b', masker=mask_digits())])
+        assert rules.mask('X123 010-1234-5678') == 'X*** 010-****-5678'
+
+    def test_fingerprint_changes_with_rules(self):
+        assert rule_set('rrn').fingerprint() != rule_set('rrn', 'phone').fingerprint()
+        assert rule_set('rrn').fingerprint() == rule_set('rrn').fingerprint()
+
+
+class TestBuildRuleSet:
+    def test_unknown_rule(self):
+        with pytest.raises(ValueError):
+            build_rule_set('rrn,nope')
+
+    def test_rules_file_adds_and_replaces(self, tmp_path):
+        path = tmp_path / 'rules.json'
+        path.write_text(json.dumps([
+            {'name': 'chart_id', 'pattern': r'\bC\d{8}\b', 'first_chars': 'C',
+             'masker': {'type': 'digits', 'keep_tail': 2}},
+            {'name': 'employee', 'pattern': r'\bE\d{4}\b', 'enabled': False},
+        ]), encoding='utf-8')
+        rules = build_rule_set('rrn', str(path))
+        assert rules.names == ['rrn', 'chart_id']
+        assert rules.mask('C12345678') == 'C******78'
+
+    def test_rules_file_unknown_masker(self, tmp_path):
+        path = tmp_path / 'rules.json'
+        path.write_text(json.dumps([{'name': 'x', 'pattern': 'x', 'masker': 'nope'}]), encoding='utf-8')
+        with pytest.raises(ValueError):
+            build_rule_set('', str(path))
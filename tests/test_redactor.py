@@ -0,0 +1,106 @@
+"""가림 처리 테스트 (확장자 없는 스풀 파일 열기, 이미지 원본 가림 영역, 텍스트 레이어 위치, PDF 묶음 출력)"""
+import io
+
+import fitz
+import pytest
+from PIL import Image
+
+from app.config.settings import settings
+from app.core.redactor import PDF_FLUSH_PAGES, document_filetype, iter_redacted, open_document, parse_render_mode
+
+
+@pytest.mark.parametrize('filename, expected', [
+    ('scan.PDF', 'pdf'),
+    ('scan.png', 'png'),
+    ('photo.jpg', 'jpeg'),
+    ('photo.JPEG', 'jpeg'),
+    ('notes.txt', None),
+    (None, None),
+])
+def test_document_filetype(filename, expected):
+    assert document_filetype(filename) == expected
+
+
+@pytest.mark.parametrize('image_format, filetype', [('PNG', 'png'), ('JPEG', 'jpeg')])
+def test_open_extensionless_image_upload(tmp_path, image_format, filetype):
+    # 업로드 스풀 파일은 확장자가 없음 (upload-XXXX)
+    path = tmp_path / 'upload-abc'
+    Image.new('RGB', (400, 200), 'white').save(path, image_format)
+    doc = open_document(str(path), 'image/png', filetype)
+    assert doc.is_pdf and doc.page_count == 1
+    doc.close()
+
+
+def test_image_redaction_covers_sensitive_bbox(tmp_path):
+    path = tmp_path / 'upload-abc'
+    Image.new('RGB', (400, 200), 'white').save(path, 'JPEG')
+    pages = [{
+        'page_index': 0, 'width': 400, 'height': 200,
+        'items': [{'text': '010-1234-5678', 'bbox': {'x': 100, 'y': 50, 'w': 200, 'h': 100},
+                   'is_sensitive': True, 'masked_text': '010-****-5678'}],
+    }]
+    output = b''.join(iter_redacted(str(path), 'image/png', pages, 'pdf', 'embedded', 'jpeg'))
+    doc = fitz.open('pdf', output)
+    page = doc[0]
+    pix = page.get_pixmap(matrix=fitz.Matrix(400 / page.rect.width, 400 / page.rect.width))
+    image = Image.open(io.BytesIO(pix.tobytes('png'))).convert('L')
+    assert image.getpixel((200, 100)) < 20
+    assert image.getpixel((20, 20)) > 235
+
+
+def _text_item(text, is_sensitive):
+    # 텍스트 레이어 아이템은 좌표 없이 저장됨
+    return {'text': text, 'bbox': {'x': 0, 'y': 0, 'w': 0, 'h': 0}, 'is_sensitive': is_sensitive}
+
+
+def test_text_layer_redaction_covers_only_matched_occurrence(tmp_path):
+    # 같은 번호가 두 번 있지만 민감 아이템은 두 번째 span (첫 번째는 예: 병원 대표번호로 판정)
+    path = tmp_path / 'upload-abc'
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), '010-1234-5678')
+    page.insert_text((72, 144), '010-1234-5678')
+    doc.save(path)
+    pages = [{
+        'page_index': 0, 'width': 0, 'height': 0,
+        'items': [_text_item('010-1234-5678', False), _text_item('010-1234-5678', True)],
+    }]
+    output = b''.join(iter_redacted(str(path), 'application/pdf', pages, 'pdf', 'embedded', 'pdf'))
+    redacted = fitz.open('pdf', output)
+    hits = redacted[0].search_for('010-1234-5678')
+    assert len(hits) == 1
+    assert hits[0].y1 < 100
+
+
+def test_pdf_output_streams_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'temp_dir', str(tmp_path / 'tmp'))
+    page_count = PDF_FLUSH_PAGES * 3 + 5
+    path = tmp_path / 'upload-abc'
+    doc = fitz.open()
+    for page_index in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), f'{page_index}쪽 환자 연락처')
+        page.insert_text((72, 144), '010-1234-5678')
+    doc.set_toc([[1, '처음', 1], [1, '마지막', page_count]])
+    doc.save(path)
+    pages = [
+        {'page_index': page_index, 'width': 0, 'height': 0,
+         'items': [_text_item('010-1234-5678', True)]}
+        for page_index in range(page_count)
+    ]
+
+    chunks = list(iter_redacted(str(path), 'application/pdf', pages, 'pdf', 'embedded', 'pdf'))
+
+    # 묶음마다 증분 저장한 바이트가 이어 붙어 온전한 PDF가 됨
+    assert len(chunks) > 1
+    output = fitz.open('pdf', b''.join(chunks))
+    assert output.page_count == page_count
+    assert all(not page.search_for('010-1234-5678') for page in output)
+    assert output[page_count - 1].search_for(f'{page_count - 1}')
+    assert output.get_toc() == [[1, '처음', 1], [1, '마지막', page_count]]
+    assert not list((tmp_path / 'tmp').iterdir())
+
+
+def test_parse_render_mode():
+    assert parse_render_mode('0.1.0:dpi300:scanned:max4096:draft1:pii2.abcd1234') == 'scanned'
+    assert parse_render_mode('0.1.0:dpi300:embedded:max4096') == 'embedded'
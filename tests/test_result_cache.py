@@ -0,0 +1,73 @@
+"""결과 본문 캐시/ETag 테스트"""
+from datetime import datetime
+from uuid import uuid4
+
+from app.core.result_cache import ResultBodyCache, etag_matches, make_etag
+
+
+class TestETag:
+    def test_depends_on_completion_time(self):
+        job_id = uuid4()
+        first = make_etag(job_id, datetime(2026, 10, 1, 12, 0, 0))
+        assert first == make_etag(job_id, datetime(2026, 10, 1, 12, 0, 0))
+        assert first != make_etag(job_id, datetime(2026, 10, 1, 12, 0, 1))
+        assert first != make_etag(uuid4(), datetime(2026, 10, 1, 12, 0, 0))
+        assert first.startswith('"') and first.endswith('"')
+
+    def test_if_none_match(self):
+        etag = make_etag(uuid4(), None)
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches('*', etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+class TestResultBodyCache:
+    def test_get_put_invalidate(self):
+        cache = ResultBodyCache(max_bytes=100)
+        job_id = uuid4()
+        assert cache.get(job_id) is None
+        cache.put(job_id, '"e"', b'body')
+        assert cache.get(job_id) == ('"e"', b'body')
+        cache.invalidate(job_id)
+        assert cache.get(job_id) is None
+        assert cache.stats() == {'hits': 1, 'misses': 2, 'entries': 0, 'bytes': 0}
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = ResultBodyCache(max_bytes=10)
+        a, b, c = uuid4(), uuid4(), uuid4()
+        cache.put(a, '"a"', b'aaaa')
+        cache.put(b, '"b"', b'bbbb')
+        cache.get(a)
+        cache.put(c, '"c"', b'cccc')
+        assert cache.get(b) is None
+        assert cache.get(a) is not None and cache.get(c) is not None
+        assert cache.stats()['bytes'] == 8
+
+    def test_oversized_body_is_not_stored(self):
+        cache = ResultBodyCache(max_bytes=3)
+        job_id = uuid4()
+        cache.put(job_id, '"e"', b'toolong')
+        assert cache.get(job_id) is None
+        assert ResultBodyCache(max_bytes=0).stats()['entries'] == 0
+
+    def test_replacing_entry_keeps_byte_count(self):
+        cache = ResultBodyCache(max_bytes=100)
+        job_id = uuid4()
+        cache.put(job_id, '"1"', b'12345')
+        cache.put(job_id, '"2"', b'12')
+        assert cache.get(job_id) == ('"2"', b'12')
+        assert cache.stats()['bytes'] == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr('app.core.result_cache.time.monotonic', lambda: now[0])
+        cache = ResultBodyCache(max_bytes=100, ttl=5)
+        job_id = uuid4()
+        cache.put(job_id, '"e"', b'x')
+        now[0] += 4
+        assert cache.get(job_id) is not None
+        now[0] += 2
+        assert cache.get(job_id) is None
+        assert cache.stats()['bytes'] == 0
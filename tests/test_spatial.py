@@ -0,0 +1,121 @@
+"""공간 색인 테스트 (격자 조회 결과 = 전수 비교 결과)"""
+import random
+
+from app.core.spatial import SpatialIndex, is_degenerate_bbox
+
+
+def box_item(x, y, w, h):
+    return {'text': 'x', 'bbox': {'x': x, 'y': y, 'w': w, 'h': h}}
+
+
+def brute_right_of(items, idx, max_gap=None):
+    b = items[idx]['bbox']
+    x1, y0, y1 = b['x'] + b['w'], b['y'], b['y'] + b['h']
+    best, best_gap = None, None
+    for other, item in enumerate(items):
+        o = item['bbox']
+        if other == idx or is_degenerate_bbox(o):
+            continue
+        if o['x'] + o['w'] / 2 <= x1:
+            continue
+        overlap = min(y1, o['y'] + o['h']) - max(y0, o['y'])
+        if overlap < min(b['h'], o['h']) / 2:
+            continue
+        gap = max(o['x'] - x1, 0)
+        if max_gap is not None and gap > max_gap:
+            continue
+        if best_gap is None or gap < best_gap:
+            best, best_gap = other, gap
+    return best
+
+
+def brute_below(items, idx, max_gap=None):
+    b = items[idx]['bbox']
+    x0, x1, y1 = b['x'], b['x'] + b['w'], b['y'] + b['h']
+    best, best_gap = None, None
+    for other, item in enumerate(items):
+        o = item['bbox']
+        if other == idx or is_degenerate_bbox(o):
+            continue
+        if o['y'] + o['h'] / 2 <= y1:
+            continue
+        if min(x1, o['x'] + o['w']) - max(x0, o['x']) <= 0:
+            continue
+        gap = max(o['y'] - y1, 0)
+        if max_gap is not None and gap > max_gap:
+            continue
+        if best_gap is None or gap < best_gap:
+            best, best_gap = other, gap
+    return best
+
+
+def test_degenerate_bbox():
+    assert is_degenerate_bbox(None)
+    assert is_degenerate_bbox({'x': 0, 'y': 0, 'w': 0, 'h': 0})
+    assert is_degenerate_bbox({'x': 5, 'y': 5, 'w': 1, 'h': 1})
+    assert not is_degenerate_bbox({'x': 0, 'y': 0, 'w': 2, 'h': 2})
+
+
+def test_degenerate_items_are_not_indexed():
+    items = [box_item(0, 0, 40, 20), box_item(0, 0, 1, 1), box_item(60, 0, 40, 20)]
+    index = SpatialIndex(items)
+    assert not index.has_box(1)
+    assert index.right_of(0) == 2
+    assert index.right_of(1) is None
+
+
+def right_gap(items, idx, other):
+    if other is None:
+        return None
+    b, o = items[idx]['bbox'], items[other]['bbox']
+    return max(o['x'] - (b['x'] + b['w']), 0)
+
+
+def below_gap(items, idx, other):
+    if other is None:
+        return None
+    b, o = items[idx]['bbox'], items[other]['bbox']
+    return max(o['y'] - (b['y'] + b['h']), 0)
+
+
+def test_matches_brute_force_on_random_layout():
+    rng = random.Random(7)
+    items = [
+        box_item(rng.randrange(0, 1000), rng.randrange(0, 1400), rng.randrange(10, 200), rng.randrange(12, 30))
+        for _ in range(300)
+    ]
+    index = SpatialIndex(items)
+    for idx in range(len(items)):
+        # 간격이 같은 후보끼리는 어느 쪽이든 허용하므로 인덱스 대신 간격 비교
+        assert right_gap(items, idx, index.right_of(idx)) == right_gap(items, idx, brute_right_of(items, idx))
+        assert below_gap(items, idx, index.below(idx, max_gap=40)) == below_gap(
+            items, idx, brute_below(items, idx, max_gap=40)
+        )
+
+
+def test_form_layout():
+    # 2열 양식: 라벨 | 값, 줄 간격 30
+    items = []
+    for row in range(10):
+        items.append(box_item(10, row * 30, 60, 20))
+        items.append(box_item(100, row * 30, 80, 20))
+    index = SpatialIndex(items)
+    for row in range(10):
+        assert index.right_of(row * 2) == row * 2 + 1
+        assert index.right_of(row * 2, max_gap=10) is None
+        expected_below = (row + 1) * 2 if row < 9 else None
+        assert index.below(row * 2) == expected_below
+
+
+def test_dense_page_finds_neighbor_past_many_registrations():
+    # 라벨 칸에 겹친 작은 아이템 100개와 여러 칸에 걸친 넓은 아이템(칸마다 등록)이 먼저 검사되어도
+    # 오른쪽 값과 아래 값을 찾아야 함
+    label = box_item(0, 100, 40, 20)
+    clutter = [box_item(i % 20, 100, 10, 20) for i in range(100)]
+    wide_above = [box_item(0, 70, 400, 12) for _ in range(10)]
+    value = box_item(300, 100, 60, 20)
+    below = box_item(0, 130, 40, 20)
+    items = [label, *clutter, *wide_above, value, below]
+    index = SpatialIndex(items)
+    assert index.right_of(0) == len(items) - 2
+    assert index.below(0) == len(items) - 1